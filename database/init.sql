@@ -23,22 +23,161 @@ INSERT INTO todo_priorities (value) VALUES ('low') ON CONFLICT DO NOTHING;
 INSERT INTO todo_priorities (value) VALUES ('medium') ON CONFLICT DO NOTHING;
 INSERT INTO todo_priorities (value) VALUES ('high') ON CONFLICT DO NOTHING;
 
+-- Time-ordered UUIDs (version 7): the Unix time in milliseconds followed by random
+-- bits, so new rows land on the right edge of the primary key index. PostgreSQL 18
+-- ships uuidv7(); this version only needs gen_random_uuid() (PostgreSQL 13+).
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid;
+$$ LANGUAGE sql VOLATILE;
+
 -- TODO Table
 CREATE TABLE IF NOT EXISTS todos (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v7(),
     title VARCHAR(200) NOT NULL,
     description TEXT,
     status_id INTEGER,
     priority_id INTEGER,
+    priority_rank SMALLINT NOT NULL DEFAULT 2,
     due_date TIMESTAMPTZ,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    deleted_at TIMESTAMPTZ,
+    completed_at TIMESTAMPTZ,
+    archived BOOLEAN NOT NULL DEFAULT FALSE,
     FOREIGN KEY (status_id) REFERENCES todo_statuses(id),
     FOREIGN KEY (priority_id) REFERENCES todo_priorities(id)
 );
 
--- Index for better query performance
-CREATE INDEX IF NOT EXISTS idx_todos_status_id ON todos(status_id);
-CREATE INDEX IF NOT EXISTS idx_todos_priority_id ON todos(priority_id);
-CREATE INDEX IF NOT EXISTS idx_todos_due_date ON todos(due_date);
-CREATE INDEX IF NOT EXISTS idx_todos_created_at ON todos(created_at);
+-- Stored priority rank (low=1, medium=2, high=3) for databases created before it existed
+ALTER TABLE todos ADD COLUMN IF NOT EXISTS priority_rank SMALLINT NOT NULL DEFAULT 2;
+UPDATE todos SET priority_rank = CASE todo_priorities.value WHEN 'low' THEN 1 WHEN 'high' THEN 3 ELSE 2 END
+FROM todo_priorities
+WHERE todo_priorities.id = todos.priority_id
+  AND todos.priority_rank <> CASE todo_priorities.value WHEN 'low' THEN 1 WHEN 'high' THEN 3 ELSE 2 END;
+
+-- Completion time for the daily rollups (approximated by updated_at on older databases)
+ALTER TABLE todos ADD COLUMN IF NOT EXISTS completed_at TIMESTAMPTZ;
+UPDATE todos SET completed_at = updated_at
+FROM todo_statuses
+WHERE todo_statuses.id = todos.status_id AND todo_statuses.value = 'completed' AND todos.completed_at IS NULL;
+
+-- Soft delete marker for databases created before it existed
+ALTER TABLE todos ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMPTZ;
+
+-- Archive flag (archiver job) for databases created before it existed
+ALTER TABLE todos ADD COLUMN IF NOT EXISTS archived BOOLEAN NOT NULL DEFAULT FALSE;
+
+-- Index for better query performance (partial: only hot rows, not soft-deleted or archived)
+CREATE INDEX IF NOT EXISTS idx_todos_status_created_at_id ON todos(status_id, created_at, id) WHERE deleted_at IS NULL AND archived = false;
+DROP INDEX IF EXISTS idx_todos_status_id;
+CREATE INDEX IF NOT EXISTS idx_todos_priority_id ON todos(priority_id) WHERE deleted_at IS NULL AND archived = false;
+CREATE INDEX IF NOT EXISTS idx_todos_due_date ON todos(due_date) WHERE deleted_at IS NULL AND archived = false;
+CREATE INDEX IF NOT EXISTS idx_todos_created_at_id ON todos(created_at, id) WHERE deleted_at IS NULL AND archived = false;
+DROP INDEX IF EXISTS idx_todos_created_at;
+
+-- Sorted listings (sort=): keyset order of each ordering, read forwards or backwards
+CREATE INDEX IF NOT EXISTS idx_todos_priority_rank_created_at_id ON todos(priority_rank, created_at, id) WHERE deleted_at IS NULL AND archived = false;
+CREATE INDEX IF NOT EXISTS idx_todos_due_date_sort_id ON todos((COALESCE(due_date, 'infinity'::timestamptz)), id) WHERE deleted_at IS NULL AND archived = false;
+CREATE INDEX IF NOT EXISTS idx_todos_hot_updated_at_id ON todos(updated_at, id) WHERE deleted_at IS NULL AND archived = false;
+
+-- Archive: opt-in listing (include_archived=true)
+CREATE INDEX IF NOT EXISTS idx_todos_archived_created_at ON todos(created_at, id) WHERE deleted_at IS NULL AND archived = true;
+
+-- Soft delete: rows waiting for the background purge
+CREATE INDEX IF NOT EXISTS idx_todos_deleted_at ON todos(deleted_at) WHERE deleted_at IS NOT NULL;
+
+-- Delta sync: keyset por (updated_at, id) e tombstones de TODOs removidos
+CREATE INDEX IF NOT EXISTS idx_todos_updated_at_id ON todos(updated_at, id);
+
+CREATE TABLE IF NOT EXISTS todo_tombstones (
+    id UUID PRIMARY KEY,
+    deleted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_todo_tombstones_deleted_at_id ON todo_tombstones(deleted_at, id);
+
+-- Stats rollups (/todos/stats/rollup), refreshed by the API when ROLLUP_ENABLED
+CREATE INDEX IF NOT EXISTS idx_todos_completed_at ON todos(completed_at) WHERE completed_at IS NOT NULL;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS todo_stats_breakdown AS
+SELECT todo_statuses.value AS status, todo_priorities.value AS priority,
+       count(*) AS total,
+       count(*) FILTER (WHERE todos.due_date < now() AND todo_statuses.value <> 'completed') AS overdue
+FROM todos
+JOIN todo_statuses ON todo_statuses.id = todos.status_id
+JOIN todo_priorities ON todo_priorities.id = todos.priority_id
+WHERE todos.deleted_at IS NULL AND todos.archived = false
+GROUP BY todo_statuses.value, todo_priorities.value;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_todo_stats_breakdown ON todo_stats_breakdown(status, priority);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS todo_daily_stats AS
+SELECT days.day, coalesce(created.total, 0) AS created, coalesce(completed.total, 0) AS completed
+FROM (
+    SELECT generate_series((now() AT TIME ZONE 'UTC')::date - 89, (now() AT TIME ZONE 'UTC')::date, interval '1 day')::date AS day
+) AS days
+LEFT JOIN (
+    SELECT (created_at AT TIME ZONE 'UTC')::date AS day, count(*) AS total
+    FROM todos WHERE deleted_at IS NULL AND created_at >= (now() AT TIME ZONE 'UTC')::date - 89
+    GROUP BY 1
+) AS created USING (day)
+LEFT JOIN (
+    SELECT (completed_at AT TIME ZONE 'UTC')::date AS day, count(*) AS total
+    FROM todos WHERE deleted_at IS NULL AND completed_at >= (now() AT TIME ZONE 'UTC')::date - 89
+    GROUP BY 1
+) AS completed USING (day);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_todo_daily_stats ON todo_daily_stats(day);
+
+CREATE TABLE IF NOT EXISTS todo_rollup_state (
+    id SMALLINT PRIMARY KEY,
+    refreshed_at TIMESTAMPTZ NOT NULL
+);
+
+INSERT INTO todo_rollup_state (id, refreshed_at) VALUES (1, now()) ON CONFLICT (id) DO NOTHING;
+
+-- Change history (HISTORY_ENABLED): outbox written with each change, moved in batches to todo_history
+CREATE TABLE IF NOT EXISTS todo_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    todo_id UUID NOT NULL,
+    operation VARCHAR(10) NOT NULL,
+    before JSONB,
+    after JSONB,
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS todo_history (
+    id BIGINT PRIMARY KEY,
+    todo_id UUID NOT NULL,
+    operation VARCHAR(10) NOT NULL,
+    before JSONB,
+    after JSONB,
+    changed_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_todo_history_todo_id_id ON todo_history(todo_id, id);
+
+-- Idempotency-Key (IDEMPOTENCY_ENABLED): stored responses, NULL status_code while in progress
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    key VARCHAR(255) PRIMARY KEY,
+    fingerprint VARCHAR(64) NOT NULL,
+    status_code SMALLINT,
+    headers JSONB,
+    body BYTEA,
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_idempotency_keys_expires_at ON idempotency_keys(expires_at);
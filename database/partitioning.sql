@@ -0,0 +1,70 @@
+-- Optional layout: split todos into hot (todos_active) and archived (todos_archive)
+-- partitions by LIST (archived). Run once against a database created by init.sql
+-- (one created by an older init.sql needs database/uuid7.sql first):
+--   psql "$DATABASE_URL" -f database/partitioning.sql
+-- Queries with archived = false are pruned to todos_active, and the archiver's
+-- UPDATE ... SET archived = true moves each row to todos_archive.
+--
+-- Trade-off: a primary key on a partitioned table must include the partition key,
+-- so it is (id, archived) and id alone is only unique inside each partition.
+-- The app never creates a duplicate: ids are UUIDv7 (uuid7() in the app,
+-- uuid_generate_v7() as default), rows reach todos_archive only by moving with
+-- UPDATE, and reopening one moves it back (each partition's key rejects a clash).
+-- The one unchecked case is an INSERT reusing the id of an archived row, so no
+-- foreign key can reference todos(id) and no upsert can use ON CONFLICT (id).
+-- To check an existing database:
+--   SELECT id FROM todos GROUP BY id HAVING count(*) > 1;
+
+BEGIN;
+
+-- The stats rollups read todos; the API recreates them on startup (ROLLUP_ENABLED)
+DROP MATERIALIZED VIEW IF EXISTS todo_stats_breakdown;
+DROP MATERIALIZED VIEW IF EXISTS todo_daily_stats;
+
+ALTER TABLE todos RENAME TO todos_unpartitioned;
+
+CREATE TABLE todos (
+    id UUID NOT NULL DEFAULT uuid_generate_v7(),
+    title VARCHAR(200) NOT NULL,
+    description TEXT,
+    status_id INTEGER,
+    priority_id INTEGER,
+    priority_rank SMALLINT NOT NULL DEFAULT 2,
+    due_date TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    deleted_at TIMESTAMPTZ,
+    completed_at TIMESTAMPTZ,
+    archived BOOLEAN NOT NULL DEFAULT FALSE,
+    PRIMARY KEY (id, archived),
+    FOREIGN KEY (status_id) REFERENCES todo_statuses(id),
+    FOREIGN KEY (priority_id) REFERENCES todo_priorities(id)
+) PARTITION BY LIST (archived);
+
+CREATE TABLE todos_active PARTITION OF todos FOR VALUES IN (false);
+CREATE TABLE todos_archive PARTITION OF todos FOR VALUES IN (true);
+
+INSERT INTO todos (id, title, description, status_id, priority_id, priority_rank, due_date, created_at, updated_at, deleted_at, completed_at, archived)
+SELECT id, title, description, status_id, priority_id, priority_rank, due_date, created_at, updated_at, deleted_at, completed_at, archived
+FROM todos_unpartitioned;
+
+DROP TABLE todos_unpartitioned;
+
+-- Hot partition: the indexes used by get_all, get_board, count and the status filters
+CREATE INDEX idx_todos_status_created_at_id ON todos_active(status_id, created_at, id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_todos_priority_id ON todos_active(priority_id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_todos_due_date ON todos_active(due_date) WHERE deleted_at IS NULL;
+CREATE INDEX idx_todos_created_at_id ON todos_active(created_at, id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_todos_priority_rank_created_at_id ON todos_active(priority_rank, created_at, id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_todos_due_date_sort_id ON todos_active((COALESCE(due_date, 'infinity'::timestamptz)), id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_todos_hot_updated_at_id ON todos_active(updated_at, id) WHERE deleted_at IS NULL;
+
+-- Archive partition: only what the opt-in listing needs
+CREATE INDEX idx_todos_archived_created_at ON todos_archive(created_at, id) WHERE deleted_at IS NULL;
+
+-- Both partitions (by-id lookups use the (id, archived) primary key): purge and delta sync
+CREATE INDEX idx_todos_deleted_at ON todos(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX idx_todos_updated_at_id ON todos(updated_at, id);
+CREATE INDEX idx_todos_completed_at ON todos(completed_at) WHERE completed_at IS NOT NULL;
+
+COMMIT;
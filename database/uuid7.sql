@@ -0,0 +1,27 @@
+-- Switch the todos primary key default to time-ordered UUIDs (version 7) on a
+-- database created by an earlier init.sql. Run once:
+--   psql "$DATABASE_URL" -f database/uuid7.sql
+-- Existing uuid4 ids stay valid; only new rows get uuid7 ids.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid;
+$$ LANGUAGE sql VOLATILE;
+
+ALTER TABLE todos ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+
+COMMIT;
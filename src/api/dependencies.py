@@ -0,0 +1,272 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app import (
+    TodoService,
+    TodoCreateBatcher,
+    SingleFlight,
+    TodoCache,
+    TodoEventBroadcaster,
+    TodoPurger,
+    TodoArchiver,
+    TodoRollupRefresher,
+    TodoHistoryRelay,
+    IdempotencyStore,
+    IdempotencyKeyPurger,
+)
+from src.infra import get_db_session, async_session, apply_statement_timeout
+from src.infra.cache import BaseCache, LRUCache, RedisCache
+from src.infra.change_bus import change_bus
+from src.infra.database.change_listener import PostgresChangeListener
+from src.infra.task_queue import TaskQueue
+from src.infra.settings import (
+    REPOSITORY_BACKEND,
+    CREATE_BATCH_ENABLED,
+    CREATE_BATCH_MAX_SIZE,
+    CREATE_BATCH_MAX_DELAY_MS,
+    SINGLE_FLIGHT_METHODS,
+    CACHE_BACKEND,
+    CACHE_TTL_SECONDS,
+    CACHE_MAX_ENTRIES,
+    REDIS_URL,
+    DATABASE_DIRECT_URL,
+    CHANGE_NOTIFICATIONS_ENABLED,
+    EVENT_STREAM_QUEUE_SIZE,
+    EVENT_STREAM_HEARTBEAT_SECONDS,
+    SYNC_SAFETY_LAG_MS,
+    TOMBSTONE_RETENTION_DAYS,
+    SOFT_DELETE_ENABLED,
+    PURGE_BATCH_SIZE,
+    PURGE_INTERVAL_SECONDS,
+    ARCHIVE_ENABLED,
+    ARCHIVE_AFTER_DAYS,
+    ARCHIVE_BATCH_SIZE,
+    ARCHIVE_INTERVAL_SECONDS,
+    ROUTE_DEADLINES_MS,
+    ROLLUP_ENABLED,
+    ROLLUP_REFRESH_INTERVAL_SECONDS,
+    TASK_QUEUE_ENABLED,
+    TASK_QUEUE_WORKERS,
+    TASK_QUEUE_MAX_SIZE,
+    TASK_QUEUE_MAX_ATTEMPTS,
+    TASK_QUEUE_RETRY_BACKOFF_MS,
+    HISTORY_ENABLED,
+    HISTORY_FLUSH_INTERVAL_MS,
+    HISTORY_BATCH_SIZE,
+    IDEMPOTENCY_ENABLED,
+    IDEMPOTENCY_TTL_SECONDS,
+    IDEMPOTENCY_LOCK_TIMEOUT_SECONDS,
+    IDEMPOTENCY_PURGE_INTERVAL_SECONDS,
+    IDEMPOTENCY_PURGE_BATCH_SIZE,
+)
+from src.repos import (
+    BaseTodoRepository,
+    TodoRepository,
+    InMemoryTodoRepository,
+    InMemoryTodoStore,
+    IdempotencyRepository,
+)
+from src.resources import TodoResource
+
+in_memory_store = InMemoryTodoStore()
+
+
+@asynccontextmanager
+async def todo_repository_scope() -> AsyncIterator[BaseTodoRepository]:
+    """Abre um repositório fora do ciclo de request (tarefas e batchers)"""
+    if REPOSITORY_BACKEND == "memory":
+        yield InMemoryTodoRepository(in_memory_store, change_bus)
+        return
+
+    async with async_session() as session:
+        yield TodoRepository(
+            session,
+            emit_notifications=CHANGE_NOTIFICATIONS_ENABLED,
+            soft_delete=SOFT_DELETE_ENABLED,
+            precomputed_rollups=ROLLUP_ENABLED,
+            history_enabled=HISTORY_ENABLED,
+        )
+
+
+create_batcher = (
+    TodoCreateBatcher(
+        todo_repository_scope,
+        max_batch_size=CREATE_BATCH_MAX_SIZE,
+        max_delay_ms=CREATE_BATCH_MAX_DELAY_MS,
+    )
+    if CREATE_BATCH_ENABLED
+    else None
+)
+
+single_flight = SingleFlight(SINGLE_FLIGHT_METHODS)
+
+
+def build_cache_backend() -> Optional[BaseCache]:
+    """Cria o backend de cache configurado em CACHE_BACKEND"""
+    if CACHE_BACKEND == "memory":
+        return LRUCache(max_entries=CACHE_MAX_ENTRIES)
+    if CACHE_BACKEND == "redis":
+        return RedisCache(REDIS_URL)
+    return None
+
+
+todo_cache = TodoCache(build_cache_backend(), ttl=CACHE_TTL_SECONDS)
+change_bus.subscribe(todo_cache.handle_change)
+
+# No modo sql as mudanças só chegam pelo LISTEN; sem ele o stream fica desligado
+event_broadcaster = (
+    TodoEventBroadcaster(
+        change_bus,
+        max_queue_size=EVENT_STREAM_QUEUE_SIZE,
+        heartbeat_seconds=EVENT_STREAM_HEARTBEAT_SECONDS,
+    )
+    if REPOSITORY_BACKEND == "memory" or CHANGE_NOTIFICATIONS_ENABLED
+    else None
+)
+
+change_listener = (
+    PostgresChangeListener(DATABASE_DIRECT_URL, change_bus)
+    if CHANGE_NOTIFICATIONS_ENABLED and REPOSITORY_BACKEND == "sql"
+    else None
+)
+
+# Roda em qualquer modo: DELETE sem soft delete também gera tombstones
+todo_purger = TodoPurger(
+    todo_repository_scope,
+    tombstone_retention_days=TOMBSTONE_RETENTION_DAYS,
+    batch_size=PURGE_BATCH_SIZE,
+    interval_seconds=PURGE_INTERVAL_SECONDS,
+)
+
+todo_archiver = (
+    TodoArchiver(
+        todo_repository_scope,
+        archive_after_days=ARCHIVE_AFTER_DAYS,
+        batch_size=ARCHIVE_BATCH_SIZE,
+        interval_seconds=ARCHIVE_INTERVAL_SECONDS,
+    )
+    if ARCHIVE_ENABLED and REPOSITORY_BACKEND == "sql"
+    else None
+)
+
+todo_rollup_refresher = (
+    TodoRollupRefresher(
+        todo_repository_scope, interval_seconds=ROLLUP_REFRESH_INTERVAL_SECONDS
+    )
+    if ROLLUP_ENABLED and REPOSITORY_BACKEND == "sql"
+    else None
+)
+
+todo_history_relay = (
+    TodoHistoryRelay(
+        todo_repository_scope,
+        batch_size=HISTORY_BATCH_SIZE,
+        interval_seconds=HISTORY_FLUSH_INTERVAL_MS / 1000,
+    )
+    if HISTORY_ENABLED and REPOSITORY_BACKEND == "sql"
+    else None
+)
+
+task_queue = (
+    TaskQueue(
+        workers=TASK_QUEUE_WORKERS,
+        max_size=TASK_QUEUE_MAX_SIZE,
+        max_attempts=TASK_QUEUE_MAX_ATTEMPTS,
+        backoff_seconds=TASK_QUEUE_RETRY_BACKOFF_MS / 1000,
+    )
+    if TASK_QUEUE_ENABLED
+    else None
+)
+
+
+@asynccontextmanager
+async def idempotency_repository_scope() -> AsyncIterator[IdempotencyRepository]:
+    """Abre o repositório de Idempotency-Keys fora do ciclo de request"""
+    async with async_session() as session:
+        yield IdempotencyRepository(session)
+
+
+idempotency_store = (
+    IdempotencyStore(
+        (
+            RedisCache(REDIS_URL)
+            if CACHE_BACKEND == "redis"
+            else LRUCache(max_entries=CACHE_MAX_ENTRIES)
+        ),
+        repository_scope=(
+            idempotency_repository_scope if REPOSITORY_BACKEND == "sql" else None
+        ),
+        ttl_seconds=IDEMPOTENCY_TTL_SECONDS,
+        lock_timeout_seconds=IDEMPOTENCY_LOCK_TIMEOUT_SECONDS,
+    )
+    if IDEMPOTENCY_ENABLED
+    else None
+)
+
+idempotency_key_purger = (
+    IdempotencyKeyPurger(
+        idempotency_repository_scope,
+        batch_size=IDEMPOTENCY_PURGE_BATCH_SIZE,
+        interval_seconds=IDEMPOTENCY_PURGE_INTERVAL_SECONDS,
+    )
+    if IDEMPOTENCY_ENABLED and REPOSITORY_BACKEND == "sql"
+    else None
+)
+
+
+def get_route_deadline_ms(request: Request) -> Optional[int]:
+    """Deadline configurado para o endpoint do request, se houver"""
+    endpoint = request.scope.get("endpoint")
+    return ROUTE_DEADLINES_MS.get(getattr(endpoint, "__name__", None))
+
+
+def get_sql_todo_repository(
+    session: AsyncSession = Depends(get_db_session),
+    deadline_ms: Optional[int] = Depends(get_route_deadline_ms),
+) -> BaseTodoRepository:
+    """Dependency para obter o repositório PostgreSQL"""
+    apply_statement_timeout(session, deadline_ms)
+    return TodoRepository(
+        session,
+        emit_notifications=CHANGE_NOTIFICATIONS_ENABLED,
+        soft_delete=SOFT_DELETE_ENABLED,
+        precomputed_rollups=ROLLUP_ENABLED,
+        history_enabled=HISTORY_ENABLED,
+    )
+
+
+def get_in_memory_todo_repository() -> BaseTodoRepository:
+    """Dependency para obter o repositório em memória do processo"""
+    return InMemoryTodoRepository(in_memory_store, change_bus)
+
+
+get_todo_repository = (
+    get_in_memory_todo_repository
+    if REPOSITORY_BACKEND == "memory"
+    else get_sql_todo_repository
+)
+
+
+def get_todo_service(
+    repository: BaseTodoRepository = Depends(get_todo_repository),
+) -> TodoService:
+    """Dependency para obter instância do TodoService"""
+    return TodoService(
+        repository,
+        create_batcher=create_batcher,
+        single_flight=single_flight,
+        cache=todo_cache,
+        sync_safety_lag_ms=SYNC_SAFETY_LAG_MS,
+        task_queue=task_queue,
+        tombstone_retention_days=TOMBSTONE_RETENTION_DAYS,
+    )
+
+
+def get_todo_resource(
+    todo_service: TodoService = Depends(get_todo_service),
+) -> TodoResource:
+    """Dependency para obter instância do TodoResource"""
+    return TodoResource(todo_service, event_broadcaster=event_broadcaster)
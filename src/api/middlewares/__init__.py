@@ -0,0 +1,6 @@
+from .admission_middleware import AdmissionMiddleware, route_priority
+from .compression_middleware import CompressionMiddleware
+from .disconnect_middleware import DisconnectCancelMiddleware
+from .idempotency_middleware import IdempotencyMiddleware
+
+__all__ = ["AdmissionMiddleware", "route_priority", "CompressionMiddleware", "DisconnectCancelMiddleware", "IdempotencyMiddleware"]
@@ -0,0 +1,65 @@
+import re
+from typing import Callable, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infra.admission import AdmissionController, AdmissionRejected
+
+PRIORITY_HIGH = 0
+PRIORITY_LOW = 1
+
+TODO_BY_ID = re.compile(r"/todos/[0-9a-fA-F-]{36}$")
+
+RoutePriority = Callable[[str, str], Optional[int]]
+
+
+def route_priority(method: str, path: str) -> Optional[int]:
+    """Escritas e busca por ID antes de listagens; None dispensa a admissão"""
+    if not path.startswith("/api/") or path.endswith("/todos/events"):
+        return None
+    if method != "GET" or TODO_BY_ID.search(path):
+        return PRIORITY_HIGH
+    return PRIORITY_LOW
+
+
+class AdmissionMiddleware:
+    """Recusa com 503 + Retry-After o que não cabe na capacidade do pool"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: AdmissionController,
+        retry_after_seconds: int = 1,
+        priority: RoutePriority = route_priority,
+    ):
+        self.app = app
+        self.controller = controller
+        self.retry_after_seconds = retry_after_seconds
+        self.priority = priority
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        priority = self.priority(scope["method"], scope["path"])
+        if priority is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.controller.acquire(priority)
+        except AdmissionRejected:
+            response = JSONResponse(
+                {"detail": "Server overloaded, retry later"},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after_seconds)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
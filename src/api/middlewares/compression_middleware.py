@@ -0,0 +1,136 @@
+import time
+from typing import Dict, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infra.compression import (
+    Encoder,
+    available_encodings,
+    create_encoder,
+    negotiate_encoding,
+)
+from src.infra.metrics import MetricsRegistry, metrics as default_metrics
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript")
+
+
+class CompressionMiddleware:
+    """Comprime respostas com gzip/br/zstd negociado pelo Accept-Encoding"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Sequence[str] = ("zstd", "br", "gzip"),
+        minimum_size: int = 1024,
+        levels: Optional[Dict[str, int]] = None,
+        metrics: MetricsRegistry = default_metrics,
+    ):
+        self.app = app
+        self.encodings = available_encodings(encodings)
+        self.minimum_size = minimum_size
+        self.levels = levels or {}
+        self.metrics = metrics
+        metrics.register_gauge("compression.ratio", self.compression_ratio)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept_encoding, self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def compression_ratio(self) -> float:
+        """Bytes enviados / bytes originais, somando todas as codificações"""
+        bytes_in = sum(
+            self.metrics.get(f"compression.{e}.bytes_in") for e in self.encodings
+        )
+        bytes_out = sum(
+            self.metrics.get(f"compression.{e}.bytes_out") for e in self.encodings
+        )
+        return bytes_out / bytes_in if bytes_in else 0.0
+
+
+class CompressionResponder:
+    """Estado de uma resposta: decide no primeiro corpo e comprime por pedaço"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[Message] = None
+        self._encoder: Optional[Encoder] = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        """Segura o start até o primeiro corpo para poder trocar os headers"""
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._encoder is not None:
+            await self._send_body(self._compress(body, more_body), more_body)
+            return
+
+        if not self._should_compress(body, more_body):
+            self._passthrough = True
+            await self._send(self._start)
+            await self._send(message)
+            return
+
+        self._encoder = create_encoder(self.encoding, self.middleware.levels)
+        output = self._compress(body, more_body)
+        self._rewrite_headers(None if more_body else len(output))
+        await self._send(self._start)
+        await self._send_body(output, more_body)
+
+    async def _send_body(self, body: bytes, more_body: bool) -> None:
+        """Envia um pedaço já comprimido"""
+        await self._send(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
+
+    def _should_compress(self, body: bytes, more_body: bool) -> bool:
+        """Só tipos textuais sem codificação; corpos completos acima do mínimo"""
+        headers = Headers(raw=self._start["headers"])
+        if "content-encoding" in headers:
+            return False
+        if not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES):
+            return False
+        return more_body or len(body) >= self.middleware.minimum_size
+
+    def _rewrite_headers(self, content_length: Optional[int]) -> None:
+        """Ajusta os headers; streams seguem sem Content-Length (chunked)"""
+        headers = MutableHeaders(raw=self._start["headers"])
+        if "content-length" in headers:
+            del headers["content-length"]
+        if content_length is not None:
+            headers["Content-Length"] = str(content_length)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        self.middleware.metrics.increment(f"compression.{self.encoding}.responses")
+
+    def _compress(self, body: bytes, more_body: bool) -> bytes:
+        """Comprime o pedaço; em streaming faz flush para não atrasar o cliente"""
+        started = time.thread_time()
+        output = self._encoder.compress(body)
+        output += self._encoder.flush() if more_body else self._encoder.finish()
+
+        metrics, prefix = self.middleware.metrics, f"compression.{self.encoding}"
+        metrics.increment(f"{prefix}.cpu_seconds", time.thread_time() - started)
+        metrics.increment(f"{prefix}.bytes_in", len(body))
+        metrics.increment(f"{prefix}.bytes_out", len(output))
+        return output
@@ -0,0 +1,50 @@
+import asyncio
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infra.metrics import MetricsRegistry, metrics as default_metrics
+
+
+class DisconnectCancelMiddleware:
+    """Cancela o handler quando o cliente desconecta antes da resposta terminar"""
+
+    def __init__(self, app: ASGIApp, metrics: MetricsRegistry = default_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        messages: asyncio.Queue = asyncio.Queue()
+        response_complete = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_complete
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                response_complete = True
+            await send(message)
+
+        handler = asyncio.create_task(self.app(scope, messages.get, send_wrapper))
+
+        async def watch_disconnect() -> None:
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    if not response_complete and not handler.done():
+                        handler.cancel()
+                        self.metrics.increment("requests.cancelled_on_disconnect")
+                    return
+
+        watcher = asyncio.create_task(watch_disconnect())
+        try:
+            await handler
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise
+        finally:
+            watcher.cancel()
@@ -0,0 +1,186 @@
+import hashlib
+import logging
+from typing import Iterable, List, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.app import (
+    IdempotencyKeyInProgress,
+    IdempotencyKeyReused,
+    IdempotencyStore,
+    StoredResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_KEY_HEADER = b"idempotency-key"
+MAX_KEY_LENGTH = 255
+
+
+def request_fingerprint(scope: Scope, body: bytes) -> str:
+    """Hash de método, caminho, query e corpo: a mesma chave exige o mesmo request"""
+    digest = hashlib.sha256()
+    for part in (
+        scope["method"].encode(),
+        scope["path"].encode(),
+        scope.get("query_string", b""),
+        body,
+    ):
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class IdempotencyMiddleware:
+    """Com Idempotency-Key, reenvia a resposta guardada em vez de executar de novo"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: IdempotencyStore,
+        methods: Iterable[str] = ("POST", "PUT", "PATCH"),
+    ):
+        self.app = app
+        self.store = store
+        self.methods = frozenset(methods)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        key = self._idempotency_key(scope)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not key or len(key) > MAX_KEY_LENGTH:
+            response = JSONResponse(
+                {
+                    "detail": f"Idempotency-Key must have 1 to {MAX_KEY_LENGTH} characters"
+                },
+                status_code=400,
+            )
+            await response(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        fingerprint = request_fingerprint(scope, body)
+        try:
+            stored = await self.store.begin(key, fingerprint)
+        except IdempotencyKeyInProgress:
+            response = JSONResponse(
+                {"detail": "A request with this Idempotency-Key is still in progress"},
+                status_code=409,
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+        except IdempotencyKeyReused:
+            response = JSONResponse(
+                {"detail": "Idempotency-Key was already used with a different request"},
+                status_code=422,
+            )
+            await response(scope, receive, send)
+            return
+
+        if stored.completed:
+            await _replay(stored, send)
+            return
+
+        await self._execute(key, stored, scope, _replay_body(body, receive), send)
+
+    def _idempotency_key(self, scope: Scope) -> Optional[str]:
+        """Chave do request, se o método e o caminho participam da idempotência"""
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in self.methods
+            or not scope["path"].startswith("/api/")
+        ):
+            return None
+        for name, value in scope["headers"]:
+            if name == IDEMPOTENCY_KEY_HEADER:
+                return value.decode("latin-1").strip()
+        return None
+
+    async def _execute(
+        self,
+        key: str,
+        response: StoredResponse,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Executa o request e preenche a reserva; 5xx ou falha liberam a chave"""
+        chunks: List[bytes] = []
+        complete = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal complete
+            if message["type"] == "http.response.start":
+                response.status_code = message["status"]
+                response.headers = [
+                    (name.decode("latin-1"), value.decode("latin-1"))
+                    for name, value in message.get("headers", [])
+                ]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                complete = not message.get("more_body", False)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException:
+            await self.store.abandon(key, response)
+            raise
+
+        if not complete or response.status_code >= 500:
+            await self.store.abandon(key, response)
+            return
+
+        response.body = b"".join(chunks)
+        try:
+            await self.store.finish(key, response)
+        except Exception:
+            logger.warning("Failed to store idempotent response", exc_info=True)
+
+
+async def _read_body(receive: Receive) -> bytes:
+    """Lê o corpo inteiro do request"""
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """Entrega ao app o corpo já lido; depois repassa o receive original"""
+    consumed = False
+
+    async def wrapper() -> Message:
+        nonlocal consumed
+        if not consumed:
+            consumed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return wrapper
+
+
+async def _replay(stored: StoredResponse, send: Send) -> None:
+    """Reenvia status, headers e corpo guardados, marcando Idempotent-Replayed"""
+    headers = [
+        (name.encode("latin-1"), value.encode("latin-1"))
+        for name, value in stored.headers
+    ]
+    headers.append((b"idempotent-replayed", b"true"))
+    await send(
+        {
+            "type": "http.response.start",
+            "status": stored.status_code,
+            "headers": headers,
+        }
+    )
+    await send({"type": "http.response.body", "body": stored.body})
@@ -1,39 +1,31 @@
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
 
+from src.api.dependencies import get_todo_resource
 from src.resources import TodoResource
 from src.api.schemas import (
     TodoCreateRequest,
     TodoUpdateRequest,
+    TodoBatchGetRequest,
     TodoResponse,
     TodoListResponse,
+    TodoBatchGetResponse,
+    TodoBoardResponse,
+    TodoChangesResponse,
+    TodoHistoryResponse,
     TodoStatsResponse,
+    TodoRollupStatsResponse,
 )
-from src.app import TodoService
-from src.constants import TodoStatusEnum, TodoPriorityEnum
-from src.infra import get_db_session
-from src.repos import TodoRepository
+from src.constants import TodoStatusEnum, TodoPriorityEnum, TodoSortEnum
+from src.infra import DeadlineExceeded
 
 
 todo_router = APIRouter()
 
 
-def get_todo_service(session: AsyncSession = Depends(get_db_session)) -> TodoService:
-    """Dependency para obter instância do TodoService"""
-    repository = TodoRepository(session)
-    return TodoService(repository, session)
-
-
-def get_todo_resource(
-    todo_service: TodoService = Depends(get_todo_service),
-) -> TodoResource:
-    """Dependency para obter instância do TodoResource"""
-    return TodoResource(todo_service)
-
-
 @todo_router.post(
     "/todos",
     status_code=201,
@@ -49,6 +41,8 @@ async def create_todo(
         return await resource.create(todo_data)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except DeadlineExceeded:
+        raise HTTPException(status_code=504, detail="Deadline exceeded")
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -56,6 +50,7 @@ async def create_todo(
 @todo_router.get(
     "/todos",
     response_model=TodoListResponse,
+    response_model_exclude_unset=True,
     summary="Listar TODOs",
     description="Lista todos os TODOs com filtros opcionais",
 )
@@ -66,17 +61,91 @@ async def get_todos(
     ),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de itens"),
     offset: int = Query(0, ge=0, description="Número de itens a pular"),
+    include_archived: bool = Query(
+        False, description="Incluir TODOs completos arquivados"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Campos retornados, separados por vírgula (ex.: title,status)"
+    ),
+    sort: TodoSortEnum = Query(
+        TodoSortEnum.CREATED_AT_DESC,
+        description='Ordenação; "-" para decrescente (ex.: -priority = urgentes primeiro)',
+    ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor da página anterior (mesma ordenação)"
+    ),
     resource: TodoResource = Depends(get_todo_resource),
 ):
     """Lista TODOs com filtros opcionais"""
     try:
-        return await resource.list(status, priority, limit, offset)
+        return await resource.list(
+            status, priority, limit, offset, include_archived, fields, sort, cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except DeadlineExceeded:
+        raise HTTPException(status_code=504, detail="Deadline exceeded")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@todo_router.post(
+    "/todos/batch-get",
+    response_model=TodoBatchGetResponse,
+    response_model_exclude_unset=True,
+    summary="Obter vários TODOs por ID",
+    description="Busca até 5000 TODOs numa única consulta, na ordem dos IDs pedidos",
+)
+async def batch_get_todos(
+    request: TodoBatchGetRequest, resource: TodoResource = Depends(get_todo_resource)
+):
+    """Busca vários TODOs pelos IDs"""
+    try:
+        return await resource.batch_get(request)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except DeadlineExceeded:
+        raise HTTPException(status_code=504, detail="Deadline exceeded")
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@todo_router.get(
+    "/todos/board",
+    response_model=TodoBoardResponse,
+    response_model_exclude_unset=True,
+    summary="Quadro de TODOs por status",
+    description="Primeiros TODOs de cada status numa única consulta, com um cursor por coluna",
+)
+async def get_todo_board(
+    status: Optional[List[TodoStatusEnum]] = Query(
+        None, description="Colunas do quadro (padrão: todos os status)"
+    ),
+    limit: int = Query(
+        20, ge=1, le=100, description="Número máximo de itens por coluna"
+    ),
+    sort: TodoSortEnum = Query(
+        TodoSortEnum.CREATED_AT_DESC,
+        description='Ordenação de cada coluna; "-" para decrescente',
+    ),
+    cursor: Optional[List[str]] = Query(
+        None,
+        description="next_cursor (status:token) das colunas a avançar; um por coluna",
+    ),
+    counts: bool = Query(False, description="Incluir o total de cada coluna"),
+    resource: TodoResource = Depends(get_todo_resource),
+):
+    """Retorna o quadro de TODOs por status"""
+    try:
+        return await resource.board(status, limit, sort, cursor, counts)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except DeadlineExceeded:
+        raise HTTPException(status_code=504, detail="Deadline exceeded")
+    except Exception:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @todo_router.get(
     "/todos/stats",
     response_model=TodoStatsResponse,
@@ -87,23 +156,133 @@ async def get_todo_stats(resource: TodoResource = Depends(get_todo_resource)):
     """Retorna estatísticas dos TODOs"""
     try:
         return await resource.get_stats()
+    except DeadlineExceeded:
+        raise HTTPException(status_code=504, detail="Deadline exceeded")
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@todo_router.get(
+    "/todos/stats/rollup",
+    response_model=TodoRollupStatsResponse,
+    summary="Estatísticas detalhadas dos TODOs",
+    description=(
+        "Contagens por status x prioridade, atrasados e séries diárias de criados "
+        "e completados, lidas dos rollups pré-calculados (ver refreshed_at)"
+    ),
+)
+async def get_todo_rollup_stats(
+    days: int = Query(90, ge=1, le=90, description="Dias da série diária"),
+    resource: TodoResource = Depends(get_todo_resource),
+):
+    """Retorna as estatísticas detalhadas dos TODOs"""
+    try:
+        return await resource.get_rollup_stats(days)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except DeadlineExceeded:
+        raise HTTPException(status_code=504, detail="Deadline exceeded")
+    except Exception:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@todo_router.get(
+    "/todos/changes",
+    response_model=TodoChangesResponse,
+    summary="Mudanças dos TODOs",
+    description="Delta sync: TODOs alterados e removidos desde o token informado",
+)
+async def get_todo_changes(
+    since: Optional[str] = Query(
+        None, description="next_token da chamada anterior; vazio para sync completo"
+    ),
+    limit: int = Query(100, ge=1, le=1000, description="Número máximo de mudanças"),
+    resource: TodoResource = Depends(get_todo_resource),
+):
+    """Lista as mudanças dos TODOs desde o token"""
+    try:
+        return await resource.changes(since, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except DeadlineExceeded:
+        raise HTTPException(status_code=504, detail="Deadline exceeded")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@todo_router.get(
+    "/todos/events",
+    summary="Stream de mudanças dos TODOs",
+    description="Server-Sent Events de create/update/delete com filtros opcionais",
+    response_class=StreamingResponse,
+)
+async def stream_todo_events(
+    status: Optional[TodoStatusEnum] = Query(None, description="Filtrar por status"),
+    priority: Optional[TodoPriorityEnum] = Query(
+        None, description="Filtrar por prioridade"
+    ),
+    resource: TodoResource = Depends(get_todo_resource),
+):
+    """Mantém um stream SSE com as mudanças dos TODOs"""
+    if resource.event_broadcaster is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Event stream requires CHANGE_NOTIFICATIONS_ENABLED",
+        )
+    return StreamingResponse(
+        resource.stream_events(status, priority),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @todo_router.get(
     "/todos/{todo_id}",
     response_model=TodoResponse,
+    response_model_exclude_unset=True,
     summary="Obter TODO por ID",
     description="Busca um TODO específico pelo seu ID",
 )
-async def get_todo(todo_id: UUID, resource: TodoResource = Depends(get_todo_resource)):
+async def get_todo(
+    todo_id: UUID,
+    fields: Optional[str] = Query(
+        None, description="Campos retornados, separados por vírgula (ex.: title,status)"
+    ),
+    resource: TodoResource = Depends(get_todo_resource),
+):
     """Busca um TODO pelo ID"""
     try:
-        todo = await resource.get_by_id(todo_id)
-        if not todo:
-            raise HTTPException(status_code=404, detail="TODO not found")
-        return todo
+        todo = await resource.get_by_id(todo_id, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except DeadlineExceeded:
+        raise HTTPException(status_code=504, detail="Deadline exceeded")
+    except Exception:
+        raise HTTPException(status_code=500, detail="Internal server error")
+    if not todo:
+        raise HTTPException(status_code=404, detail="TODO not found")
+    return todo
+
+
+@todo_router.get(
+    "/todos/{todo_id}/history",
+    response_model=TodoHistoryResponse,
+    summary="Histórico do TODO",
+    description="Mudanças do TODO com antes/depois, da mais recente, paginadas por cursor",
+)
+async def get_todo_history(
+    todo_id: UUID,
+    limit: int = Query(50, ge=1, le=500, description="Número máximo de mudanças"),
+    cursor: Optional[int] = Query(None, description="next_cursor da página anterior"),
+    resource: TodoResource = Depends(get_todo_resource),
+):
+    """Lista o histórico de mudanças de um TODO"""
+    try:
+        return await resource.history(todo_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except DeadlineExceeded:
+        raise HTTPException(status_code=504, detail="Deadline exceeded")
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -124,6 +303,8 @@ async def update_todo(
         return await resource.update(todo_id, todo_data)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except DeadlineExceeded:
+        raise HTTPException(status_code=504, detail="Deadline exceeded")
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -140,9 +321,11 @@ async def delete_todo(
     """Deleta um TODO"""
     try:
         deleted = await resource.delete(todo_id)
-        if not deleted:
-            raise HTTPException(status_code=404, detail="TODO not found")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except DeadlineExceeded:
+        raise HTTPException(status_code=504, detail="Deadline exceeded")
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error")
+    if not deleted:
+        raise HTTPException(status_code=404, detail="TODO not found")
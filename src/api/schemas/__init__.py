@@ -1,3 +1,3 @@
-from .todo_schemas import TodoCreateRequest, TodoUpdateRequest, TodoStatusUpdateRequest, TodoResponse, TodoListResponse, TodoStatsResponse, ErrorResponse
+from .todo_schemas import TodoCreateRequest, TodoUpdateRequest, TodoStatusUpdateRequest, TodoBatchGetRequest, TodoResponse, TodoListResponse, TodoBatchGetResponse, TodoBoardColumn, TodoBoardResponse, TodoTombstoneResponse, TodoChangesResponse, TodoHistoryEntryResponse, TodoHistoryResponse, TodoStatsResponse, TodoStatusPriorityCount, TodoDailyCount, TodoRollupStatsResponse, ErrorResponse
 
-__all__ = ["TodoCreateRequest", "TodoUpdateRequest", "TodoStatusUpdateRequest", "TodoResponse", "TodoListResponse", "TodoStatsResponse", "ErrorResponse"]
+__all__ = ["TodoCreateRequest", "TodoUpdateRequest", "TodoStatusUpdateRequest", "TodoBatchGetRequest", "TodoResponse", "TodoListResponse", "TodoBatchGetResponse", "TodoBoardColumn", "TodoBoardResponse", "TodoTombstoneResponse", "TodoChangesResponse", "TodoHistoryEntryResponse", "TodoHistoryResponse", "TodoStatsResponse", "TodoStatusPriorityCount", "TodoDailyCount", "TodoRollupStatsResponse", "ErrorResponse"]
@@ -1,11 +1,13 @@
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Optional, Sequence
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 from src.constants import TodoStatusEnum, TodoPriorityEnum
 
+BATCH_GET_MAX_IDS = 5000
+
 
 # Schemas de entrada (Request)
 class TodoCreateRequest(BaseModel):
@@ -45,32 +47,45 @@ class TodoStatusUpdateRequest(BaseModel):
     status: TodoStatusEnum = Field(..., description="Novo status do TODO")
 
 
+class TodoBatchGetRequest(BaseModel):
+    """Schema para busca de vários TODOs por ID"""
+
+    ids: list[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=BATCH_GET_MAX_IDS,
+        description="IDs dos TODOs, na ordem desejada",
+    )
+    fields: Optional[str] = Field(
+        None, description="Campos retornados, separados por vírgula (ex.: title,status)"
+    )
+
+
 # Schemas de saída (Response)
 class TodoResponse(BaseModel):
-    """Schema de resposta para TODO"""
+    """Schema de resposta para TODO (com fields=, só os campos pedidos são enviados)"""
 
     id: UUID = Field(..., description="ID único do TODO")
-    title: str = Field(..., description="Título do TODO")
+    title: Optional[str] = Field(None, description="Título do TODO")
     description: Optional[str] = Field(None, description="Descrição do TODO")
-    status: Optional[str] = Field(..., description="Status atual do TODO")
-    priority: Optional[str] = Field(..., description="Prioridade do TODO")
+    status: Optional[str] = Field(None, description="Status atual do TODO")
+    priority: Optional[str] = Field(None, description="Prioridade do TODO")
     due_date: Optional[datetime] = Field(None, description="Data de vencimento do TODO")
-    created_at: datetime = Field(..., description="Data de criação do TODO")
-    updated_at: datetime = Field(..., description="Data da última atualização do TODO")
+    created_at: Optional[datetime] = Field(None, description="Data de criação do TODO")
+    updated_at: Optional[datetime] = Field(
+        None, description="Data da última atualização do TODO"
+    )
 
     @classmethod
-    def from_domain(cls, todo) -> "TodoResponse":
+    def from_domain(
+        cls, todo, fields: Optional[Sequence[str]] = None
+    ) -> "TodoResponse":
         """Cria um schema de resposta a partir de uma entidade de domínio"""
-        return cls(
-            id=todo.id,
-            title=todo.title,
-            description=todo.description,
-            status=todo.status.value if todo.status else None,
-            priority=todo.priority.value if todo.priority else None,
-            due_date=todo.due_date,
-            created_at=todo.created_at,
-            updated_at=todo.updated_at,
-        )
+        values = {name: getattr(todo, name) for name in fields or cls.model_fields}
+        for name in ("status", "priority"):
+            if values.get(name) is not None:
+                values[name] = values[name].value
+        return cls(**values)
 
 
 class TodoListResponse(BaseModel):
@@ -80,6 +95,79 @@ class TodoListResponse(BaseModel):
     total: int = Field(..., description="Total de TODOs encontrados")
     limit: int = Field(..., description="Limite aplicado na consulta")
     offset: int = Field(..., description="Offset aplicado na consulta")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor da próxima página na mesma ordenação (parâmetro cursor)",
+    )
+
+
+class TodoBatchGetResponse(BaseModel):
+    """Schema de resposta para busca de vários TODOs por ID"""
+
+    todos: list[TodoResponse] = Field(
+        ..., description="TODOs encontrados, na ordem dos IDs pedidos"
+    )
+    missing: list[UUID] = Field(..., description="IDs pedidos que não existem")
+
+
+class TodoBoardColumn(BaseModel):
+    """Schema de uma coluna (status) do quadro de TODOs"""
+
+    status: TodoStatusEnum = Field(..., description="Status da coluna")
+    todos: list[TodoResponse] = Field(..., description="Primeiros TODOs da coluna")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor da próxima página desta coluna (parâmetro cursor)"
+    )
+    total: Optional[int] = Field(
+        None, description="Total de TODOs da coluna (com counts=true)"
+    )
+
+
+class TodoBoardResponse(BaseModel):
+    """Schema de resposta para o quadro de TODOs por status"""
+
+    columns: list[TodoBoardColumn] = Field(..., description="Uma coluna por status")
+    limit: int = Field(..., description="Limite aplicado em cada coluna")
+
+
+class TodoTombstoneResponse(BaseModel):
+    """Schema de resposta para TODO removido"""
+
+    id: UUID = Field(..., description="ID do TODO removido")
+    deleted_at: datetime = Field(..., description="Data da remoção")
+
+
+class TodoChangesResponse(BaseModel):
+    """Schema de resposta para o delta sync de TODOs"""
+
+    todos: list[TodoResponse] = Field(..., description="TODOs criados ou alterados")
+    deleted: list[TodoTombstoneResponse] = Field(..., description="TODOs removidos")
+    next_token: Optional[str] = Field(
+        None, description="Token para a próxima chamada (parâmetro since)"
+    )
+    has_more: bool = Field(..., description="Há mais mudanças após esta página")
+
+
+class TodoHistoryEntryResponse(BaseModel):
+    """Schema de resposta para uma mudança no histórico de um TODO"""
+
+    id: int = Field(..., description="ID da mudança (crescente)")
+    todo_id: UUID = Field(..., description="ID do TODO")
+    operation: str = Field(..., description="create, update ou delete")
+    before: Optional[dict] = Field(None, description="TODO antes da mudança")
+    after: Optional[dict] = Field(None, description="TODO depois da mudança")
+    changed_at: datetime = Field(..., description="Data da mudança")
+
+
+class TodoHistoryResponse(BaseModel):
+    """Schema de resposta para o histórico de um TODO"""
+
+    entries: list[TodoHistoryEntryResponse] = Field(
+        ..., description="Mudanças, da mais recente para a mais antiga"
+    )
+    next_cursor: Optional[int] = Field(
+        None, description="Cursor da próxima página (parâmetro cursor)"
+    )
 
 
 class TodoStatsResponse(BaseModel):
@@ -91,6 +179,39 @@ class TodoStatsResponse(BaseModel):
     completed: int = Field(..., description="TODOs completos")
 
 
+class TodoStatusPriorityCount(BaseModel):
+    """Contagem de TODOs de um par status x prioridade"""
+
+    status: str = Field(..., description="Status")
+    priority: str = Field(..., description="Prioridade")
+    total: int = Field(..., description="TODOs com esse status e prioridade")
+    overdue: int = Field(..., description="Desses, os não completos com prazo vencido")
+
+
+class TodoDailyCount(BaseModel):
+    """Contagem diária (UTC) de TODOs criados e completados"""
+
+    day: date = Field(..., description="Dia (UTC)")
+    created: int = Field(..., description="TODOs criados no dia")
+    completed: int = Field(..., description="TODOs completados no dia")
+
+
+class TodoRollupStatsResponse(BaseModel):
+    """Schema de resposta para as estatísticas detalhadas (rollups)"""
+
+    total: int = Field(..., description="Total de TODOs ativos")
+    overdue: int = Field(..., description="TODOs não completos com prazo vencido")
+    by_status_priority: list[TodoStatusPriorityCount] = Field(
+        ..., description="Contagens por status x prioridade"
+    )
+    daily: list[TodoDailyCount] = Field(
+        ..., description="Série diária de criados e completados"
+    )
+    refreshed_at: datetime = Field(
+        ..., description="Momento em que os números foram calculados"
+    )
+
+
 class ErrorResponse(BaseModel):
     """Schema de resposta para erros"""
 
@@ -1,4 +1,34 @@
 # applcation
+from .single_flight import SingleFlight
+from .todo_cache import TodoCache
+from .todo_event_broadcaster import TodoEventBroadcaster
+from .todo_create_batcher import TodoCreateBatcher
+from .todo_purger import TodoPurger
+from .todo_archiver import TodoArchiver
+from .todo_rollup_refresher import TodoRollupRefresher
+from .todo_history_relay import TodoHistoryRelay
 from .todo_service import TodoService
+from .idempotency_store import (
+    IdempotencyStore,
+    IdempotencyKeyInProgress,
+    IdempotencyKeyReused,
+    StoredResponse,
+)
+from .idempotency_key_purger import IdempotencyKeyPurger
 
-__all__ = ["TodoService"]
+__all__ = [
+    "TodoService",
+    "TodoCreateBatcher",
+    "SingleFlight",
+    "TodoCache",
+    "TodoEventBroadcaster",
+    "TodoPurger",
+    "TodoArchiver",
+    "TodoRollupRefresher",
+    "TodoHistoryRelay",
+    "IdempotencyStore",
+    "IdempotencyKeyInProgress",
+    "IdempotencyKeyReused",
+    "StoredResponse",
+    "IdempotencyKeyPurger",
+]
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.app.todo_create_batcher import RepositoryScope
+from src.infra.metrics import MetricsRegistry, metrics as default_metrics
+from src.repos import BaseTodoRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkedJob(ABC):
+    """Tarefa periódica que processa linhas em lotes curtos, um por transação"""
+
+    metric_name: str
+
+    def __init__(
+        self,
+        repository_scope: RepositoryScope,
+        batch_size: int = 5000,
+        interval_seconds: float = 60,
+        metrics: MetricsRegistry = default_metrics,
+    ):
+        self.repository_scope = repository_scope
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.metrics = metrics
+        self._task: Optional[asyncio.Task] = None
+
+    @abstractmethod
+    async def process_chunk(self, repository: BaseTodoRepository) -> int:
+        """Processa até batch_size linhas; retorna quantas foram afetadas"""
+
+    def start(self) -> None:
+        """Inicia o laço em background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Encerra o laço; o lote em andamento é abortado e revertido"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def run_once(self) -> int:
+        """Processa lote a lote, cada um em sua transação, até esvaziar"""
+        total = 0
+        while True:
+            async with self.repository_scope() as repository:
+                affected = await self.process_chunk(repository)
+                await repository.commit()
+
+            total += affected
+            self.metrics.increment(self.metric_name, affected)
+            if affected < self.batch_size:
+                return total
+            await asyncio.sleep(0)
+
+    async def _run(self) -> None:
+        """Executa run_once a cada intervalo, registrando falhas"""
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("%s failed", type(self).__name__, exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
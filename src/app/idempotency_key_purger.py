@@ -0,0 +1,12 @@
+from src.app.chunked_job import ChunkedJob
+from src.repos import IdempotencyRepository
+
+
+class IdempotencyKeyPurger(ChunkedJob):
+    """Remove em background as Idempotency-Keys expiradas, em lotes curtos"""
+
+    metric_name = "idempotency.purged"
+
+    async def process_chunk(self, repository: IdempotencyRepository) -> int:
+        """Remove um lote de chaves expiradas"""
+        return await repository.purge_expired(self.batch_size)
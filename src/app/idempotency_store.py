@@ -0,0 +1,201 @@
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import AsyncContextManager, Callable, List, Optional, Tuple
+
+from src.infra.cache import BaseCache, CacheError
+from src.infra.metrics import MetricsRegistry, metrics as default_metrics
+from src.repos import IdempotencyRepository
+
+IdempotencyRepositoryScope = Callable[[], AsyncContextManager[IdempotencyRepository]]
+
+
+class IdempotencyKeyInProgress(Exception):
+    """O primeiro request com esta chave ainda não terminou"""
+
+
+class IdempotencyKeyReused(Exception):
+    """A chave já foi usada com outro request (método, caminho ou corpo)"""
+
+
+@dataclass
+class StoredResponse:
+    """Resposta do primeiro request com a chave; sem status_code, em andamento"""
+
+    fingerprint: str
+    status_code: Optional[int] = None
+    headers: List[Tuple[str, str]] = field(default_factory=list)
+    body: bytes = b""
+    # Fim da reserva na tabela feita por este request (não vai para o cache)
+    locked_until: Optional[datetime] = None
+
+    @property
+    def completed(self) -> bool:
+        """Se a resposta já foi guardada (senão é uma reserva em andamento)"""
+        return self.status_code is not None
+
+    def to_json(self) -> str:
+        """Serializa para o cache (corpo em base64)"""
+        return json.dumps(
+            {
+                "fingerprint": self.fingerprint,
+                "status_code": self.status_code,
+                "headers": self.headers,
+                "body": base64.b64encode(self.body).decode(),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> "StoredResponse":
+        """Restaura o que to_json gravou"""
+        data = json.loads(raw)
+        return cls(
+            fingerprint=data["fingerprint"],
+            status_code=data["status_code"],
+            headers=[tuple(header) for header in data["headers"]],
+            body=base64.b64decode(data["body"]),
+        )
+
+
+class IdempotencyStore:
+    """Respostas por Idempotency-Key: cache na frente da tabela (ou só o cache)"""
+
+    def __init__(
+        self,
+        cache: BaseCache,
+        repository_scope: Optional[IdempotencyRepositoryScope] = None,
+        ttl_seconds: float = 86400,
+        lock_timeout_seconds: float = 60,
+        metrics: MetricsRegistry = default_metrics,
+    ):
+        self.cache = cache
+        self.repository_scope = repository_scope
+        self.ttl_seconds = ttl_seconds
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.metrics = metrics
+
+    async def begin(self, key: str, fingerprint: str) -> StoredResponse:
+        """Devolve a reserva da chave (sem status_code) ou a resposta para reenviar"""
+        stored = await self._read(key)
+        if stored is None:
+            if self.repository_scope is None:
+                stored = await self._claim_in_cache(key, fingerprint)
+            else:
+                stored = await self._claim(key, fingerprint)
+            if stored is None:
+                return StoredResponse(fingerprint)
+            if stored.locked_until is not None:
+                return stored
+
+        if stored.fingerprint != fingerprint:
+            self.metrics.increment("idempotency.reused")
+            raise IdempotencyKeyReused()
+        if not stored.completed:
+            self.metrics.increment("idempotency.in_progress")
+            raise IdempotencyKeyInProgress()
+
+        self.metrics.increment("idempotency.replayed")
+        return stored
+
+    async def finish(self, key: str, response: StoredResponse) -> None:
+        """Guarda a resposta do primeiro request pelo TTL, se a reserva ainda é dele"""
+        if self.repository_scope is not None:
+            async with self.repository_scope() as repository:
+                owned = await repository.complete(
+                    key,
+                    response.fingerprint,
+                    response.locked_until,
+                    response.status_code,
+                    response.headers,
+                    response.body,
+                    self.ttl_seconds,
+                )
+                await repository.commit()
+            if not owned:
+                # A reserva expirou e outro request pegou a chave: a resposta é dele
+                self.metrics.increment("idempotency.lost")
+                return
+
+        await self._write(key, response, self.ttl_seconds)
+        self.metrics.increment("idempotency.stored")
+
+    async def abandon(self, key: str, reservation: StoredResponse) -> None:
+        """Libera a chave de um request que falhou; o retry executa de novo"""
+        if self.repository_scope is not None:
+            async with self.repository_scope() as repository:
+                await repository.release(
+                    key, reservation.fingerprint, reservation.locked_until
+                )
+                await repository.commit()
+
+        try:
+            await self.cache.delete(_cache_key(key))
+        except CacheError:
+            self.metrics.increment("cache.errors")
+
+    async def _claim(self, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        """Reserva na tabela (com locked_until); se já existe, devolve o registro"""
+        async with self.repository_scope() as repository:
+            locked_until = await repository.claim(
+                key, fingerprint, self.lock_timeout_seconds
+            )
+            record = None if locked_until else await repository.get(key)
+            await repository.commit()
+
+        if locked_until is not None:
+            return StoredResponse(fingerprint, locked_until=locked_until)
+        if record is None:
+            raise IdempotencyKeyInProgress()
+
+        stored = StoredResponse(
+            fingerprint=record.fingerprint,
+            status_code=record.status_code,
+            headers=[tuple(header) for header in record.headers or ()],
+            body=record.body or b"",
+        )
+        if record.completed:
+            await self._write(key, stored, self.ttl_seconds)
+        return stored
+
+    async def _claim_in_cache(
+        self, key: str, fingerprint: str
+    ) -> Optional[StoredResponse]:
+        """Reserva no cache com add (SET NX); se outro request ganhou, devolve o dele"""
+        try:
+            claimed = await self.cache.add(
+                _cache_key(key),
+                StoredResponse(fingerprint).to_json(),
+                self.lock_timeout_seconds,
+            )
+        except CacheError:
+            self.metrics.increment("cache.errors")
+            return None
+        if claimed:
+            return None
+
+        stored = await self._read(key)
+        if stored is None:
+            raise IdempotencyKeyInProgress()
+        return stored
+
+    async def _read(self, key: str) -> Optional[StoredResponse]:
+        """Busca no cache; falhas contam como ausência"""
+        try:
+            raw = await self.cache.get(_cache_key(key))
+        except CacheError:
+            self.metrics.increment("cache.errors")
+            return None
+        return StoredResponse.from_json(raw) if raw is not None else None
+
+    async def _write(self, key: str, stored: StoredResponse, ttl: float) -> None:
+        """Grava no cache ignorando falhas (a tabela é a fonte da verdade)"""
+        try:
+            await self.cache.set(_cache_key(key), stored.to_json(), ttl)
+        except CacheError:
+            self.metrics.increment("cache.errors")
+
+
+def _cache_key(key: str) -> str:
+    """Chave do cache para uma Idempotency-Key"""
+    return f"idempotency:{key}"
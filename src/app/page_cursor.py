@@ -0,0 +1,44 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.todo import TODO_SORT_KEYS
+
+
+def _encode_value(value):
+    """Serializa um valor de chave de ordenação para JSON"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(name: str, value):
+    """Restaura o tipo de um valor conforme o nome da chave"""
+    if value is None or name == "priority_rank":
+        return value
+    if name == "id":
+        return UUID(value)
+    return datetime.fromisoformat(value)
+
+
+def encode_page_cursor(sort_field: str, values: tuple) -> str:
+    """Codifica a posição (valores do último item) de uma ordenação como token"""
+    raw = json.dumps([sort_field, *(_encode_value(value) for value in values)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_page_cursor(token: str, sort_field: str) -> tuple:
+    """Decodifica um cursor gerado para a mesma ordenação"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        cursor_field, *values = json.loads(base64.urlsafe_b64decode(padded))
+        names = TODO_SORT_KEYS[sort_field]
+        if cursor_field != sort_field or len(values) != len(names):
+            raise ValueError("cursor does not match sort")
+        return tuple(_decode_value(name, value) for name, value in zip(names, values))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as error:
+        raise ValueError("Invalid page cursor") from error
@@ -0,0 +1,83 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, Tuple, TypeVar
+
+from src.infra.metrics import MetricsRegistry, metrics as default_metrics
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Chamadas concorrentes idênticas compartilham uma única execução"""
+
+    def __init__(
+        self, methods: Iterable[str], metrics: MetricsRegistry = default_metrics
+    ):
+        self.methods = set(methods)
+        self.metrics = metrics
+        self._inflight: Dict[Tuple[str, Hashable], asyncio.Future] = {}
+
+        for method in self.methods:
+            self.metrics.register_gauge(
+                f"single_flight.{method}.coalescing_ratio",
+                lambda method=method: self.coalescing_ratio(method),
+            )
+
+    async def do(
+        self, method: str, args: Hashable, load: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Executa load() ou aguarda a execução em andamento com a mesma chave"""
+        if method not in self.methods:
+            return await load()
+
+        self.metrics.increment(f"single_flight.{method}.calls")
+        key = (method, args)
+        future = self._inflight.get(key)
+
+        if future is not None:
+            self.metrics.increment(f"single_flight.{method}.coalesced")
+            return await self._follow(future, method, args, load)
+
+        return await self._lead(key, load)
+
+    def coalescing_ratio(self, method: str) -> float:
+        """Fração das chamadas atendidas por uma execução compartilhada"""
+        calls = self.metrics.get(f"single_flight.{method}.calls")
+        coalesced = self.metrics.get(f"single_flight.{method}.coalesced")
+        return coalesced / calls if calls else 0.0
+
+    async def _lead(
+        self, key: Tuple[str, Hashable], load: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Executa a carga e publica o resultado para quem estiver aguardando"""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            result = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    async def _follow(
+        self,
+        future: asyncio.Future,
+        method: str,
+        args: Hashable,
+        load: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Aguarda o líder; se ele foi cancelado, tenta novamente"""
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+        return await self.do(method, args, load)
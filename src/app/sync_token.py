@@ -0,0 +1,27 @@
+import base64
+import binascii
+from datetime import datetime, timezone
+from typing import Tuple
+from uuid import UUID
+
+SyncCursor = Tuple[datetime, UUID]
+
+
+def encode_sync_token(cursor: SyncCursor) -> str:
+    """Codifica o cursor (timestamp, id) como token opaco"""
+    timestamp, todo_id = cursor
+    raw = f"{timestamp.isoformat()}|{todo_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_sync_token(token: str) -> SyncCursor:
+    """Decodifica um token gerado por encode_sync_token"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        timestamp, todo_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        moment = datetime.fromisoformat(timestamp)
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return moment, UUID(todo_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise ValueError("Invalid sync token") from error
@@ -0,0 +1,19 @@
+from datetime import datetime, timedelta, timezone
+
+from src.app.chunked_job import ChunkedJob
+from src.repos import BaseTodoRepository
+
+
+class TodoArchiver(ChunkedJob):
+    """Move em background os TODOs completos antigos para o arquivo"""
+
+    metric_name = "archive.rows"
+
+    def __init__(self, *args, archive_after_days: float = 30, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.archive_after = timedelta(days=archive_after_days)
+
+    async def process_chunk(self, repository: BaseTodoRepository) -> int:
+        """Arquiva um lote de TODOs completos sem alteração há archive_after"""
+        older_than = datetime.now(timezone.utc) - self.archive_after
+        return await repository.archive_completed(older_than, self.batch_size)
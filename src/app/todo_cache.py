@@ -0,0 +1,155 @@
+import json
+from datetime import datetime
+from typing import Awaitable, Callable, Hashable, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from src.domain import Todo
+from src.infra.cache import BaseCache, CacheError
+from src.infra.metrics import MetricsRegistry, metrics as default_metrics
+
+VERSION_KEY = "todos:version"
+
+
+def _json_default(value):
+    """Serializa UUID e datetime para JSON"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+def _dumps(value) -> str:
+    """Serializa um snapshot para gravar no cache"""
+    return json.dumps(value, default=_json_default)
+
+
+class TodoCache:
+    """Cache-aside de leituras de TODO com invalidação na escrita"""
+
+    def __init__(
+        self,
+        backend: Optional[BaseCache],
+        ttl: float = 30,
+        metrics: MetricsRegistry = default_metrics,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.metrics = metrics
+
+    async def get_todo(
+        self, todo_id: UUID, load: Callable[[], Awaitable[Optional[Todo]]]
+    ) -> Optional[Todo]:
+        """Busca um TODO no cache ou carrega e armazena"""
+        if self.backend is None:
+            return await load()
+
+        key = f"todo:{todo_id}"
+        cached = await self._read("todo", key)
+        if cached is not None:
+            return Todo.from_dict(json.loads(cached))
+
+        version = await self._version()
+        todo = await load()
+        if todo and await self._version() == version:
+            await self._write(key, _dumps(todo.to_dict()))
+        return todo
+
+    async def get_page(
+        self,
+        args: Hashable,
+        load: Callable[[], Awaitable[List[Todo]]],
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Todo]:
+        """Busca uma página de get_all sob a versão atual; fields vai no snapshot"""
+        if self.backend is None:
+            return await load()
+
+        key = f"todos:v{await self._version()}:{args}"
+        cached = await self._read("page", key)
+        if cached is not None:
+            return [Todo.from_dict(item) for item in json.loads(cached)]
+
+        todos = await load()
+        await self._write(key, _dumps([todo.to_dict(fields) for todo in todos]))
+        return todos
+
+    async def get_stats(self, load: Callable[[], Awaitable[dict]]) -> dict:
+        """Busca as estatísticas sob a versão atual da listagem"""
+        if self.backend is None:
+            return await load()
+
+        key = f"stats:v{await self._version()}"
+        cached = await self._read("stats", key)
+        if cached is not None:
+            return json.loads(cached)
+
+        stats = await load()
+        await self._write(key, _dumps(stats))
+        return stats
+
+    async def prime(self, snapshot: dict, version: str) -> None:
+        """Grava o snapshot de um TODO recém-escrito se a versão não mudou; erros propagam"""
+        if self.backend is None:
+            return
+
+        if await self.backend.get(VERSION_KEY) == version:
+            await self.backend.set(f"todo:{snapshot['id']}", _dumps(snapshot), self.ttl)
+            self.metrics.increment("cache.primed")
+
+    async def invalidate(self, todo_id: Optional[UUID] = None) -> Optional[str]:
+        """Remove o TODO e troca a versão de páginas e estatísticas; retorna a nova"""
+        if self.backend is None:
+            return None
+
+        version = uuid4().hex
+        try:
+            if todo_id is not None:
+                await self.backend.delete(f"todo:{todo_id}")
+            await self.backend.set(VERSION_KEY, version)
+        except CacheError:
+            self.metrics.increment("cache.errors")
+            return None
+        return version
+
+    async def handle_change(self, event: dict) -> None:
+        """Aplica um evento do ChangeBus (escritas de outros workers)"""
+        if self.backend is None:
+            return
+        if event.get("op") == "reset":
+            await self.backend.clear()
+            return
+
+        todo_id = event.get("id")
+        await self.invalidate(UUID(todo_id) if todo_id else None)
+
+    async def _version(self) -> str:
+        """Versão atual das páginas; cria uma nova se ausente"""
+        try:
+            version = await self.backend.get(VERSION_KEY)
+            if version is None:
+                version = uuid4().hex
+                await self.backend.set(VERSION_KEY, version)
+            return version
+        except CacheError:
+            self.metrics.increment("cache.errors")
+            return uuid4().hex
+
+    async def _read(self, kind: str, key: str) -> Optional[str]:
+        """Lê do backend registrando hit/miss; falhas contam como miss"""
+        try:
+            value = await self.backend.get(key)
+        except CacheError:
+            self.metrics.increment("cache.errors")
+            value = None
+
+        outcome = "hits" if value is not None else "misses"
+        self.metrics.increment(f"cache.{kind}.{outcome}")
+        return value
+
+    async def _write(self, key: str, value: str) -> None:
+        """Grava no backend ignorando falhas"""
+        try:
+            await self.backend.set(key, value, self.ttl)
+        except CacheError:
+            self.metrics.increment("cache.errors")
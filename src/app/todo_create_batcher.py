@@ -0,0 +1,107 @@
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncContextManager, Callable, List, Optional, Set
+
+from src.domain import Todo
+from src.repos import BaseTodoRepository
+
+RepositoryScope = Callable[[], AsyncContextManager[BaseTodoRepository]]
+
+
+@dataclass
+class PendingCreate:
+    """Criação aguardando o próximo flush do lote"""
+
+    fields: dict
+    future: asyncio.Future
+
+
+class TodoCreateBatcher:
+    """Group commit: agrupa criações concorrentes em um INSERT e um commit"""
+
+    def __init__(
+        self,
+        repository_scope: RepositoryScope,
+        max_batch_size: int = 100,
+        max_delay_ms: float = 5,
+    ):
+        self.repository_scope = repository_scope
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000
+        self._pending: List[PendingCreate] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def submit(self, fields: dict) -> Todo:
+        """Enfileira uma criação e aguarda a linha persistida"""
+        loop = asyncio.get_running_loop()
+        pending = PendingCreate(fields=fields, future=loop.create_future())
+        self._pending.append(pending)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._start_flush)
+
+        return await pending.future
+
+    async def close(self) -> None:
+        """Descarrega o lote pendente e aguarda os flushes em andamento"""
+        self._start_flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _start_flush(self) -> None:
+        """Separa o lote atual e agenda sua gravação"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[PendingCreate]) -> None:
+        """Grava o lote em uma transação; em falha, isola item a item"""
+        try:
+            async with self.repository_scope() as repository:
+                todos = await repository.create_many([item.fields for item in batch])
+                await repository.notify_changes(todos, "create")
+                await repository.record_history(todos, "create")
+                await repository.commit()
+        except Exception:
+            await self._flush_individually(batch)
+            return
+
+        for item, todo in zip(batch, todos):
+            self._resolve(item, todo)
+
+    async def _flush_individually(self, batch: List[PendingCreate]) -> None:
+        """Grava cada item em sua própria transação, propagando o erro de cada um"""
+        for item in batch:
+            try:
+                async with self.repository_scope() as repository:
+                    todo = await repository.create(**item.fields)
+                    await repository.notify_changes([todo], "create")
+                    await repository.record_history([todo], "create")
+                    await repository.commit()
+            except Exception as error:
+                self._reject(item, error)
+            else:
+                self._resolve(item, todo)
+
+    @staticmethod
+    def _resolve(item: PendingCreate, todo: Todo) -> None:
+        """Entrega o TODO criado ao request que o enfileirou"""
+        if not item.future.done():
+            item.future.set_result(todo)
+
+    @staticmethod
+    def _reject(item: PendingCreate, error: Exception) -> None:
+        """Entrega o erro ao request que o enfileirou"""
+        if not item.future.done():
+            item.future.set_exception(error)
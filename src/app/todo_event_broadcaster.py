@@ -0,0 +1,104 @@
+import asyncio
+from typing import Optional, Set
+
+from src.infra.change_bus import ChangeBus
+from src.infra.metrics import MetricsRegistry, metrics as default_metrics
+
+RESYNC_EVENT = {"op": "resync"}
+
+
+class TodoEventSubscription:
+    """Fila limitada de eventos de um assinante, com filtros opcionais"""
+
+    def __init__(
+        self,
+        status: Optional[str],
+        priority: Optional[str],
+        max_queue_size: int,
+        metrics: MetricsRegistry,
+    ):
+        self.status = status
+        self.priority = priority
+        self.metrics = metrics
+        self.queue: asyncio.Queue = asyncio.Queue(max_queue_size)
+
+    def matches(self, event: dict) -> bool:
+        """Verifica os filtros no estado novo ou no anterior (o TODO saindo da visão)"""
+        if self._matches(event.get("status"), event.get("priority")):
+            return True
+        return "previous_status" in event and self._matches(
+            event["previous_status"], event.get("previous_priority")
+        )
+
+    def _matches(self, status: Optional[str], priority: Optional[str]) -> bool:
+        """Verifica se status e prioridade passam nos filtros"""
+        if self.status and status != self.status:
+            return False
+        if self.priority and priority != self.priority:
+            return False
+        return True
+
+    def offer(self, event: dict) -> None:
+        """Enfileira sem bloquear; se o consumidor está lento, troca a fila por resync"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._drain()
+            self.queue.put_nowait(RESYNC_EVENT)
+            self.metrics.increment("event_stream.overflows")
+
+    async def next_event(self, timeout: float) -> Optional[dict]:
+        """Próximo evento ou None se nada chegou dentro do timeout"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def _drain(self) -> None:
+        """Descarta os eventos pendentes"""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+
+class TodoEventBroadcaster:
+    """Distribui as mudanças do ChangeBus do worker para muitos streams"""
+
+    def __init__(
+        self,
+        bus: ChangeBus,
+        max_queue_size: int = 100,
+        heartbeat_seconds: float = 15,
+        metrics: MetricsRegistry = default_metrics,
+    ):
+        self.max_queue_size = max_queue_size
+        self.heartbeat_seconds = heartbeat_seconds
+        self.metrics = metrics
+        self._subscriptions: Set[TodoEventSubscription] = set()
+
+        bus.subscribe(self._on_change)
+        metrics.register_gauge(
+            "event_stream.subscribers", lambda: len(self._subscriptions)
+        )
+
+    def subscribe(
+        self, status: Optional[str] = None, priority: Optional[str] = None
+    ) -> TodoEventSubscription:
+        """Cria uma assinatura com filtros opcionais"""
+        subscription = TodoEventSubscription(
+            status, priority, self.max_queue_size, self.metrics
+        )
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: TodoEventSubscription) -> None:
+        """Remove uma assinatura"""
+        self._subscriptions.discard(subscription)
+
+    async def _on_change(self, event: dict) -> None:
+        """Repassa o evento aos assinantes cujos filtros combinam"""
+        if event.get("op") == "reset":
+            event = RESYNC_EVENT
+
+        for subscription in list(self._subscriptions):
+            if event is RESYNC_EVENT or subscription.matches(event):
+                subscription.offer(event)
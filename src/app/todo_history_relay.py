@@ -0,0 +1,12 @@
+from src.app.chunked_job import ChunkedJob
+from src.repos import BaseTodoRepository
+
+
+class TodoHistoryRelay(ChunkedJob):
+    """Move em background o outbox de mudanças para todo_history, em lotes"""
+
+    metric_name = "history.relayed"
+
+    async def process_chunk(self, repository: BaseTodoRepository) -> int:
+        """Transfere um lote do outbox para o histórico"""
+        return await repository.relay_history(self.batch_size)
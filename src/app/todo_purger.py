@@ -0,0 +1,22 @@
+from datetime import datetime, timedelta, timezone
+
+from src.app.chunked_job import ChunkedJob
+from src.repos import BaseTodoRepository
+
+
+class TodoPurger(ChunkedJob):
+    """Expurga em background os TODOs soft-deleted e os tombstones antigos, em lotes"""
+
+    metric_name = "purge.rows"
+
+    def __init__(self, *args, tombstone_retention_days: float = 30, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tombstone_retention = timedelta(days=tombstone_retention_days)
+
+    async def process_chunk(self, repository: BaseTodoRepository) -> int:
+        """Remove um lote de TODOs soft-deleted e um de tombstones fora da retenção"""
+        purged = await repository.purge_deleted(self.batch_size)
+        older_than = datetime.now(timezone.utc) - self.tombstone_retention
+        pruned = await repository.prune_tombstones(older_than, self.batch_size)
+        self.metrics.increment("purge.tombstones", pruned)
+        return purged + pruned
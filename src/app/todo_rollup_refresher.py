@@ -0,0 +1,21 @@
+from src.app.chunked_job import ChunkedJob
+from src.repos import BaseTodoRepository
+
+
+class TodoRollupRefresher(ChunkedJob):
+    """Recalcula em background os rollups de estatísticas (materialized views)"""
+
+    metric_name = "rollup.refreshes"
+
+    async def process_chunk(self, repository: BaseTodoRepository) -> int:
+        """Um REFRESH de todas as views; 0 se outro worker já está fazendo"""
+        return int(await repository.refresh_rollups())
+
+    async def run_once(self) -> int:
+        """Uma única transação: os rollups são recalculados inteiros, sem lotes"""
+        async with self.repository_scope() as repository:
+            refreshed = await self.process_chunk(repository)
+            await repository.commit()
+
+        self.metrics.increment(self.metric_name, refreshed)
+        return refreshed
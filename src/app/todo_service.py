@@ -1,17 +1,38 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from src.domain import Todo
-from src.repos import TodoRepository
+from src.app.page_cursor import decode_page_cursor, encode_page_cursor
+from src.app.single_flight import SingleFlight
+from src.app.sync_token import decode_sync_token, encode_sync_token
+from src.app.todo_cache import TodoCache
+from src.app.todo_create_batcher import TodoCreateBatcher
+from src.constants import TodoStatusEnum
+from src.domain import Todo, TodoHistoryEntry
+from src.domain.todo import TODO_SORT_KEYS, split_sort
+from src.infra.task_queue import TaskQueue
+from src.repos import BaseTodoRepository
+from src.repos.todo_rollups import ROLLUP_DAYS
 
 
 class TodoService:
-    def __init__(self, todo_repository: TodoRepository, session: AsyncSession):
+    def __init__(
+        self,
+        todo_repository: BaseTodoRepository,
+        create_batcher: Optional[TodoCreateBatcher] = None,
+        single_flight: Optional[SingleFlight] = None,
+        cache: Optional[TodoCache] = None,
+        sync_safety_lag_ms: int = 1000,
+        task_queue: Optional[TaskQueue] = None,
+        tombstone_retention_days: float = 30,
+    ):
         self.todo_repository = todo_repository
-        self.session = session
+        self.create_batcher = create_batcher
+        self.single_flight = single_flight or SingleFlight(methods=())
+        self.cache = cache or TodoCache(backend=None)
+        self.sync_safety_lag = timedelta(milliseconds=sync_safety_lag_ms)
+        self.task_queue = task_queue
+        self.tombstone_retention = timedelta(days=tombstone_retention_days)
 
     async def create_todo(
         self,
@@ -24,17 +45,58 @@ class TodoService:
         if not title or title.strip() == "":
             raise ValueError("Title cannot be empty")
 
-        todo = await self.todo_repository.create(
-            title=title.strip(),
-            description=description.strip() if description else None,
-            priority=priority,
-            due_date=due_date,
-        )
-        await self.session.commit()
+        fields = {
+            "title": title.strip(),
+            "description": description.strip() if description else None,
+            "priority": priority,
+            "due_date": due_date,
+        }
+        if self.create_batcher:
+            todo = await self.create_batcher.submit(fields)
+        else:
+            todo = await self.todo_repository.create(**fields)
+            await self.todo_repository.notify_changes([todo], "create")
+            await self.todo_repository.record_history([todo], "create")
+            await self.todo_repository.commit()
+
+        self._warm_cache(todo, await self.cache.invalidate())
         return todo
 
-    async def get_todo_by_id(self, todo_id: UUID) -> Optional[Todo]:
-        return await self.todo_repository.get_by_id(todo_id)
+    async def get_todo_by_id(
+        self, todo_id: UUID, fields: Optional[Tuple[str, ...]] = None
+    ) -> Optional[Todo]:
+        """Busca um TODO; leituras esparsas (fields) não passam pelo cache por ID"""
+        if fields:
+            return await self.single_flight.do(
+                "get_todo_by_id",
+                (todo_id, fields),
+                lambda: self.todo_repository.get_by_id(todo_id, fields=fields),
+            )
+
+        return await self.single_flight.do(
+            "get_todo_by_id",
+            todo_id,
+            lambda: self.cache.get_todo(
+                todo_id, lambda: self.todo_repository.get_by_id(todo_id)
+            ),
+        )
+
+    async def get_todos_by_ids(
+        self, todo_ids: Sequence[UUID], fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[Todo], List[UUID]]:
+        """Busca vários TODOs numa consulta; devolve os achados na ordem pedida e os ausentes"""
+        requested = list(dict.fromkeys(todo_ids))
+        if not requested:
+            return [], []
+
+        found = {
+            todo.id: todo
+            for todo in await self.todo_repository.get_many(requested, fields=fields)
+        }
+        return (
+            [found[todo_id] for todo_id in requested if todo_id in found],
+            [todo_id for todo_id in requested if todo_id not in found],
+        )
 
     async def get_todos(
         self,
@@ -42,6 +104,10 @@ class TodoService:
         priority: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        include_archived: bool = False,
+        fields: Optional[Tuple[str, ...]] = None,
+        sort: str = "-created_at",
+        cursor: Optional[str] = None,
     ) -> List[Todo]:
         if limit <= 0:
             raise ValueError("Limit must be greater than 0")
@@ -49,10 +115,86 @@ class TodoService:
         if offset < 0:
             raise ValueError("Offset must be greater than or equal to 0")
 
-        return await self.todo_repository.get_all(
-            status=status, priority=priority, limit=limit, offset=offset
+        sort_field, _ = split_sort(sort)
+        after = decode_page_cursor(cursor, sort_field) if cursor else None
+        if fields:
+            fields = _with_sort_fields(fields, sort_field)
+
+        args = (status, priority, limit, offset, include_archived, fields, sort, after)
+        return await self.single_flight.do(
+            "get_todos",
+            args,
+            lambda: self.cache.get_page(
+                args,
+                lambda: self.todo_repository.get_all(
+                    status=status,
+                    priority=priority,
+                    limit=limit,
+                    offset=offset,
+                    include_archived=include_archived,
+                    fields=fields,
+                    sort=sort,
+                    after=after,
+                ),
+                fields,
+            ),
         )
 
+    async def get_todo_board(
+        self,
+        statuses: Optional[Sequence[str]] = None,
+        limit: int = 20,
+        sort: str = "-created_at",
+        cursors: Optional[Dict[str, str]] = None,
+        with_counts: bool = False,
+    ) -> List[dict]:
+        """Colunas do quadro: os primeiros TODOs de cada status, com cursor próprio"""
+        if limit <= 0:
+            raise ValueError("Limit must be greater than 0")
+
+        board_statuses = list(
+            dict.fromkeys(statuses or [status.value for status in TodoStatusEnum])
+        )
+        cursors = cursors or {}
+        unknown = set(cursors) - set(board_statuses)
+        if unknown:
+            raise ValueError(f"Cursor for unknown column: {', '.join(sorted(unknown))}")
+
+        sort_field, _ = split_sort(sort)
+        after = {
+            status: decode_page_cursor(token, sort_field)
+            for status, token in cursors.items()
+        }
+
+        args = (tuple(board_statuses), limit, sort, tuple(sorted(cursors.items())))
+        board = await self.single_flight.do(
+            "get_todo_board",
+            args,
+            lambda: self.todo_repository.get_board(board_statuses, limit, sort, after),
+        )
+        counts = await self.todo_repository.count_by_status() if with_counts else {}
+
+        columns = []
+        for status in board_statuses:
+            column = {
+                "status": status,
+                "todos": board[status],
+                "next_cursor": self.next_page_cursor(board[status], limit, sort),
+            }
+            if with_counts:
+                column["total"] = counts.get(status, 0)
+            columns.append(column)
+        return columns
+
+    def next_page_cursor(
+        self, todos: List[Todo], limit: int, sort: str = "-created_at"
+    ) -> Optional[str]:
+        """Cursor para a página seguinte; None se esta página não veio cheia"""
+        if len(todos) < limit:
+            return None
+        sort_field, _ = split_sort(sort)
+        return encode_page_cursor(sort_field, todos[-1].sort_values(sort_field))
+
     async def update_todo(
         self,
         todo_id: UUID,
@@ -67,37 +209,118 @@ class TodoService:
         if not todo:
             raise ValueError(f"TODO with id {todo_id} not found")
 
+        before = todo.to_snapshot()
         if title:
             todo.title = title
         if description:
             todo.description = description
         if status:
-            status_model = await self.todo_repository._get_status_by_value(status)
+            status_model = await self.todo_repository.get_status_by_value(status)
             if not status_model:
                 raise ValueError(f"Status '{status}' not found")
             todo.status = status_model
         if priority:
-            priority_model = await self.todo_repository._get_priority_by_value(priority)
+            priority_model = await self.todo_repository.get_priority_by_value(priority)
             if not priority_model:
                 raise ValueError(f"Priority '{priority}' not found")
             todo.priority = priority_model
         if due_date:
             todo.due_date = due_date
 
-        await self.session.commit()
+        await self.todo_repository.save(todo)
+        await self.todo_repository.notify_changes([todo], "update", before=[before])
+        await self.todo_repository.record_history([todo], "update", before=[before])
+        await self.todo_repository.commit()
+        self._warm_cache(todo, await self.cache.invalidate(todo_id))
         return todo
 
     async def delete_todo(self, todo_id: UUID) -> bool:
-        todo = await self.todo_repository.get_by_id(todo_id)
+        """Remove um TODO com um único statement no repositório"""
+        todo = await self.todo_repository.delete(todo_id)
         if not todo:
             raise ValueError(f"TODO with id {todo_id} not found")
 
-        result = await self.todo_repository.delete(todo_id)
-        await self.session.commit()
-        return result
+        await self.todo_repository.notify_changes([todo], "delete")
+        await self.todo_repository.record_history([todo], "delete")
+        await self.todo_repository.commit()
+        await self.cache.invalidate(todo_id)
+        return True
+
+    async def get_changes(self, since: Optional[str] = None, limit: int = 100) -> dict:
+        """TODOs alterados e removidos desde o token, em ordem (timestamp, id)"""
+        cursor = decode_sync_token(since) if since else None
+        now = datetime.now(timezone.utc)
+        if cursor and cursor[0] < now - self.tombstone_retention:
+            # Os tombstones desse período já podem ter sido expurgados
+            raise ValueError("Sync token expired; sync again without since")
+        until = now - self.sync_safety_lag
+
+        todos, tombstones = await self.todo_repository.get_changes(
+            cursor, until, limit + 1
+        )
+        entries = sorted(
+            [((todo.updated_at, todo.id), todo) for todo in todos]
+            + [
+                ((tombstone.deleted_at, tombstone.id), tombstone)
+                for tombstone in tombstones
+            ],
+            key=lambda entry: entry[0],
+        )
+        page = entries[:limit]
+        if page:
+            cursor = page[-1][0]
+
+        return {
+            "todos": [item for _, item in page if isinstance(item, Todo)],
+            "deleted": [item for _, item in page if not isinstance(item, Todo)],
+            "next_token": encode_sync_token(cursor) if cursor else None,
+            "has_more": len(entries) > limit,
+        }
+
+    async def get_todo_history(
+        self, todo_id: UUID, limit: int = 50, cursor: Optional[int] = None
+    ) -> Tuple[List[TodoHistoryEntry], Optional[int]]:
+        """Histórico do TODO, do mais recente; retorna o cursor da página seguinte"""
+        if limit <= 0:
+            raise ValueError("Limit must be greater than 0")
+
+        entries = await self.todo_repository.get_history(
+            todo_id, limit, before_id=cursor
+        )
+        next_cursor = entries[-1].id if len(entries) == limit else None
+        return entries, next_cursor
 
     async def get_todo_stats(self) -> dict:
         """Retorna estatísticas dos TODOs"""
+        return await self.single_flight.do(
+            "get_todo_stats", None, lambda: self.cache.get_stats(self._count_stats)
+        )
+
+    async def get_todo_rollup(self, days: int = ROLLUP_DAYS) -> dict:
+        """Estatísticas detalhadas a partir dos rollups, com o refreshed_at"""
+        if not 1 <= days <= ROLLUP_DAYS:
+            raise ValueError(f"Days must be between 1 and {ROLLUP_DAYS}")
+
+        rollups = await self.todo_repository.get_rollups(days)
+        breakdown = rollups["breakdown"]
+        return {
+            **rollups,
+            "total": sum(row["total"] for row in breakdown),
+            "overdue": sum(row["overdue"] for row in breakdown),
+        }
+
+    def _warm_cache(self, todo: Todo, version: Optional[str]) -> None:
+        """Adia para a fila a gravação no cache do TODO que acabou de ser escrito"""
+        if self.task_queue is None or version is None:
+            return
+
+        snapshot = todo.to_dict()
+        self.task_queue.enqueue(
+            "cache.prime", lambda: self.cache.prime(snapshot, version)
+        )
+
+    async def _count_stats(self) -> dict:
+        """Conta os TODOs por status"""
         total = await self.todo_repository.count()
         pending = await self.todo_repository.count(status="pending")
         in_progress = await self.todo_repository.count(status="in_progress")
@@ -109,3 +332,12 @@ class TodoService:
             "in_progress": in_progress,
             "completed": completed,
         }
+
+
+def _with_sort_fields(fields: Tuple[str, ...], sort_field: str) -> Tuple[str, ...]:
+    """Campos esparsos acrescidos dos que formam a chave do cursor"""
+    needed = {
+        "priority" if name == "priority_rank" else name
+        for name in TODO_SORT_KEYS[sort_field]
+    }
+    return tuple(sorted(set(fields) | needed))
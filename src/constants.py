@@ -15,3 +15,23 @@ class TodoPriorityEnum(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
+
+
+PRIORITY_RANKS = {
+    TodoPriorityEnum.LOW.value: 1,
+    TodoPriorityEnum.MEDIUM.value: 2,
+    TodoPriorityEnum.HIGH.value: 3,
+}
+
+
+class TodoSortEnum(str, Enum):
+    """Enum for Todo list orderings; a leading "-" means descending"""
+
+    CREATED_AT = "created_at"
+    CREATED_AT_DESC = "-created_at"
+    PRIORITY = "priority"
+    PRIORITY_DESC = "-priority"
+    DUE_DATE = "due_date"
+    DUE_DATE_DESC = "-due_date"
+    UPDATED_AT = "updated_at"
+    UPDATED_AT_DESC = "-updated_at"
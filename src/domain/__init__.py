@@ -1,5 +1,8 @@
-from .todo import Todo
+from .todo import Todo, uuid7
 from .todo_status import TodoStatus
 from .todo_priority import TodoPriority
+from .todo_tombstone import TodoTombstone
+from .todo_history import TodoOutboxEntry, TodoHistoryEntry
+from .idempotency_record import IdempotencyRecord
 
-__all__ = ["Todo", "TodoStatus", "TodoPriority"]
+__all__ = ["Todo", "uuid7", "TodoStatus", "TodoPriority", "TodoTombstone", "TodoOutboxEntry", "TodoHistoryEntry", "IdempotencyRecord"]
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, DateTime, Index, LargeBinary, SmallInteger, String
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.infra import Base
+
+
+class IdempotencyRecord(Base):
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (Index("idx_idempotency_keys_expires_at", "expires_at"),)
+
+    key = Column(String(255), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(SmallInteger, nullable=True)
+    headers = Column(JSONB(none_as_null=True), nullable=True)
+    body = Column(LargeBinary, nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<IdempotencyRecord(key='{self.key}', status_code={self.status_code})>"
+
+    @property
+    def completed(self) -> bool:
+        """
+        Whether the first request finished and its response was stored.
+
+        Returns:
+            bool: False while the first request is still in progress.
+        """
+        return self.status_code is not None
@@ -1,31 +1,172 @@
+import os
+import time
 from datetime import datetime
-from uuid import uuid4
+from typing import Iterable, Optional, Tuple, Union
+from uuid import UUID as PyUUID
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Integer
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ColumnElement,
+    FetchedValue,
+    String,
+    Text,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Index,
+    SmallInteger,
+    false,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
+from src.constants import PRIORITY_RANKS, TodoStatusEnum
+from src.domain.todo_priority import TodoPriority
+from src.domain.todo_status import TodoStatus
 from src.infra import Base
 
+TODO_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "created_at",
+    "updated_at",
+)
+
+TODO_SORT_KEYS = {
+    "created_at": ("created_at", "id"),
+    "priority": ("priority_rank", "created_at", "id"),
+    "due_date": ("due_date", "id"),
+    "updated_at": ("updated_at", "id"),
+}
+
+HOT_ROWS = text("deleted_at IS NULL AND archived = false")
+
+
+def split_sort(sort: str) -> Tuple[str, bool]:
+    """Split "-priority" into ("priority", True) (field, descending)"""
+    return sort.lstrip("-"), sort.startswith("-")
+
+
+_last_uuid7 = (0, 0)
+
+
+def uuid7() -> PyUUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds, so new ids land on
+    the right edge of the primary key B-tree instead of a random leaf. The
+    12-bit rand_a field is a counter within the same millisecond, keeping
+    ids generated by this process strictly increasing.
+
+    Returns:
+        UUID: A new version 7 UUID.
+    """
+    global _last_uuid7
+    timestamp_ms = time.time_ns() // 1_000_000
+    last_timestamp_ms, last_counter = _last_uuid7
+    if timestamp_ms > last_timestamp_ms:
+        counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+    elif last_counter < 0xFFF:
+        timestamp_ms, counter = last_timestamp_ms, last_counter + 1
+    else:
+        timestamp_ms, counter = last_timestamp_ms + 1, 0
+    _last_uuid7 = (timestamp_ms, counter)
+
+    random_bits = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | random_bits
+    )
+    return PyUUID(int=value)
+
+
+def _parse_datetime(value):
+    """Accept datetimes or ISO 8601 strings (None passes through)"""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
 
 class Todo(Base):
     __tablename__ = "todos"
+    __table_args__ = (
+        Index("idx_todos_updated_at_id", "updated_at", "id"),
+        Index(
+            "idx_todos_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+        Index(
+            "idx_todos_status_created_at_id",
+            "status_id",
+            "created_at",
+            "id",
+            postgresql_where=HOT_ROWS,
+        ),
+        Index(
+            "idx_todos_priority_rank_created_at_id",
+            "priority_rank",
+            "created_at",
+            "id",
+            postgresql_where=HOT_ROWS,
+        ),
+        Index(
+            "idx_todos_due_date_sort_id",
+            text("COALESCE(due_date, 'infinity'::timestamptz)"),
+            "id",
+            postgresql_where=HOT_ROWS,
+        ),
+        Index(
+            "idx_todos_completed_at",
+            "completed_at",
+            postgresql_where=text("completed_at IS NOT NULL"),
+        ),
+        Index(
+            "idx_todos_hot_updated_at_id",
+            "updated_at",
+            "id",
+            postgresql_where=HOT_ROWS,
+        ),
+    )
+    # Timestamps come from the database clock (now()); RETURNING brings them
+    # back on INSERT and UPDATE, without a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
     status_id = Column(Integer, ForeignKey("todo_statuses.id"), nullable=False)
     priority_id = Column(Integer, ForeignKey("todo_priorities.id"), nullable=False)
+    priority_rank = Column(SmallInteger, nullable=False, server_default=text("2"))
     due_date = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at = Column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
     )
+    archived = Column(Boolean, nullable=False, default=False, server_default=false())
 
     # Relationships
     status = relationship("TodoStatus", back_populates="todos", lazy="joined")
@@ -41,20 +182,110 @@ class Todo(Base):
             return self.id == other.id
         return False
 
-    def to_dict(self) -> dict:
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> dict:
         """
         Convert Todo instance to dictionary.
 
+        Args:
+            fields: Subset of TODO_FIELDS to include (e.g. for a sparse load); all when None.
+
         Returns:
             dict: Dictionary with id, title, description, status, priority, due_date, created_at and updated_at.
         """
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "status": self.status.value,
-            "priority": self.priority.value,
-            "due_date": self.due_date,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
+        data = {}
+        for name in fields or TODO_FIELDS:
+            value = getattr(self, name)
+            data[name] = value.value if name in ("status", "priority") else value
+        return data
+
+    def to_snapshot(self) -> dict:
+        """
+        JSON-safe version of to_dict, stored as before/after in the change history.
+
+        Returns:
+            dict: Same keys as to_dict, with the id as a string and dates in ISO 8601.
+        """
+        data = self.to_dict()
+        for name, value in data.items():
+            if isinstance(value, datetime):
+                data[name] = value.isoformat()
+            elif isinstance(value, PyUUID):
+                data[name] = str(value)
+        return data
+
+    def to_change_event(self, operation: str, before: Optional[dict] = None) -> dict:
+        """
+        Build the change notification payload for this Todo.
+
+        Args:
+            operation: "create", "update" or "delete".
+            before: Snapshot taken before an update; adds the previous status and
+                priority so filtered subscribers also see a todo leaving their view.
+
+        Returns:
+            dict: Dictionary with id, op, status and priority (and previous_*).
+        """
+        event = {
+            "id": str(self.id),
+            "op": operation,
+            "status": self.status.value if self.status else None,
+            "priority": self.priority.value if self.priority else None,
         }
+        if before is not None:
+            event["previous_status"] = before.get("status")
+            event["previous_priority"] = before.get("priority")
+        return event
+
+    def track_completion(self, now: Union[datetime, ColumnElement]) -> None:
+        """
+        Keep completed_at in step with the status: set when the Todo becomes
+        completed, cleared when it is reopened.
+
+        Args:
+            now: Completion time; func.now() takes it from the database clock.
+        """
+        if self.status.value != TodoStatusEnum.COMPLETED.value:
+            self.completed_at = None
+        elif self.completed_at is None:
+            self.completed_at = now
+
+    def sort_values(self, sort_field: str) -> tuple:
+        """
+        Keyset values of this Todo for an ordering in TODO_SORT_KEYS.
+
+        Args:
+            sort_field: Ordering name without direction (e.g. "priority").
+
+        Returns:
+            tuple: One value per sort key; the rank comes from the loaded priority.
+        """
+        return tuple(
+            (
+                PRIORITY_RANKS[self.priority.value]
+                if name == "priority_rank"
+                else getattr(self, name)
+            )
+            for name in TODO_SORT_KEYS[sort_field]
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Todo":
+        """
+        Build a detached Todo from the output of to_dict (e.g. a cached snapshot).
+        Keys missing from a sparse snapshot are left unset.
+
+        Returns:
+            Todo: Transient instance, not attached to any session.
+        """
+        values = {"id": PyUUID(str(data["id"]))}
+        for name in ("title", "description"):
+            if name in data:
+                values[name] = data[name]
+        for name in ("due_date", "created_at", "updated_at"):
+            if name in data:
+                values[name] = _parse_datetime(data[name])
+        if "status" in data:
+            values["status"] = TodoStatus(value=data["status"])
+        if "priority" in data:
+            values["priority"] = TodoPriority(value=data["priority"])
+        return cls(**values)
@@ -0,0 +1,79 @@
+from typing import Optional
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, String, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from src.domain.todo import Todo
+from src.infra import Base
+
+
+def history_values(todo: Todo, operation: str, before: Optional[dict] = None) -> dict:
+    """
+    Column values of a change history row for a Todo that was just written.
+
+    Args:
+        todo: The Todo as it is now (as it was, for a delete).
+        operation: "create", "update" or "delete".
+        before: Snapshot taken before an update; None otherwise.
+
+    Returns:
+        dict: todo_id, operation, before and after (a delete has no after).
+    """
+    snapshot = todo.to_snapshot()
+    if operation == "delete":
+        before, after = snapshot, None
+    else:
+        after = snapshot
+    return {
+        "todo_id": todo.id,
+        "operation": operation,
+        "before": before,
+        "after": after,
+    }
+
+
+class TodoOutboxEntry(Base):
+    __tablename__ = "todo_outbox"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    todo_id = Column(UUID(as_uuid=True), nullable=False)
+    operation = Column(String(10), nullable=False)
+    before = Column(JSONB(none_as_null=True), nullable=True)
+    after = Column(JSONB(none_as_null=True), nullable=True)
+    changed_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self):
+        return f"<TodoOutboxEntry(id={self.id}, todo_id={self.todo_id})>"
+
+
+class TodoHistoryEntry(Base):
+    __tablename__ = "todo_history"
+    __table_args__ = (Index("idx_todo_history_todo_id_id", "todo_id", "id"),)
+
+    id = Column(BigInteger, primary_key=True, autoincrement=False)
+    todo_id = Column(UUID(as_uuid=True), nullable=False)
+    operation = Column(String(10), nullable=False)
+    before = Column(JSONB(none_as_null=True), nullable=True)
+    after = Column(JSONB(none_as_null=True), nullable=True)
+    changed_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<TodoHistoryEntry(id={self.id}, todo_id={self.todo_id})>"
+
+    def to_dict(self) -> dict:
+        """
+        Convert TodoHistoryEntry instance to dictionary.
+
+        Returns:
+            dict: Dictionary with id, todo_id, operation, before, after and changed_at.
+        """
+        return {
+            "id": self.id,
+            "todo_id": self.todo_id,
+            "operation": self.operation,
+            "before": self.before,
+            "after": self.after,
+            "changed_at": self.changed_at,
+        }
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, DateTime, Index, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.infra import Base
+
+
+class TodoTombstone(Base):
+    __tablename__ = "todo_tombstones"
+    __table_args__ = (Index("idx_todo_tombstones_deleted_at_id", "deleted_at", "id"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    deleted_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self):
+        return f"<TodoTombstone(id={self.id}, deleted_at={self.deleted_at})>"
+
+    def to_dict(self) -> dict:
+        """
+        Convert TodoTombstone instance to dictionary.
+
+        Returns:
+            dict: Dictionary with id and deleted_at.
+        """
+        return {"id": self.id, "deleted_at": self.deleted_at}
@@ -1,3 +1,4 @@
-from .database.connection import Base, get_db_session, init_db
+from .database.connection import Base, async_session, get_db_session, init_db, warm_pool, close_db
+from .database.deadlines import DeadlineExceeded, apply_statement_timeout
 
-__all__ = ["Base", "get_db_session", "init_db"]
+__all__ = ["Base", "async_session", "get_db_session", "init_db", "warm_pool", "close_db", "DeadlineExceeded", "apply_statement_timeout"]
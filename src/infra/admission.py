@@ -0,0 +1,106 @@
+import asyncio
+import heapq
+from dataclasses import dataclass, field
+from itertools import count
+from typing import List
+
+from src.infra.metrics import MetricsRegistry, metrics as default_metrics
+
+
+class AdmissionRejected(Exception):
+    """Fila cheia ou espera longa demais: o request deve ser recusado"""
+
+
+@dataclass(order=True)
+class AdmissionWaiter:
+    """Request na fila; menor prioridade numérica é atendida primeiro"""
+
+    priority: int
+    sequence: int
+    future: asyncio.Future = field(compare=False)
+
+
+class AdmissionController:
+    """Limita requests simultâneos com uma fila limitada por prioridade"""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue_size: int = 100,
+        queue_timeout: float = 5,
+        metrics: MetricsRegistry = default_metrics,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.metrics = metrics
+        self._active = 0
+        self._waiters: List[AdmissionWaiter] = []
+        self._sequence = count()
+
+        metrics.register_gauge("admission.active", lambda: self._active)
+        metrics.register_gauge("admission.queue_depth", lambda: len(self._waiters))
+
+    async def acquire(self, priority: int) -> None:
+        """Ocupa uma vaga, esperando na fila; levanta AdmissionRejected se não der"""
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            self.metrics.increment("admission.admitted")
+            return
+
+        if len(self._waiters) >= self.max_queue_size:
+            self._shed_for(priority)
+
+        waiter = AdmissionWaiter(
+            priority, next(self._sequence), asyncio.get_running_loop().create_future()
+        )
+        heapq.heappush(self._waiters, waiter)
+        self.metrics.increment("admission.queued")
+
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await waiter.future
+        except (asyncio.TimeoutError, asyncio.CancelledError) as error:
+            if _granted(waiter.future):
+                if isinstance(error, asyncio.CancelledError):
+                    self.release()
+                    raise
+            else:
+                self._remove(waiter)
+                if isinstance(error, asyncio.CancelledError):
+                    raise
+                self.metrics.increment("admission.timeouts")
+                raise AdmissionRejected() from None
+
+        self.metrics.increment("admission.admitted")
+
+    def release(self) -> None:
+        """Libera a vaga, repassando-a direto ao próximo da fila"""
+        while self._waiters:
+            waiter = heapq.heappop(self._waiters)
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+                return
+        self._active -= 1
+
+    def _shed_for(self, priority: int) -> None:
+        """Fila cheia: descarta o pior da fila se o novo request for mais urgente"""
+        worst = max(self._waiters, default=None)
+        if worst is None or worst.priority <= priority:
+            self.metrics.increment("admission.rejected")
+            raise AdmissionRejected()
+
+        self._remove(worst)
+        worst.future.set_exception(AdmissionRejected())
+        self.metrics.increment("admission.shed")
+
+    def _remove(self, waiter: AdmissionWaiter) -> None:
+        """Tira um request da fila"""
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+            heapq.heapify(self._waiters)
+
+
+def _granted(future: asyncio.Future) -> bool:
+    """A vaga chegou junto com o timeout/cancelamento"""
+    return future.done() and not future.cancelled() and future.exception() is None
@@ -0,0 +1,5 @@
+from .base_cache import BaseCache, CacheError
+from .lru_cache import LRUCache
+from .redis_cache import RedisCache
+
+__all__ = ["BaseCache", "CacheError", "LRUCache", "RedisCache"]
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class CacheError(Exception):
+    """Falha de comunicação ou resposta de erro do backend de cache"""
+
+
+class BaseCache(ABC):
+    """Contrato dos backends de cache (chaves e valores em texto)"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Retorna o valor da chave ou None se ausente/expirada"""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Grava o valor; ttl em segundos, None para não expirar"""
+
+    @abstractmethod
+    async def add(self, key: str, value: str, ttl: Optional[float] = None) -> bool:
+        """Grava só se a chave não existir, de forma atômica; True se gravou"""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Remove as chaves informadas"""
+
+    async def clear(self) -> None:
+        """Descarta entradas locais; caches compartilhados não precisam"""
+
+    async def close(self) -> None:
+        """Libera recursos do backend"""
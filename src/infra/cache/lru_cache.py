@@ -0,0 +1,89 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Set, Tuple
+
+from src.infra.cache.base_cache import BaseCache
+from src.infra.metrics import MetricsRegistry, metrics as default_metrics
+
+
+class LRUCache(BaseCache):
+    """Cache em processo com TTL e limite de entradas (LRU)
+
+    Entradas gravadas com add são reservas: o limite não as descarta, só o TTL
+    ou um set/delete posterior.
+    """
+
+    def __init__(
+        self, max_entries: int = 10000, metrics: MetricsRegistry = default_metrics
+    ):
+        self.max_entries = max_entries
+        self.metrics = metrics
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._reserved: Set[str] = set()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Retorna o valor e o marca como usado mais recentemente"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._reserved.discard(key)
+            self.metrics.increment("cache.expirations")
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Grava o valor e remove os menos usados acima do limite"""
+        self._reserved.discard(key)
+        self._store(key, value, ttl)
+
+    async def add(self, key: str, value: str, ttl: Optional[float] = None) -> bool:
+        """Grava a reserva se a chave não existir; get não suspende, então é atômico"""
+        if await self.get(key) is not None:
+            return False
+        self._reserved.add(key)
+        self._store(key, value, ttl)
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        """Remove as chaves informadas"""
+        for key in keys:
+            self._entries.pop(key, None)
+            self._reserved.discard(key)
+
+    async def clear(self) -> None:
+        """Remove todas as entradas"""
+        self._entries.clear()
+        self._reserved.clear()
+
+    def _store(self, key: str, value: str, ttl: Optional[float]) -> None:
+        """Grava a entrada como a mais recente e aplica o limite"""
+        expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        excess = len(self._entries) - self.max_entries
+        if excess <= 0:
+            return
+
+        now = time.monotonic()
+        victims = []
+        for candidate, (candidate_expires_at, _) in self._entries.items():
+            if len(victims) == excess:
+                break
+            if candidate in self._reserved and candidate_expires_at > now:
+                continue
+            victims.append(candidate)
+
+        for victim in victims:
+            del self._entries[victim]
+            self._reserved.discard(victim)
+            self.metrics.increment("cache.evictions")
+
+    def __len__(self) -> int:
+        return len(self._entries)
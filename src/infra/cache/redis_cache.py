@@ -0,0 +1,127 @@
+import asyncio
+from typing import Any, List, Optional
+from urllib.parse import urlparse
+
+from src.infra.cache.base_cache import BaseCache, CacheError
+
+CONNECTION_ERRORS = (ConnectionError, OSError, asyncio.IncompleteReadError)
+
+
+class RedisCache(BaseCache):
+    """Backend de cache que fala o protocolo Redis (RESP2) via asyncio"""
+
+    def __init__(self, url: str = "redis://localhost:6379/0", timeout: float = 1.0):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        """GET key"""
+        value = await self.execute("GET", key)
+        return value.decode() if value is not None else None
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """SET key value [PX ttl]"""
+        if ttl is None:
+            await self.execute("SET", key, value)
+        else:
+            await self.execute("SET", key, value, "PX", str(int(ttl * 1000)))
+
+    async def add(self, key: str, value: str, ttl: Optional[float] = None) -> bool:
+        """SET key value NX [PX ttl]"""
+        if ttl is None:
+            reply = await self.execute("SET", key, value, "NX")
+        else:
+            reply = await self.execute(
+                "SET", key, value, "NX", "PX", str(int(ttl * 1000))
+            )
+        return reply is not None
+
+    async def delete(self, *keys: str) -> None:
+        """DEL key [key ...]"""
+        if keys:
+            await self.execute("DEL", *keys)
+
+    async def close(self) -> None:
+        """Fecha a conexão"""
+        async with self._lock:
+            await self._disconnect()
+
+    async def execute(self, *args: str) -> Any:
+        """Envia um comando e lê a resposta; reconecta na próxima chamada se falhar"""
+        async with self._lock:
+            try:
+                return await asyncio.wait_for(self._roundtrip(args), self.timeout)
+            except (asyncio.TimeoutError, *CONNECTION_ERRORS) as error:
+                await self._disconnect()
+                raise CacheError(f"Redis unavailable: {error!r}") from error
+            except asyncio.CancelledError:
+                # A resposta pendente ficaria no stream e seria lida pelo próximo comando
+                await self._disconnect()
+                raise
+
+    async def _roundtrip(self, args) -> Any:
+        """Conecta se necessário, envia o comando e lê a resposta"""
+        if self._writer is None:
+            await self._connect()
+        return await self._send(args)
+
+    async def _connect(self) -> None:
+        """Abre a conexão e executa AUTH/SELECT quando configurados"""
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        if self.password:
+            await self._send(("AUTH", self.password))
+        if self.db:
+            await self._send(("SELECT", str(self.db)))
+
+    async def _disconnect(self) -> None:
+        """Descarta a conexão atual"""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def _send(self, args) -> Any:
+        """Escreve o comando em RESP e aguarda a resposta"""
+        self._writer.write(encode_command(args))
+        await self._writer.drain()
+        return await read_reply(self._reader)
+
+
+def encode_command(args) -> bytes:
+    """Codifica um comando como array RESP de bulk strings"""
+    parts: List[bytes] = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """Lê uma resposta RESP2 completa"""
+    line = await reader.readuntil(b"\r\n")
+    prefix, payload = line[:1], line[1:-2]
+
+    if prefix == b"+":
+        return payload.decode()
+    if prefix == b"-":
+        raise CacheError(payload.decode())
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length == -1:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if prefix == b"*":
+        length = int(payload)
+        if length == -1:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+
+    raise CacheError(f"Unexpected RESP reply: {line!r}")
@@ -0,0 +1,35 @@
+import logging
+from typing import Awaitable, Callable, List
+
+logger = logging.getLogger(__name__)
+
+ChangeSubscriber = Callable[[dict], Awaitable[None]]
+
+RESET_EVENT = {"op": "reset"}
+
+
+class ChangeBus:
+    """Distribui eventos de mudança de TODO para os assinantes do processo"""
+
+    def __init__(self):
+        self._subscribers: List[ChangeSubscriber] = []
+
+    def subscribe(self, subscriber: ChangeSubscriber) -> None:
+        """Registra um assinante"""
+        self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: ChangeSubscriber) -> None:
+        """Remove um assinante"""
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+
+    async def publish(self, event: dict) -> None:
+        """Entrega o evento a todos os assinantes; falhas não interrompem os demais"""
+        for subscriber in list(self._subscribers):
+            try:
+                await subscriber(event)
+            except Exception:
+                logger.exception("Change subscriber failed for event %s", event)
+
+
+change_bus = ChangeBus()
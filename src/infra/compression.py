@@ -0,0 +1,117 @@
+import zlib
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class Encoder(ABC):
+    """Compressor incremental do corpo de uma resposta"""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Comprime um pedaço do corpo (a saída pode ficar em buffer)"""
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        """Esvazia o buffer sem encerrar o stream, para streaming"""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Encerra o stream comprimido"""
+
+
+class GzipEncoder(Encoder):
+    """gzip via zlib da biblioteca padrão"""
+
+    def __init__(self, level: int = 6):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder(Encoder):
+    """Brotli (pacote opcional brotli)"""
+
+    def __init__(self, level: int = 4):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder(Encoder):
+    """Zstandard (pacote opcional zstandard)"""
+
+    def __init__(self, level: int = 3):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+ENCODERS = {"gzip": GzipEncoder, "br": BrotliEncoder, "zstd": ZstdEncoder}
+INSTALLED = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+
+
+def available_encodings(preferred: Sequence[str]) -> List[str]:
+    """Codificações preferidas cujo pacote está instalado, na mesma ordem"""
+    return [name for name in preferred if INSTALLED.get(name)]
+
+
+def create_encoder(encoding: str, levels: Optional[Dict[str, int]] = None) -> Encoder:
+    """Cria o compressor da codificação com o nível configurado"""
+    level = (levels or {}).get(encoding)
+    encoder_class = ENCODERS[encoding]
+    return encoder_class() if level is None else encoder_class(level)
+
+
+def negotiate_encoding(accept_encoding: str, supported: Sequence[str]) -> Optional[str]:
+    """Escolhe a codificação de maior q aceita pelo cliente; empate segue supported"""
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        key, _, value = params.strip().partition("=")
+        if key.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for name in supported:
+        quality = accepted.get(name, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
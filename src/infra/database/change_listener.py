@@ -0,0 +1,82 @@
+import asyncio
+import json
+import logging
+from typing import Optional
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from src.infra.change_bus import ChangeBus, RESET_EVENT
+
+logger = logging.getLogger(__name__)
+
+TODO_CHANGES_CHANNEL = "todo_changes"
+
+
+def to_asyncpg_dsn(database_url: str) -> str:
+    """Converte a URL do SQLAlchemy (postgresql+asyncpg://) para DSN do asyncpg"""
+    url = make_url(database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class PostgresChangeListener:
+    """Conexão asyncpg dedicada que repassa os NOTIFY do canal ao ChangeBus"""
+
+    def __init__(
+        self,
+        database_url: str,
+        bus: ChangeBus,
+        channel: str = TODO_CHANGES_CHANNEL,
+        reconnect_delay: float = 1.0,
+    ):
+        self.dsn = to_asyncpg_dsn(database_url)
+        self.bus = bus
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Inicia o laço de escuta em background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Encerra a escuta e fecha a conexão"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        """Mantém a conexão de escuta, reconectando quando cair"""
+        while True:
+            try:
+                await self._listen_until_lost()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Change listener disconnected", exc_info=True)
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _listen_until_lost(self) -> None:
+        """Escuta o canal até a conexão cair; publica reset pois eventos podem ter se perdido"""
+        connection = await asyncpg.connect(self.dsn)
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _: lost.set())
+
+        try:
+            await connection.add_listener(self.channel, self._on_notification)
+            await self.bus.publish(RESET_EVENT)
+            await lost.wait()
+        finally:
+            if not connection.is_closed():
+                await connection.close()
+
+    async def _on_notification(self, connection, pid, channel, payload) -> None:
+        """Decodifica o payload e publica no ChangeBus"""
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("Invalid change payload: %s", payload)
+            return
+        await self.bus.publish(event)
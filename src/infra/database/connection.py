@@ -1,17 +1,66 @@
-import os
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import asyncio
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from dotenv import load_dotenv
 
-load_dotenv()
+from src.infra.database.deadlines import translate_query_canceled
+from src.infra.settings import (
+    DATABASE_URL,
+    DB_ECHO,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_PGBOUNCER,
+    DB_STATEMENT_CACHE_SIZE,
+)
 
 Base = declarative_base()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_async_engine(
-    DATABASE_URL, echo=True, future=True  # Para debugging - remover em produção
+def unique_statement_name() -> str:
+    """Nome de prepared statement que não colide entre conexões do PgBouncer"""
+    return f"__asyncpg_{uuid4().hex}__"
+
+
+def connect_args(pgbouncer: bool, statement_cache_size: int) -> dict:
+    """Argumentos do asyncpg para conexão direta ou via PgBouncer (transaction)"""
+    args = {"prepared_statement_cache_size": statement_cache_size}
+    if pgbouncer:
+        args["statement_cache_size"] = 0
+        args["prepared_statement_name_func"] = unique_statement_name
+    return args
+
+
+def build_engine(
+    database_url: str,
+    pgbouncer: bool = DB_PGBOUNCER,
+    statement_cache_size: int = DB_STATEMENT_CACHE_SIZE,
+    **options,
+) -> AsyncEngine:
+    """Cria um engine assíncrono com o modo de prepared statements escolhido"""
+    engine = create_async_engine(
+        database_url,
+        future=True,
+        connect_args=connect_args(pgbouncer, statement_cache_size),
+        **options,
+    )
+    translate_query_canceled(engine)
+    return engine
+
+
+engine = (
+    build_engine(
+        DATABASE_URL,
+        echo=DB_ECHO,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+    )
+    if DATABASE_URL
+    else None
 )
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -28,3 +77,21 @@ async def get_db_session():
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def warm_pool(size: int = DB_POOL_SIZE) -> None:
+    """Abre as conexões do pool antes de o worker aceitar tráfego"""
+
+    async def checkout():
+        connection = await engine.connect()
+        await connection.execute(text("SELECT 1"))
+        return connection
+
+    connections = await asyncio.gather(*(checkout() for _ in range(size)))
+    await asyncio.gather(*(connection.close() for connection in connections))
+
+
+async def close_db() -> None:
+    """Fecha as conexões do pool no desligamento"""
+    if engine is not None:
+        await engine.dispose()
@@ -0,0 +1,30 @@
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+QUERY_CANCELED = "57014"
+
+
+class DeadlineExceeded(Exception):
+    """O PostgreSQL cancelou a consulta por statement_timeout"""
+
+
+def apply_statement_timeout(session: AsyncSession, timeout_ms: Optional[int]) -> None:
+    """Aplica SET LOCAL statement_timeout a cada transação que a sessão abrir"""
+    if not timeout_ms:
+        return
+
+    @event.listens_for(session.sync_session, "after_begin")
+    def set_statement_timeout(session, transaction, connection):
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+
+
+def translate_query_canceled(engine: AsyncEngine) -> None:
+    """Converte o cancelamento por timeout do servidor em DeadlineExceeded"""
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(context: ExceptionContext):
+        if getattr(context.original_exception, "sqlstate", None) == QUERY_CANCELED:
+            return DeadlineExceeded()
@@ -0,0 +1,35 @@
+from collections import defaultdict
+from typing import Callable, Dict
+
+
+class MetricsRegistry:
+    """Contadores e gauges em memória, por processo"""
+
+    def __init__(self):
+        self._counters: Dict[str, float] = defaultdict(int)
+        self._gauges: Dict[str, Callable[[], float]] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Incrementa um contador"""
+        self._counters[name] += value
+
+    def get(self, name: str) -> float:
+        """Valor atual de um contador"""
+        return self._counters.get(name, 0)
+
+    def register_gauge(self, name: str, read: Callable[[], float]) -> None:
+        """Registra um valor calculado no momento da leitura"""
+        self._gauges[name] = read
+
+    def snapshot(self) -> Dict[str, float]:
+        """Retorna contadores e gauges ordenados pelo nome"""
+        values = dict(self._counters)
+        values.update({name: read() for name, read in self._gauges.items()})
+        return dict(sorted(values.items()))
+
+    def reset(self) -> None:
+        """Zera os contadores (gauges são mantidos)"""
+        self._counters.clear()
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,171 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _get_bool(name: str, default: bool = False) -> bool:
+    """Lê uma variável de ambiente booleana ("true"/"1"/"yes")"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("true", "1", "yes")
+
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+DB_ECHO = _get_bool("DEBUG")
+
+# PgBouncer em modo transaction: nomes únicos para os prepared statements;
+# LISTEN precisa de uma conexão direta ao PostgreSQL (DATABASE_DIRECT_URL)
+DB_PGBOUNCER = _get_bool("DB_PGBOUNCER")
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+DATABASE_DIRECT_URL = os.getenv("DATABASE_DIRECT_URL", DATABASE_URL)
+
+# "sql" (PostgreSQL) ou "memory" (InMemoryTodoRepository, sem banco)
+REPOSITORY_BACKEND = os.getenv("REPOSITORY_BACKEND", "sql")
+
+# Group commit de criações concorrentes (POST /todos)
+CREATE_BATCH_ENABLED = _get_bool("CREATE_BATCH_ENABLED")
+CREATE_BATCH_MAX_SIZE = int(os.getenv("CREATE_BATCH_MAX_SIZE", "100"))
+CREATE_BATCH_MAX_DELAY_MS = float(os.getenv("CREATE_BATCH_MAX_DELAY_MS", "5"))
+
+# Métodos de leitura do TodoService com single-flight (separados por vírgula)
+SINGLE_FLIGHT_METHODS = [
+    method.strip()
+    for method in os.getenv(
+        "SINGLE_FLIGHT_METHODS", "get_todo_by_id,get_todo_stats"
+    ).split(",")
+    if method.strip()
+]
+
+# Cache de leituras: "none", "memory" (LRU em processo) ou "redis"
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "none")
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "30"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# NOTIFY nas escritas + listener asyncpg por worker que invalida caches locais
+CHANGE_NOTIFICATIONS_ENABLED = _get_bool("CHANGE_NOTIFICATIONS_ENABLED")
+
+# Stream SSE de mudanças (/todos/events)
+EVENT_STREAM_QUEUE_SIZE = int(os.getenv("EVENT_STREAM_QUEUE_SIZE", "100"))
+EVENT_STREAM_HEARTBEAT_SECONDS = float(
+    os.getenv("EVENT_STREAM_HEARTBEAT_SECONDS", "15")
+)
+
+# Delta sync (/todos/changes): ignora mudanças mais novas que o atraso de segurança
+SYNC_SAFETY_LAG_MS = int(os.getenv("SYNC_SAFETY_LAG_MS", "1000"))
+# Tombstones mais velhos são expurgados; tokens anteriores pedem sync completo
+TOMBSTONE_RETENTION_DAYS = float(os.getenv("TOMBSTONE_RETENTION_DAYS", "30"))
+
+# Soft delete: DELETE vira UPDATE de deleted_at e um job expurga em lotes
+SOFT_DELETE_ENABLED = _get_bool("SOFT_DELETE_ENABLED")
+PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE", "5000"))
+PURGE_INTERVAL_SECONDS = float(os.getenv("PURGE_INTERVAL_SECONDS", "60"))
+
+# Arquivamento: TODOs completos antigos saem das partições/índices quentes
+ARCHIVE_ENABLED = _get_bool("ARCHIVE_ENABLED")
+ARCHIVE_AFTER_DAYS = float(os.getenv("ARCHIVE_AFTER_DAYS", "30"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "5000"))
+ARCHIVE_INTERVAL_SECONDS = float(os.getenv("ARCHIVE_INTERVAL_SECONDS", "3600"))
+
+# Rollups de estatísticas (/todos/stats/rollup) em materialized views
+ROLLUP_ENABLED = _get_bool("ROLLUP_ENABLED")
+ROLLUP_REFRESH_INTERVAL_SECONDS = float(
+    os.getenv("ROLLUP_REFRESH_INTERVAL_SECONDS", "60")
+)
+
+# Compressão de respostas (gzip sempre; br e zstd se brotli/zstandard instalados)
+COMPRESSION_ENABLED = _get_bool("COMPRESSION_ENABLED", default=True)
+COMPRESSION_ENCODINGS = [
+    encoding.strip()
+    for encoding in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",")
+    if encoding.strip()
+]
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+
+# Deadlines por rota (nome do endpoint=ms) aplicados como statement_timeout
+ROUTE_DEADLINES_MS = {
+    route.strip(): int(timeout_ms)
+    for route, _, timeout_ms in (
+        item.partition("=")
+        for item in os.getenv(
+            "ROUTE_DEADLINES_MS",
+            "get_todos=5000,get_todo_board=5000,get_todo_stats=5000,get_todo_changes=5000",
+        ).split(",")
+        if item.strip()
+    )
+}
+
+# Cancela o handler (e a consulta em andamento) quando o cliente desconecta
+DISCONNECT_CANCEL_ENABLED = _get_bool("DISCONNECT_CANCEL_ENABLED", default=True)
+
+# Servidor de produção (python -m src.server): workers e orçamento de conexões
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8000"))
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+GRACEFUL_SHUTDOWN_SECONDS = float(os.getenv("GRACEFUL_SHUTDOWN_SECONDS", "30"))
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", "0"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+
+def worker_pool_size(max_connections: int, workers: int, reserved: int = 0) -> int:
+    """Fatia do orçamento global de conexões que cabe a cada worker"""
+    pool_size = max_connections // workers - reserved
+    if pool_size < 1:
+        raise ValueError(
+            f"DB_MAX_CONNECTIONS={max_connections} is too small for {workers} workers"
+        )
+    return pool_size
+
+
+# Com DB_MAX_CONNECTIONS, cada worker recebe um pool fixo (sem overflow)
+if DB_MAX_CONNECTIONS:
+    DB_POOL_SIZE = worker_pool_size(
+        DB_MAX_CONNECTIONS, WEB_CONCURRENCY, int(CHANGE_NOTIFICATIONS_ENABLED)
+    )
+    DB_MAX_OVERFLOW = 0
+else:
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+# Admission control: no máximo a capacidade do pool em execução, o resto em fila
+ADMISSION_ENABLED = _get_bool("ADMISSION_ENABLED")
+ADMISSION_MAX_CONCURRENCY = int(
+    os.getenv("ADMISSION_MAX_CONCURRENCY", str(DB_POOL_SIZE + DB_MAX_OVERFLOW))
+)
+ADMISSION_QUEUE_SIZE = int(os.getenv("ADMISSION_QUEUE_SIZE", "100"))
+ADMISSION_QUEUE_TIMEOUT_SECONDS = float(
+    os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", "5")
+)
+ADMISSION_RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "1"))
+
+# Fila de tarefas em background: trabalho adiado pelos requests (ex.: aquecer o cache)
+TASK_QUEUE_ENABLED = _get_bool("TASK_QUEUE_ENABLED")
+TASK_QUEUE_WORKERS = int(os.getenv("TASK_QUEUE_WORKERS", "2"))
+TASK_QUEUE_MAX_SIZE = int(os.getenv("TASK_QUEUE_MAX_SIZE", "1000"))
+TASK_QUEUE_MAX_ATTEMPTS = int(os.getenv("TASK_QUEUE_MAX_ATTEMPTS", "3"))
+TASK_QUEUE_RETRY_BACKOFF_MS = int(os.getenv("TASK_QUEUE_RETRY_BACKOFF_MS", "100"))
+TASK_QUEUE_DRAIN_TIMEOUT_SECONDS = float(
+    os.getenv("TASK_QUEUE_DRAIN_TIMEOUT_SECONDS", "10")
+)
+
+# Histórico de mudanças: outbox na transação da escrita, movido em lotes para todo_history
+HISTORY_ENABLED = _get_bool("HISTORY_ENABLED")
+HISTORY_FLUSH_INTERVAL_MS = int(os.getenv("HISTORY_FLUSH_INTERVAL_MS", "250"))
+HISTORY_BATCH_SIZE = int(os.getenv("HISTORY_BATCH_SIZE", "500"))
+
+# Idempotency-Key: respostas de POST/PUT/PATCH guardadas pelo TTL para os retries
+IDEMPOTENCY_ENABLED = _get_bool("IDEMPOTENCY_ENABLED")
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+IDEMPOTENCY_LOCK_TIMEOUT_SECONDS = int(
+    os.getenv("IDEMPOTENCY_LOCK_TIMEOUT_SECONDS", "60")
+)
+IDEMPOTENCY_PURGE_INTERVAL_SECONDS = float(
+    os.getenv("IDEMPOTENCY_PURGE_INTERVAL_SECONDS", "300")
+)
+IDEMPOTENCY_PURGE_BATCH_SIZE = int(os.getenv("IDEMPOTENCY_PURGE_BATCH_SIZE", "5000"))
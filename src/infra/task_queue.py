@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List
+
+from src.infra.metrics import MetricsRegistry, metrics as default_metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueuedTask:
+    """Trabalho adiado; job é chamado de novo a cada tentativa"""
+
+    name: str
+    job: Callable[[], Awaitable[None]]
+
+
+class TaskQueue:
+    """Fila limitada de trabalho adiado, executada por workers asyncio no processo"""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_size: int = 1000,
+        max_attempts: int = 3,
+        backoff_seconds: float = 0.1,
+        max_backoff_seconds: float = 5,
+        metrics: MetricsRegistry = default_metrics,
+    ):
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.metrics = metrics
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self._tasks: List[asyncio.Task] = []
+        self._closing = False
+
+        metrics.register_gauge("tasks.queue_depth", self._queue.qsize)
+
+    def enqueue(self, name: str, job: Callable[[], Awaitable[None]]) -> bool:
+        """Enfileira sem esperar; False se a fila estiver cheia ou encerrando"""
+        if self._closing:
+            self.metrics.increment("tasks.dropped")
+            return False
+
+        try:
+            self._queue.put_nowait(QueuedTask(name, job))
+        except asyncio.QueueFull:
+            self.metrics.increment("tasks.dropped")
+            logger.warning("Task queue full, dropping %s", name)
+            return False
+
+        self.metrics.increment("tasks.enqueued")
+        return True
+
+    def start(self) -> None:
+        """Inicia os workers"""
+        if not self._tasks:
+            self._closing = False
+            self._tasks = [
+                asyncio.create_task(self._work()) for _ in range(self.workers)
+            ]
+
+    async def close(self, drain_timeout: float = 10) -> None:
+        """Para de aceitar trabalho, espera a fila esvaziar e encerra os workers"""
+        self._closing = True
+        if self._tasks:
+            try:
+                await asyncio.wait_for(self._queue.join(), drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Task queue drain timed out with %d tasks", self._queue.qsize()
+                )
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _work(self) -> None:
+        """Consome a fila até ser cancelado"""
+        while True:
+            task = await self._queue.get()
+            try:
+                await self._run(task)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, task: QueuedTask) -> None:
+        """Executa com retry e backoff exponencial; desiste após max_attempts"""
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await task.job()
+            except Exception:
+                if attempt == self.max_attempts:
+                    self.metrics.increment("tasks.failed")
+                    logger.warning("Task %s failed", task.name, exc_info=True)
+                    return
+                self.metrics.increment("tasks.retried")
+                await asyncio.sleep(self._backoff(attempt))
+            else:
+                self.metrics.increment("tasks.completed")
+                return
+
+    def _backoff(self, attempt: int) -> float:
+        """Espera antes da próxima tentativa: dobra a cada falha, com teto"""
+        return min(self.backoff_seconds * 2 ** (attempt - 1), self.max_backoff_seconds)
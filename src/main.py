@@ -1,7 +1,45 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.api import todo_router
-from src.infra import init_db
+from src.api.middlewares import (
+    AdmissionMiddleware,
+    CompressionMiddleware,
+    DisconnectCancelMiddleware,
+    IdempotencyMiddleware,
+)
+from src.api.dependencies import (
+    create_batcher,
+    change_listener,
+    todo_cache,
+    todo_purger,
+    todo_archiver,
+    todo_rollup_refresher,
+    todo_history_relay,
+    task_queue,
+    idempotency_store,
+    idempotency_key_purger,
+)
+from src.infra import async_session, close_db, init_db, warm_pool
+from src.infra.admission import AdmissionController
+from src.infra.metrics import metrics
+from src.repos import create_rollup_views, lookup_cache
+from src.infra.settings import (
+    REPOSITORY_BACKEND,
+    COMPRESSION_ENABLED,
+    COMPRESSION_ENCODINGS,
+    COMPRESSION_MIN_SIZE,
+    COMPRESSION_GZIP_LEVEL,
+    COMPRESSION_BROTLI_QUALITY,
+    COMPRESSION_ZSTD_LEVEL,
+    ADMISSION_ENABLED,
+    ADMISSION_MAX_CONCURRENCY,
+    ADMISSION_QUEUE_SIZE,
+    ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    ADMISSION_RETRY_AFTER_SECONDS,
+    DISCONNECT_CANCEL_ENABLED,
+    ROLLUP_ENABLED,
+    TASK_QUEUE_DRAIN_TIMEOUT_SECONDS,
+)
 
 app = FastAPI(
     title="TODO API",
@@ -9,6 +47,20 @@ app = FastAPI(
     version="1.0.0",
 )
 
+if ADMISSION_ENABLED:
+    app.add_middleware(
+        AdmissionMiddleware,
+        controller=AdmissionController(
+            ADMISSION_MAX_CONCURRENCY,
+            max_queue_size=ADMISSION_QUEUE_SIZE,
+            queue_timeout=ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        ),
+        retry_after_seconds=ADMISSION_RETRY_AFTER_SECONDS,
+    )
+
+if idempotency_store:
+    app.add_middleware(IdempotencyMiddleware, store=idempotency_store)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -17,12 +69,73 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=COMPRESSION_ENCODINGS,
+        minimum_size=COMPRESSION_MIN_SIZE,
+        levels={
+            "gzip": COMPRESSION_GZIP_LEVEL,
+            "br": COMPRESSION_BROTLI_QUALITY,
+            "zstd": COMPRESSION_ZSTD_LEVEL,
+        },
+    )
+
+if DISCONNECT_CANCEL_ENABLED:
+    app.add_middleware(DisconnectCancelMiddleware)
+
 app.include_router(todo_router, prefix="/api/v1", tags=["todos"])
 
 
 @app.on_event("startup")
 async def startup_event():
-    await init_db()
+    if REPOSITORY_BACKEND == "sql":
+        await init_db()
+        await warm_pool()
+        async with async_session() as session:
+            await lookup_cache.warm(session)
+            if ROLLUP_ENABLED:
+                await create_rollup_views(session)
+                await session.commit()
+    if task_queue:
+        task_queue.start()
+    if change_listener:
+        change_listener.start()
+    if todo_purger:
+        todo_purger.start()
+    if todo_archiver:
+        todo_archiver.start()
+    if todo_rollup_refresher:
+        todo_rollup_refresher.start()
+    if todo_history_relay:
+        todo_history_relay.start()
+    if idempotency_key_purger:
+        idempotency_key_purger.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if idempotency_key_purger:
+        await idempotency_key_purger.stop()
+    if todo_rollup_refresher:
+        await todo_rollup_refresher.stop()
+    if todo_archiver:
+        await todo_archiver.stop()
+    if todo_purger:
+        await todo_purger.stop()
+    if change_listener:
+        await change_listener.stop()
+    if create_batcher:
+        await create_batcher.close()
+    if todo_history_relay:
+        await todo_history_relay.stop()
+    if task_queue:
+        await task_queue.close(TASK_QUEUE_DRAIN_TIMEOUT_SECONDS)
+    if todo_cache.backend is not None:
+        await todo_cache.backend.close()
+    if idempotency_store:
+        await idempotency_store.cache.close()
+    await close_db()
 
 
 @app.get("/", tags=["health"])
@@ -30,6 +143,11 @@ async def health_check():
     return {"status": "healthy", "message": "TODO API is running"}
 
 
+@app.get("/metrics", tags=["health"])
+async def get_metrics():
+    return metrics.snapshot()
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -1,3 +1,17 @@
+from .base_todo_repository import BaseTodoRepository
 from .todo_repository import TodoRepository
+from .in_memory_todo_repository import InMemoryTodoRepository, InMemoryTodoStore
+from .idempotency_repository import IdempotencyRepository
+from .lookup_cache import LookupCache, lookup_cache
+from .todo_rollups import create_rollup_views
 
-__all__ = ["TodoRepository"]
+__all__ = [
+    "BaseTodoRepository",
+    "TodoRepository",
+    "InMemoryTodoRepository",
+    "InMemoryTodoStore",
+    "IdempotencyRepository",
+    "LookupCache",
+    "lookup_cache",
+    "create_rollup_views",
+]
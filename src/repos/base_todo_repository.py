@@ -0,0 +1,145 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from src.domain import Todo, TodoStatus, TodoPriority, TodoTombstone, TodoHistoryEntry
+
+
+class BaseTodoRepository(ABC):
+    """Contrato comum a todos os backends de repositório de TODOs"""
+
+    @abstractmethod
+    async def get_status_by_value(self, value: str) -> Optional[TodoStatus]:
+        """Busca um TodoStatus pelo valor"""
+
+    @abstractmethod
+    async def get_priority_by_value(self, value: str) -> Optional[TodoPriority]:
+        """Busca um TodoPriority pelo valor"""
+
+    @abstractmethod
+    async def create(
+        self,
+        title: str,
+        description: Optional[str] = None,
+        status: str = "pending",
+        priority: str = "medium",
+        due_date: Optional[datetime] = None,
+    ) -> Todo:
+        """Cria um novo TODO"""
+
+    @abstractmethod
+    async def create_many(self, items: List[dict]) -> List[Todo]:
+        """Cria vários TODOs de uma vez, na ordem recebida"""
+
+    @abstractmethod
+    async def get_by_id(
+        self, todo_id: UUID, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Todo]:
+        """Busca um TODO pelo ID; fields restringe os campos carregados"""
+
+    @abstractmethod
+    async def get_many(
+        self, todo_ids: Sequence[UUID], fields: Optional[Sequence[str]] = None
+    ) -> List[Todo]:
+        """Busca os TODOs existentes entre os IDs, em qualquer ordem"""
+
+    @abstractmethod
+    async def get_all(
+        self,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        include_archived: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        sort: str = "-created_at",
+        after: Optional[tuple] = None,
+    ) -> List[Todo]:
+        """Busca TODOs na ordem de sort (chaves em TODO_SORT_KEYS), após o cursor after"""
+
+    @abstractmethod
+    async def get_board(
+        self,
+        statuses: Sequence[str],
+        limit: int,
+        sort: str = "-created_at",
+        after: Optional[Dict[str, tuple]] = None,
+    ) -> Dict[str, List[Todo]]:
+        """Primeiros limit TODOs de cada status, cada um após o seu cursor em after"""
+
+    @abstractmethod
+    async def count_by_status(self) -> Dict[str, int]:
+        """Total de TODOs (não arquivados) de cada status"""
+
+    @abstractmethod
+    async def get_changes(
+        self, since: Optional[Tuple[datetime, UUID]], until: datetime, limit: int
+    ) -> Tuple[List[Todo], List[TodoTombstone]]:
+        """TODOs alterados e tombstones após o cursor (ts, id), até until, em ordem"""
+
+    @abstractmethod
+    async def save(self, todo: Todo) -> Todo:
+        """Registra as alterações feitas em um TODO existente"""
+
+    @abstractmethod
+    async def delete(self, todo_id: UUID) -> Optional[Todo]:
+        """Remove um TODO pelo ID e retorna o TODO removido (None se não existir)"""
+
+    @abstractmethod
+    async def purge_deleted(self, limit: int) -> int:
+        """Remove fisicamente até limit TODOs soft-deleted; retorna quantos"""
+
+    @abstractmethod
+    async def prune_tombstones(self, older_than: datetime, limit: int) -> int:
+        """Remove até limit tombstones de antes de older_than; retorna quantos"""
+
+    @abstractmethod
+    async def archive_completed(self, older_than: datetime, limit: int) -> int:
+        """Arquiva até limit TODOs completos sem alteração desde older_than"""
+
+    @abstractmethod
+    async def count(
+        self, status: Optional[str] = None, priority: Optional[str] = None
+    ) -> int:
+        """Conta TODOs com filtros opcionais"""
+
+    @abstractmethod
+    async def notify_changes(
+        self,
+        todos: List[Todo],
+        operation: str,
+        before: Optional[List[dict]] = None,
+    ) -> None:
+        """Publica create/update/delete dos TODOs; before traz o estado anterior"""
+
+    @abstractmethod
+    async def record_history(
+        self,
+        todos: List[Todo],
+        operation: str,
+        before: Optional[List[dict]] = None,
+    ) -> None:
+        """Registra, na transação da escrita, o antes/depois de cada TODO alterado"""
+
+    @abstractmethod
+    async def relay_history(self, limit: int) -> int:
+        """Move até limit registros pendentes para o histórico; retorna quantos"""
+
+    @abstractmethod
+    async def get_history(
+        self, todo_id: UUID, limit: int, before_id: Optional[int] = None
+    ) -> List[TodoHistoryEntry]:
+        """Histórico de um TODO, do mais recente, com id menor que before_id"""
+
+    @abstractmethod
+    async def refresh_rollups(self) -> bool:
+        """Recalcula os rollups de estatísticas; False se não houve refresh"""
+
+    @abstractmethod
+    async def get_rollups(self, days: int) -> dict:
+        """Contagens por status x prioridade, séries diárias e o refreshed_at"""
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Confirma as alterações pendentes"""
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain import IdempotencyRecord
+
+PURGE_EXPIRED_STATEMENT = text(
+    "DELETE FROM idempotency_keys WHERE key IN ("
+    " SELECT key FROM idempotency_keys WHERE expires_at < now()"
+    " LIMIT :limit FOR UPDATE SKIP LOCKED"
+    ")"
+)
+
+
+class IdempotencyRepository:
+    """Tabela idempotency_keys: respostas guardadas por Idempotency-Key"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def claim(
+        self, key: str, fingerprint: str, lock_seconds: float
+    ) -> Optional[datetime]:
+        """Reserva a chave (nova ou expirada); devolve o fim da reserva ou None"""
+        expires_at = func.now() + timedelta(seconds=lock_seconds)
+        stmt = (
+            insert(IdempotencyRecord)
+            .values(key=key, fingerprint=fingerprint, expires_at=expires_at)
+            .on_conflict_do_update(
+                index_elements=[IdempotencyRecord.key],
+                set_={
+                    "fingerprint": fingerprint,
+                    "status_code": None,
+                    "headers": None,
+                    "body": None,
+                    "expires_at": expires_at,
+                },
+                where=IdempotencyRecord.expires_at < func.now(),
+            )
+            .returning(IdempotencyRecord.expires_at)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get(self, key: str) -> Optional[IdempotencyRecord]:
+        """Busca a chave se ainda não expirou"""
+        result = await self.session.execute(
+            select(IdempotencyRecord).where(
+                IdempotencyRecord.key == key,
+                IdempotencyRecord.expires_at >= func.now(),
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def complete(
+        self,
+        key: str,
+        fingerprint: str,
+        locked_until: datetime,
+        status_code: int,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        ttl_seconds: float,
+    ) -> bool:
+        """Guarda a resposta pelo TTL; False se a reserva não é mais nossa"""
+        result = await self.session.execute(
+            update(IdempotencyRecord)
+            .where(*_owned_by(key, fingerprint, locked_until))
+            .values(
+                status_code=status_code,
+                headers=[list(header) for header in headers],
+                body=body,
+                expires_at=func.now() + timedelta(seconds=ttl_seconds),
+            )
+        )
+        return result.rowcount == 1
+
+    async def release(self, key: str, fingerprint: str, locked_until: datetime) -> None:
+        """Libera a reserva de um request que falhou, para o retry executar de novo"""
+        await self.session.execute(
+            delete(IdempotencyRecord).where(*_owned_by(key, fingerprint, locked_until))
+        )
+
+    async def purge_expired(self, limit: int) -> int:
+        """Remove até limit chaves expiradas"""
+        result = await self.session.execute(PURGE_EXPIRED_STATEMENT, {"limit": limit})
+        return result.rowcount
+
+    async def commit(self) -> None:
+        """Confirma a transação da sessão"""
+        await self.session.commit()
+
+
+def _owned_by(key: str, fingerprint: str, locked_until: datetime) -> tuple:
+    """Condições da reserva feita por claim; reservada de novo, não casa mais"""
+    return (
+        IdempotencyRecord.key == key,
+        IdempotencyRecord.fingerprint == fingerprint,
+        IdempotencyRecord.expires_at == locked_until,
+        IdempotencyRecord.status_code.is_(None),
+    )
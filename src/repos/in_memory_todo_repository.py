@@ -0,0 +1,441 @@
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from itertools import count, islice
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from src.constants import PRIORITY_RANKS, TodoStatusEnum, TodoPriorityEnum
+from src.domain import (
+    Todo,
+    TodoStatus,
+    TodoPriority,
+    TodoTombstone,
+    TodoHistoryEntry,
+    uuid7,
+)
+from src.domain.todo_history import history_values
+from src.domain.todo import split_sort
+from src.infra.change_bus import ChangeBus
+from src.repos.base_todo_repository import BaseTodoRepository
+
+SortKey = Tuple[datetime, UUID]
+
+STATUS_IDS = {status.value: index for index, status in enumerate(TodoStatusEnum, 1)}
+PRIORITY_IDS = {
+    priority.value: index for index, priority in enumerate(TodoPriorityEnum, 1)
+}
+
+
+class InMemoryTodoStore:
+    """Armazenamento de TODOs em memória com índices secundários"""
+
+    def __init__(self):
+        self.todos: Dict[UUID, Todo] = {}
+        self.by_status: Dict[str, Set[UUID]] = defaultdict(set)
+        self.by_priority: Dict[str, Set[UUID]] = defaultdict(set)
+        self.by_created_at: List[SortKey] = []
+        self.by_updated_at: List[SortKey] = []
+        self.tombstones: Dict[UUID, TodoTombstone] = {}
+        self.by_deleted_at: List[SortKey] = []
+        self.history: Dict[UUID, List[TodoHistoryEntry]] = defaultdict(list)
+        self.history_sequence = count(1)
+        self._indexed: Dict[UUID, Tuple[str, str, SortKey, SortKey]] = {}
+
+    def put(self, todo: Todo) -> None:
+        """Insere ou reindexa um TODO"""
+        self.remove(todo.id)
+        key = (todo.created_at, todo.id)
+        updated_key = (todo.updated_at, todo.id)
+        self.todos[todo.id] = todo
+        self.by_status[todo.status.value].add(todo.id)
+        self.by_priority[todo.priority.value].add(todo.id)
+        insort(self.by_created_at, key)
+        insort(self.by_updated_at, updated_key)
+        self._indexed[todo.id] = (
+            todo.status.value,
+            todo.priority.value,
+            key,
+            updated_key,
+        )
+
+    def remove(self, todo_id: UUID) -> bool:
+        """Remove um TODO e suas entradas nos índices"""
+        indexed = self._indexed.pop(todo_id, None)
+        if indexed is None:
+            return False
+
+        status, priority, key, updated_key = indexed
+        self.by_status[status].discard(todo_id)
+        self.by_priority[priority].discard(todo_id)
+        del self.by_created_at[bisect_left(self.by_created_at, key)]
+        del self.by_updated_at[bisect_left(self.by_updated_at, updated_key)]
+        del self.todos[todo_id]
+        return True
+
+    def add_tombstone(self, todo_id: UUID, deleted_at: datetime) -> None:
+        """Registra (ou renova) o tombstone de um TODO removido"""
+        previous = self.tombstones.get(todo_id)
+        if previous is not None:
+            key = (previous.deleted_at, todo_id)
+            del self.by_deleted_at[bisect_left(self.by_deleted_at, key)]
+
+        self.tombstones[todo_id] = TodoTombstone(id=todo_id, deleted_at=deleted_at)
+        insort(self.by_deleted_at, (deleted_at, todo_id))
+
+    def prune_tombstones(self, older_than: datetime, limit: int) -> int:
+        """Remove até limit tombstones de antes de older_than, do mais antigo"""
+        end = min(bisect_left(self.by_deleted_at, (older_than,)), limit)
+        for _, todo_id in self.by_deleted_at[:end]:
+            del self.tombstones[todo_id]
+        del self.by_deleted_at[:end]
+        return end
+
+    def sort_key(self, todo_id: UUID) -> SortKey:
+        """Chave de ordenação (created_at, id) de um TODO indexado"""
+        return self._indexed[todo_id][2]
+
+    def clear(self) -> None:
+        """Remove todos os TODOs e zera os índices"""
+        self.todos.clear()
+        self.by_status.clear()
+        self.by_priority.clear()
+        self.by_created_at.clear()
+        self.by_updated_at.clear()
+        self.tombstones.clear()
+        self.by_deleted_at.clear()
+        self.history.clear()
+        self._indexed.clear()
+
+
+class InMemoryTodoRepository(BaseTodoRepository):
+    """Repositório sem banco; escritas são aplicadas imediatamente"""
+
+    def __init__(
+        self, store: InMemoryTodoStore, change_bus: Optional[ChangeBus] = None
+    ):
+        self.store = store
+        self.change_bus = change_bus
+
+    async def get_status_by_value(self, value: str) -> Optional[TodoStatus]:
+        """Busca um TodoStatus pelo valor"""
+        status_id = STATUS_IDS.get(value)
+        return TodoStatus(id=status_id, value=value) if status_id else None
+
+    async def get_priority_by_value(self, value: str) -> Optional[TodoPriority]:
+        """Busca um TodoPriority pelo valor"""
+        priority_id = PRIORITY_IDS.get(value)
+        return TodoPriority(id=priority_id, value=value) if priority_id else None
+
+    async def create(
+        self,
+        title: str,
+        description: Optional[str] = None,
+        status: str = "pending",
+        priority: str = "medium",
+        due_date: Optional[datetime] = None,
+    ) -> Todo:
+        """Cria um novo TODO"""
+        status_model = await self.get_status_by_value(status)
+        if not status_model:
+            raise ValueError(f"Status '{status}' not found")
+
+        priority_model = await self.get_priority_by_value(priority)
+        if not priority_model:
+            raise ValueError(f"Priority '{priority}' not found")
+
+        now = datetime.now(timezone.utc)
+        todo = Todo(
+            id=uuid7(),
+            title=title,
+            description=description,
+            status_id=status_model.id,
+            priority_id=priority_model.id,
+            priority_rank=PRIORITY_RANKS[priority],
+            due_date=due_date,
+            created_at=now,
+            updated_at=now,
+        )
+        todo.status = status_model
+        todo.priority = priority_model
+        todo.track_completion(now)
+
+        self.store.put(todo)
+        return todo
+
+    async def create_many(self, items: List[dict]) -> List[Todo]:
+        """Cria vários TODOs, validando todos antes de inserir"""
+        for item in items:
+            status = item.get("status", "pending")
+            priority = item.get("priority", "medium")
+            if status not in STATUS_IDS:
+                raise ValueError(f"Status '{status}' not found")
+            if priority not in PRIORITY_IDS:
+                raise ValueError(f"Priority '{priority}' not found")
+
+        return [await self.create(**item) for item in items]
+
+    async def get_by_id(
+        self, todo_id: UUID, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Todo]:
+        """Busca um TODO pelo ID (já em memória, fields não muda nada)"""
+        return self.store.todos.get(todo_id)
+
+    async def get_many(
+        self, todo_ids: Sequence[UUID], fields: Optional[Sequence[str]] = None
+    ) -> List[Todo]:
+        """Busca os TODOs existentes entre os IDs"""
+        return [self.store.todos[id_] for id_ in todo_ids if id_ in self.store.todos]
+
+    async def get_all(
+        self,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        include_archived: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        sort: str = "-created_at",
+        after: Optional[tuple] = None,
+    ) -> List[Todo]:
+        """Busca todos os TODOs com filtros opcionais (não há arquivo em memória)"""
+        candidates = self._filter(status, priority)
+        if sort != "-created_at" or after is not None:
+            return self._sorted_page(candidates, sort, after, limit, offset)
+
+        if candidates is None:
+            newest_first = (key[1] for key in reversed(self.store.by_created_at))
+            ids: Iterable[UUID] = islice(newest_first, offset, offset + limit)
+        else:
+            top = heapq.nlargest(offset + limit, candidates, key=self.store.sort_key)
+            ids = top[offset:]
+
+        return [self.store.todos[todo_id] for todo_id in ids]
+
+    async def get_board(
+        self,
+        statuses: Sequence[str],
+        limit: int,
+        sort: str = "-created_at",
+        after: Optional[Dict[str, tuple]] = None,
+    ) -> Dict[str, List[Todo]]:
+        """Uma página de get_all por status (não há round trip a economizar)"""
+        for status in statuses:
+            if status not in STATUS_IDS:
+                raise ValueError(f"Status '{status}' not found")
+
+        after = after or {}
+        return {
+            status: await self.get_all(
+                status=status, limit=limit, sort=sort, after=after.get(status)
+            )
+            for status in statuses
+        }
+
+    async def count_by_status(self) -> Dict[str, int]:
+        """Tamanho do índice de cada status"""
+        return {status: len(ids) for status, ids in self.store.by_status.items()}
+
+    async def get_changes(
+        self, since: Optional[SortKey], until: datetime, limit: int
+    ) -> Tuple[List[Todo], List[TodoTombstone]]:
+        """Fatias dos índices ordenados por (updated_at, id) e (deleted_at, id)"""
+        todo_keys = _changes_after(self.store.by_updated_at, since, until, limit)
+        tombstone_keys = _changes_after(self.store.by_deleted_at, since, until, limit)
+        return (
+            [self.store.todos[todo_id] for _, todo_id in todo_keys],
+            [self.store.tombstones[todo_id] for _, todo_id in tombstone_keys],
+        )
+
+    async def save(self, todo: Todo) -> Todo:
+        """Reindexa um TODO alterado e atualiza updated_at"""
+        todo.status_id = todo.status.id
+        todo.priority_id = todo.priority.id
+        todo.priority_rank = PRIORITY_RANKS[todo.priority.value]
+        todo.updated_at = datetime.now(timezone.utc)
+        todo.track_completion(todo.updated_at)
+        self.store.put(todo)
+        return todo
+
+    async def delete(self, todo_id: UUID) -> Optional[Todo]:
+        """Remove na hora e registra o tombstone"""
+        todo = self.store.todos.get(todo_id)
+        if todo is not None:
+            self.store.remove(todo_id)
+            self.store.add_tombstone(todo_id, datetime.now(timezone.utc))
+        return todo
+
+    async def purge_deleted(self, limit: int) -> int:
+        """Sem soft delete: não há nada a expurgar"""
+        return 0
+
+    async def prune_tombstones(self, older_than: datetime, limit: int) -> int:
+        """Corta o início do índice por (deleted_at, id)"""
+        return self.store.prune_tombstones(older_than, limit)
+
+    async def archive_completed(self, older_than: datetime, limit: int) -> int:
+        """Sem partições: tudo fica no mesmo armazenamento"""
+        return 0
+
+    async def record_history(
+        self,
+        todos: List[Todo],
+        operation: str,
+        before: Optional[List[dict]] = None,
+    ) -> None:
+        """Sem outbox: o histórico é gravado direto no armazenamento"""
+        for index, todo in enumerate(todos):
+            entry = TodoHistoryEntry(
+                id=next(self.store.history_sequence),
+                changed_at=datetime.now(timezone.utc),
+                **history_values(todo, operation, before[index] if before else None),
+            )
+            self.store.history[todo.id].append(entry)
+
+    async def relay_history(self, limit: int) -> int:
+        """Sem outbox: não há nada a mover"""
+        return 0
+
+    async def get_history(
+        self, todo_id: UUID, limit: int, before_id: Optional[int] = None
+    ) -> List[TodoHistoryEntry]:
+        """Fatia do histórico do TODO (em ordem de id) antes de before_id"""
+        entries = self.store.history.get(todo_id, [])
+        end = len(entries)
+        if before_id is not None:
+            end = bisect_left(entries, before_id, key=lambda entry: entry.id)
+        return entries[max(end - limit, 0) : end][::-1]
+
+    async def refresh_rollups(self) -> bool:
+        """Sem materialized views: get_rollups calcula na hora"""
+        return False
+
+    async def get_rollups(self, days: int) -> dict:
+        """Calcula os rollups direto do armazenamento"""
+        now = datetime.now(timezone.utc)
+        breakdown: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(
+            lambda: {"total": 0, "overdue": 0}
+        )
+        first_day = now.date() - timedelta(days=days - 1)
+        created: Dict[date, int] = defaultdict(int)
+        completed: Dict[date, int] = defaultdict(int)
+
+        for todo in self.store.todos.values():
+            counts = breakdown[(todo.status.value, todo.priority.value)]
+            counts["total"] += 1
+            is_open = todo.status.value != TodoStatusEnum.COMPLETED.value
+            if is_open and todo.due_date and _as_utc(todo.due_date) < now:
+                counts["overdue"] += 1
+            created[_as_utc(todo.created_at).date()] += 1
+            if todo.completed_at:
+                completed[_as_utc(todo.completed_at).date()] += 1
+
+        days_range = (first_day + timedelta(days=offset) for offset in range(days))
+        return {
+            "refreshed_at": now,
+            "breakdown": [
+                {"status": status, "priority": priority, **counts}
+                for (status, priority), counts in sorted(breakdown.items())
+            ],
+            "daily": [
+                {"day": day, "created": created[day], "completed": completed[day]}
+                for day in days_range
+            ],
+        }
+
+    async def count(
+        self, status: Optional[str] = None, priority: Optional[str] = None
+    ) -> int:
+        """Conta TODOs com filtros opcionais"""
+        candidates = self._filter(status, priority)
+        return len(self.store.todos) if candidates is None else len(candidates)
+
+    async def notify_changes(
+        self,
+        todos: List[Todo],
+        operation: str,
+        before: Optional[List[dict]] = None,
+    ) -> None:
+        """Publica direto no ChangeBus do processo"""
+        if not self.change_bus:
+            return
+        for index, todo in enumerate(todos):
+            await self.change_bus.publish(
+                todo.to_change_event(operation, before[index] if before else None)
+            )
+
+    async def commit(self) -> None:
+        """Sem transações: as escritas já foram aplicadas"""
+
+    def _sorted_page(
+        self,
+        candidates: Optional[Set[UUID]],
+        sort: str,
+        after: Optional[tuple],
+        limit: int,
+        offset: int,
+    ) -> List[Todo]:
+        """Ordenação sem índice próprio: top-k pela chave após o cursor"""
+        sort_field, descending = split_sort(sort)
+        todos: Iterable[Todo] = (
+            self.store.todos.values()
+            if candidates is None
+            else (self.store.todos[todo_id] for todo_id in candidates)
+        )
+
+        def key(todo: Todo) -> tuple:
+            return _comparable(todo.sort_values(sort_field))
+
+        if after is not None:
+            position = _comparable(after)
+            todos = [
+                todo
+                for todo in todos
+                if (key(todo) < position if descending else key(todo) > position)
+            ]
+
+        select_top = heapq.nlargest if descending else heapq.nsmallest
+        return select_top(offset + limit, todos, key=key)[offset:]
+
+    def _filter(
+        self, status: Optional[str], priority: Optional[str]
+    ) -> Optional[Set[UUID]]:
+        """Interseção dos índices; valores desconhecidos são ignorados como no SQL"""
+        indexes = []
+        if status in STATUS_IDS:
+            indexes.append(self.store.by_status[status])
+        if priority in PRIORITY_IDS:
+            indexes.append(self.store.by_priority[priority])
+
+        if not indexes:
+            return None
+        return set.intersection(*sorted(indexes, key=len))
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Normaliza datas para UTC com fuso, como as geradas aqui (sem fuso = UTC)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _comparable(values: tuple) -> tuple:
+    """Valores de ordenação comparáveis: datas em timestamp, sem prazo por último"""
+    comparable = []
+    for value in values:
+        if isinstance(value, datetime):
+            value = (0, value.timestamp())
+        elif value is None:
+            value = (1, 0)
+        comparable.append(value)
+    return tuple(comparable)
+
+
+def _changes_after(
+    keys: List[SortKey], since: Optional[SortKey], until: datetime, limit: int
+) -> List[SortKey]:
+    """Chaves estritamente após since e com timestamp até until"""
+    start = bisect_right(keys, since) if since else 0
+    page = keys[start : start + limit]
+    return [key for key in page if key[0] <= until]
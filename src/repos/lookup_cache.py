@@ -0,0 +1,42 @@
+from collections import defaultdict
+from typing import Dict, Optional, Type, Union
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain import TodoStatus, TodoPriority
+
+LookupModel = Type[Union[TodoStatus, TodoPriority]]
+
+
+class LookupCache:
+    """IDs de status e prioridade por valor; as tabelas não mudam em runtime"""
+
+    def __init__(self):
+        self._ids: Dict[LookupModel, Dict[str, int]] = defaultdict(dict)
+
+    async def get_id(
+        self, session: AsyncSession, model: LookupModel, value: str
+    ) -> Optional[int]:
+        """ID do valor; consulta só as colunas no primeiro acesso"""
+        ids = self._ids[model]
+        if value not in ids:
+            result = await session.execute(select(model.id).where(model.value == value))
+            lookup_id = result.scalar_one_or_none()
+            if lookup_id is None:
+                return None
+            ids[value] = lookup_id
+        return ids[value]
+
+    async def warm(self, session: AsyncSession) -> None:
+        """Carrega todas as linhas das tabelas de lookup"""
+        for model in (TodoStatus, TodoPriority):
+            result = await session.execute(select(model.id, model.value))
+            self._ids[model].update({value: id_ for id_, value in result.all()})
+
+    def clear(self) -> None:
+        """Esquece os IDs (ex.: banco recriado)"""
+        self._ids.clear()
+
+
+lookup_cache = LookupCache()
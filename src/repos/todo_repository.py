@@ -1,32 +1,158 @@
-from typing import List, Optional
+import json
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select, delete, func
+from sqlalchemy import (
+    ColumnElement,
+    any_,
+    bindparam,
+    select,
+    update,
+    delete,
+    false,
+    func,
+    literal,
+    literal_column,
+    text,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import (
+    aliased,
+    load_only,
+    make_transient_to_detached,
+    noload,
+    selectinload,
+)
 
-from src.domain import Todo, TodoStatus, TodoPriority
+from src.constants import PRIORITY_RANKS, TodoStatusEnum
+from src.domain import (
+    Todo,
+    TodoStatus,
+    TodoPriority,
+    TodoTombstone,
+    TodoOutboxEntry,
+    TodoHistoryEntry,
+    uuid7,
+)
+from src.domain.todo import TODO_SORT_KEYS, split_sort
+from src.domain.todo_history import history_values
+from src.infra.database.change_listener import TODO_CHANGES_CHANNEL
+from src.repos.base_todo_repository import BaseTodoRepository
+from src.repos.lookup_cache import LookupCache, LookupModel, lookup_cache
+from src.repos.todo_rollups import (
+    BREAKDOWN_QUERY,
+    DAILY_QUERY,
+    REFRESH_STATEMENTS,
+    ROLLUP_LOCK_ID,
+)
 
+NOTIFY_STATEMENT = text(
+    "SELECT pg_notify(:channel, payload) "
+    "FROM unnest(CAST(:payloads AS text[])) AS payload"
+)
 
-class TodoRepository:
-    def __init__(self, session: AsyncSession):
+SPARSE_COLUMNS = {
+    "title": Todo.title,
+    "description": Todo.description,
+    "due_date": Todo.due_date,
+    "created_at": Todo.created_at,
+    "updated_at": Todo.updated_at,
+}
+
+NO_DUE_DATE = literal_column("'infinity'::timestamptz")
+
+SORT_COLUMNS = {
+    "created_at": Todo.created_at,
+    "priority_rank": Todo.priority_rank,
+    "due_date": func.coalesce(Todo.due_date, NO_DUE_DATE),
+    "updated_at": Todo.updated_at,
+    "id": Todo.id,
+}
+
+PURGE_STATEMENT = text(
+    "WITH purged AS ("
+    " DELETE FROM todos WHERE id IN ("
+    "  SELECT id FROM todos WHERE deleted_at IS NOT NULL"
+    "  ORDER BY deleted_at LIMIT :limit FOR UPDATE SKIP LOCKED"
+    " ) RETURNING id, deleted_at"
+    ") "
+    "INSERT INTO todo_tombstones (id, deleted_at) "
+    "SELECT id, deleted_at FROM purged "
+    "ON CONFLICT (id) DO UPDATE SET deleted_at = EXCLUDED.deleted_at"
+)
+
+PRUNE_TOMBSTONES_STATEMENT = text(
+    "DELETE FROM todo_tombstones WHERE id IN ("
+    " SELECT id FROM todo_tombstones WHERE deleted_at < :older_than"
+    " ORDER BY deleted_at LIMIT :limit FOR UPDATE SKIP LOCKED"
+    ")"
+)
+
+RELAY_HISTORY_STATEMENT = text(
+    "WITH relayed AS ("
+    " DELETE FROM todo_outbox WHERE id IN ("
+    "  SELECT id FROM todo_outbox"
+    "  ORDER BY id LIMIT :limit FOR UPDATE SKIP LOCKED"
+    " ) RETURNING id, todo_id, operation, before, after, changed_at"
+    ") "
+    "INSERT INTO todo_history (id, todo_id, operation, before, after, changed_at) "
+    "SELECT id, todo_id, operation, before, after, changed_at FROM relayed "
+    "ON CONFLICT (id) DO NOTHING"
+)
+
+ARCHIVE_STATEMENT = text(
+    "UPDATE todos SET archived = true WHERE id IN ("
+    " SELECT todos.id FROM todos"
+    " JOIN todo_statuses ON todo_statuses.id = todos.status_id"
+    " WHERE todo_statuses.value = :status AND todos.archived = false"
+    " AND todos.deleted_at IS NULL AND todos.updated_at < :older_than"
+    " LIMIT :limit FOR UPDATE OF todos SKIP LOCKED"
+    ")"
+)
+
+
+class TodoRepository(BaseTodoRepository):
+    def __init__(
+        self,
+        session: AsyncSession,
+        emit_notifications: bool = False,
+        soft_delete: bool = False,
+        lookups: LookupCache = lookup_cache,
+        precomputed_rollups: bool = False,
+        history_enabled: bool = False,
+    ):
         self.session = session
+        self.emit_notifications = emit_notifications
+        self.soft_delete = soft_delete
+        self.lookups = lookups
+        self.precomputed_rollups = precomputed_rollups
+        self.history_enabled = history_enabled
 
-    async def _get_status_by_value(self, value: str) -> Optional[TodoStatus]:
+    async def get_status_by_value(self, value: str) -> Optional[TodoStatus]:
         """
         Busca um TodoStatus pelo valor.
         """
-        stmt = select(TodoStatus).where(TodoStatus.value == value)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self._lookup(TodoStatus, value)
 
-    async def _get_priority_by_value(self, value: str) -> Optional[TodoPriority]:
+    async def get_priority_by_value(self, value: str) -> Optional[TodoPriority]:
         """
         Busca um TodoPriority pelo valor.
         """
-        stmt = select(TodoPriority).where(TodoPriority.value == value)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self._lookup(TodoPriority, value)
+
+    async def _lookup(self, model: LookupModel, value: str):
+        """Anexa à sessão, sem SELECT, a linha de lookup cujo ID está em cache"""
+        lookup_id = await self.lookups.get_id(self.session, model, value)
+        if lookup_id is None:
+            return None
+
+        instance = model(id=lookup_id, value=value)
+        make_transient_to_detached(instance)
+        return await self.session.merge(instance, load=False)
 
     async def create(
         self,
@@ -36,79 +162,443 @@ class TodoRepository:
         priority: str = "medium",
         due_date: Optional[datetime] = None,
     ) -> Todo:
-        """Cria um novo TODO"""
-        status_model = await self._get_status_by_value(status)
-        if not status_model:
-            raise ValueError(f"Status '{status}' not found")
+        """Cria um TODO num único INSERT ... SELECT ... RETURNING (lookups e now() no banco)"""
+        table = Todo.__table__
+        values = {
+            "id": uuid7(),
+            "title": title,
+            "description": description,
+            "priority_rank": PRIORITY_RANKS.get(priority),
+            "due_date": due_date,
+        }
+        columns = [
+            literal(value, table.c[name].type).label(name)
+            for name, value in values.items()
+        ]
+        columns += [
+            TodoStatus.id.label("status_id"),
+            TodoPriority.id.label("priority_id"),
+        ]
+        if status == TodoStatusEnum.COMPLETED.value:
+            columns.append(func.now().label("completed_at"))
 
-        priority_model = await self._get_priority_by_value(priority)
-        if not priority_model:
+        source = (
+            select(*columns)
+            .select_from(TodoStatus)
+            .join(TodoPriority, TodoPriority.value == priority)
+            .where(TodoStatus.value == status)
+        )
+        inserted = (
+            insert(table)
+            .from_select([column.name for column in columns], source)
+            .returning(*table.c)
+            .cte("inserted")
+        )
+        result = await self.session.execute(select(aliased(Todo, inserted)))
+        todo = result.scalar_one_or_none()
+        if todo is None:
+            status_id = await self.session.scalar(
+                select(TodoStatus.id).where(TodoStatus.value == status)
+            )
+            if status_id is None:
+                raise ValueError(f"Status '{status}' not found")
             raise ValueError(f"Priority '{priority}' not found")
+        return todo
 
-        todo = Todo(
-            title=title,
-            description=description,
-            status_id=status_model.id,
-            priority_id=priority_model.id,
-            due_date=due_date,
-        )
+    async def create_many(self, items: List[dict]) -> List[Todo]:
+        """Cria vários TODOs; no commit viram um único INSERT multi-linha"""
+        statuses: Dict[str, Optional[TodoStatus]] = {}
+        priorities: Dict[str, Optional[TodoPriority]] = {}
+        todos = []
 
-        self.session.add(todo)
-        return todo
+        for item in items:
+            status = item.get("status", "pending")
+            priority = item.get("priority", "medium")
+            if status not in statuses:
+                statuses[status] = await self.get_status_by_value(status)
+            if priority not in priorities:
+                priorities[priority] = await self.get_priority_by_value(priority)
+
+            if not statuses[status]:
+                raise ValueError(f"Status '{status}' not found")
+            if not priorities[priority]:
+                raise ValueError(f"Priority '{priority}' not found")
+
+            todo = Todo(
+                title=item["title"],
+                description=item.get("description"),
+                status=statuses[status],
+                priority=priorities[priority],
+                priority_rank=PRIORITY_RANKS[priority],
+                due_date=item.get("due_date"),
+            )
+            todo.track_completion(func.now())
+            todos.append(todo)
 
-    async def get_by_id(self, todo_id: UUID) -> Optional[Todo]:
+        self.session.add_all(todos)
+        return todos
+
+    async def get_by_id(
+        self, todo_id: UUID, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Todo]:
         """Busca um TODO pelo ID"""
-        stmt = select(Todo).where(Todo.id == todo_id)
+        stmt = select(Todo).where(Todo.id == todo_id, Todo.deleted_at.is_(None))
+        if fields:
+            stmt = stmt.options(*_sparse_options(fields))
         result = await self.session.execute(stmt)
         todo_model = result.scalar_one_or_none()
         return todo_model
 
+    async def get_many(
+        self, todo_ids: Sequence[UUID], fields: Optional[Sequence[str]] = None
+    ) -> List[Todo]:
+        """Busca vários TODOs com um único id = ANY(:ids), um parâmetro só"""
+        ids = bindparam("ids", list(todo_ids), type_=ARRAY(PG_UUID(as_uuid=True)))
+        stmt = select(Todo).where(Todo.id == any_(ids), Todo.deleted_at.is_(None))
+        if fields:
+            stmt = stmt.options(*_sparse_options(fields))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_all(
         self,
         status: Optional[str] = None,
         priority: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        include_archived: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        sort: str = "-created_at",
+        after: Optional[tuple] = None,
     ) -> List[Todo]:
-        """Busca todos os TODOs com filtros opcionais"""
-        stmt = select(Todo)
+        """Busca TODOs com filtros opcionais, na ordem de sort e após o cursor"""
+        stmt = select(Todo).where(Todo.deleted_at.is_(None))
+        if not include_archived:
+            stmt = stmt.where(Todo.archived == false())
+        if fields:
+            stmt = stmt.options(*_sparse_options(fields))
 
         if status:
-            status_model = await self._get_status_by_value(status)
+            status_model = await self.get_status_by_value(status)
             if status_model:
                 stmt = stmt.where(Todo.status_id == status_model.id)
 
         if priority:
-            priority_model = await self._get_priority_by_value(priority)
+            priority_model = await self.get_priority_by_value(priority)
             if priority_model:
                 stmt = stmt.where(Todo.priority_id == priority_model.id)
 
-        stmt = stmt.order_by(Todo.created_at.desc()).offset(offset).limit(limit)
+        order, keyset = _keyset(sort, after)
+        if keyset is not None:
+            stmt = stmt.where(keyset)
+        stmt = stmt.order_by(*order).offset(offset).limit(limit)
 
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
-    async def delete(self, todo_id: UUID) -> bool:
-        stmt = delete(Todo).where(Todo.id == todo_id)
+    async def get_board(
+        self,
+        statuses: Sequence[str],
+        limit: int,
+        sort: str = "-created_at",
+        after: Optional[Dict[str, tuple]] = None,
+    ) -> Dict[str, List[Todo]]:
+        """Primeiros limit TODOs de cada status num único UNION ALL de keysets"""
+        board: Dict[str, List[Todo]] = {status: [] for status in statuses}
+        branches = []
+        for status in statuses:
+            status_model = await self.get_status_by_value(status)
+            if not status_model:
+                raise ValueError(f"Status '{status}' not found")
+
+            order, keyset = _keyset(sort, (after or {}).get(status))
+            branch = select(
+                Todo.__table__,
+                func.row_number().over(order_by=order).label("board_position"),
+            ).where(
+                Todo.status_id == status_model.id,
+                Todo.deleted_at.is_(None),
+                Todo.archived == false(),
+            )
+            if keyset is not None:
+                branch = branch.where(keyset)
+            branches.append(branch.order_by(*order).limit(limit))
+
+        if not branches:
+            return board
+
+        page = union_all(*branches).subquery("board")
+        stmt = select(aliased(Todo, page)).order_by(
+            page.c.status_id, page.c.board_position
+        )
+        result = await self.session.execute(stmt)
+        for todo in result.scalars().all():
+            board[todo.status.value].append(todo)
+        return board
+
+    async def count_by_status(self) -> Dict[str, int]:
+        """Conta os TODOs de cada status com um único GROUP BY"""
+        stmt = (
+            select(TodoStatus.value, func.count(Todo.id))
+            .join_from(Todo, TodoStatus, Todo.status_id == TodoStatus.id)
+            .where(Todo.deleted_at.is_(None), Todo.archived == false())
+            .group_by(TodoStatus.value)
+        )
         result = await self.session.execute(stmt)
+        return {status: total for status, total in result.all()}
+
+    async def save(self, todo: Todo) -> Todo:
+        """Registra as alterações; um TODO arquivado reaberto volta ao quente"""
+        if todo.archived and todo.status.value != TodoStatusEnum.COMPLETED.value:
+            todo.archived = False
+        todo.priority_rank = PRIORITY_RANKS[todo.priority.value]
+        todo.track_completion(func.now())
+        self.session.add(todo)
+        return todo
+
+    async def get_changes(
+        self, since: Optional[Tuple[datetime, UUID]], until: datetime, limit: int
+    ) -> Tuple[List[Todo], List[TodoTombstone]]:
+        """Keyset por (updated_at, id) e (deleted_at, id); soft-deleted viram tombstones"""
+        todos_stmt = select(Todo).where(Todo.updated_at <= until)
+        tombstones_stmt = select(TodoTombstone).where(TodoTombstone.deleted_at <= until)
+
+        if since:
+            todos_stmt = todos_stmt.where(tuple_(Todo.updated_at, Todo.id) > since)
+            tombstones_stmt = tombstones_stmt.where(
+                tuple_(TodoTombstone.deleted_at, TodoTombstone.id) > since
+            )
 
-        return result.rowcount > 0
+        todos = await self.session.execute(
+            todos_stmt.order_by(Todo.updated_at, Todo.id).limit(limit)
+        )
+        tombstones = await self.session.execute(
+            tombstones_stmt.order_by(TodoTombstone.deleted_at, TodoTombstone.id).limit(
+                limit
+            )
+        )
+        live, deleted = [], list(tombstones.scalars().all())
+        for todo in todos.scalars().all():
+            if todo.deleted_at is None:
+                live.append(todo)
+            else:
+                deleted.append(TodoTombstone(id=todo.id, deleted_at=todo.deleted_at))
+        return live, deleted
+
+    async def delete(self, todo_id: UUID) -> Optional[Todo]:
+        """Um único UPDATE (soft) ou DELETE ... RETURNING, sem SELECT prévio"""
+        if self.soft_delete:
+            stmt = (
+                update(Todo)
+                .where(Todo.id == todo_id, Todo.deleted_at.is_(None))
+                .values(deleted_at=func.now(), updated_at=func.now())
+            )
+        else:
+            stmt = delete(Todo).where(Todo.id == todo_id)
+
+        stmt = stmt.returning(Todo)
+        if self.emit_notifications or self.history_enabled:
+            stmt = stmt.options(selectinload(Todo.status), selectinload(Todo.priority))
+
+        result = await self.session.execute(
+            stmt,
+            execution_options={"synchronize_session": False, "populate_existing": True},
+        )
+        todo = result.scalar_one_or_none()
+
+        if todo is not None and not self.soft_delete:
+            await self._add_tombstone(todo_id)
+        return todo
+
+    async def purge_deleted(self, limit: int) -> int:
+        """Move até limit linhas soft-deleted para todo_tombstones em um statement"""
+        result = await self.session.execute(PURGE_STATEMENT, {"limit": limit})
+        return result.rowcount
+
+    async def prune_tombstones(self, older_than: datetime, limit: int) -> int:
+        """Apaga até limit tombstones antigos, pelo índice (deleted_at, id)"""
+        result = await self.session.execute(
+            PRUNE_TOMBSTONES_STATEMENT, {"older_than": older_than, "limit": limit}
+        )
+        return result.rowcount
 
     async def count(
         self, status: Optional[str] = None, priority: Optional[str] = None
     ) -> int:
         """Conta TODOs com filtros opcionais"""
-        stmt = select(func.count(Todo.id))
+        stmt = select(func.count(Todo.id)).where(
+            Todo.deleted_at.is_(None), Todo.archived == false()
+        )
 
         if status:
-            status_model = await self._get_status_by_value(status)
+            status_model = await self.get_status_by_value(status)
             if status_model:
                 stmt = stmt.where(Todo.status_id == status_model.id)
 
         if priority:
-            priority_model = await self._get_priority_by_value(priority)
+            priority_model = await self.get_priority_by_value(priority)
             if priority_model:
                 stmt = stmt.where(Todo.priority_id == priority_model.id)
 
         result = await self.session.execute(stmt)
         return result.scalar() or 0
+
+    async def notify_changes(
+        self,
+        todos: List[Todo],
+        operation: str,
+        before: Optional[List[dict]] = None,
+    ) -> None:
+        """Enfileira um NOTIFY por TODO; o PostgreSQL só entrega após o commit"""
+        if not self.emit_notifications or not todos:
+            return
+
+        await self.session.flush()
+        payloads = [
+            json.dumps(
+                todo.to_change_event(operation, before[index] if before else None)
+            )
+            for index, todo in enumerate(todos)
+        ]
+        await self.session.execute(
+            NOTIFY_STATEMENT, {"channel": TODO_CHANGES_CHANNEL, "payloads": payloads}
+        )
+
+    async def record_history(
+        self,
+        todos: List[Todo],
+        operation: str,
+        before: Optional[List[dict]] = None,
+    ) -> None:
+        """Uma linha por TODO no outbox, gravada no mesmo commit da escrita"""
+        if not self.history_enabled or not todos:
+            return
+
+        await self.session.flush()
+        rows = [
+            history_values(todo, operation, before[index] if before else None)
+            for index, todo in enumerate(todos)
+        ]
+        await self.session.execute(insert(TodoOutboxEntry), rows)
+
+    async def relay_history(self, limit: int) -> int:
+        """Move até limit linhas do outbox para todo_history em um statement"""
+        result = await self.session.execute(RELAY_HISTORY_STATEMENT, {"limit": limit})
+        return result.rowcount
+
+    async def get_history(
+        self, todo_id: UUID, limit: int, before_id: Optional[int] = None
+    ) -> List[TodoHistoryEntry]:
+        """Keyset por id decrescente no índice (todo_id, id)"""
+        stmt = select(TodoHistoryEntry).where(TodoHistoryEntry.todo_id == todo_id)
+        if before_id is not None:
+            stmt = stmt.where(TodoHistoryEntry.id < before_id)
+
+        result = await self.session.execute(
+            stmt.order_by(TodoHistoryEntry.id.desc()).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def _add_tombstone(self, todo_id: UUID) -> None:
+        """Registra a remoção para o delta sync"""
+        stmt = insert(TodoTombstone).values(id=todo_id, deleted_at=func.now())
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[TodoTombstone.id],
+                set_={"deleted_at": stmt.excluded.deleted_at},
+            )
+        )
+
+    async def archive_completed(self, older_than: datetime, limit: int) -> int:
+        """Marca um lote como arquivado; com partições, a linha muda de partição"""
+        result = await self.session.execute(
+            ARCHIVE_STATEMENT,
+            {
+                "status": TodoStatusEnum.COMPLETED.value,
+                "older_than": older_than,
+                "limit": limit,
+            },
+        )
+        return result.rowcount
+
+    async def refresh_rollups(self) -> bool:
+        """Recalcula as materialized views; False se outro worker já está nisso"""
+        locked = await self.session.scalar(
+            text("SELECT pg_try_advisory_xact_lock(:lock)"), {"lock": ROLLUP_LOCK_ID}
+        )
+        if not locked:
+            return False
+        for statement in REFRESH_STATEMENTS:
+            await self.session.execute(text(statement))
+        return True
+
+    async def get_rollups(self, days: int) -> dict:
+        """Lê os rollups (materialized views ou, sem elas, as mesmas consultas na hora)"""
+        if self.precomputed_rollups:
+            breakdown, daily = "todo_stats_breakdown", "todo_daily_stats"
+            refreshed_at = text(
+                "SELECT refreshed_at FROM todo_rollup_state WHERE id = 1"
+            )
+        else:
+            breakdown = f"({BREAKDOWN_QUERY}) AS breakdown"
+            daily = f"({DAILY_QUERY}) AS daily"
+            refreshed_at = text("SELECT now()")
+
+        breakdown_rows = await self.session.execute(
+            text(
+                f"SELECT status, priority, total, overdue FROM {breakdown}"
+                " ORDER BY status, priority"
+            )
+        )
+        daily_rows = await self.session.execute(
+            text(
+                f"SELECT day, created, completed FROM {daily}"
+                " WHERE day > (now() AT TIME ZONE 'UTC')::date - :days ORDER BY day"
+            ),
+            {"days": days},
+        )
+        return {
+            "refreshed_at": await self.session.scalar(refreshed_at),
+            "breakdown": [dict(row._mapping) for row in breakdown_rows],
+            "daily": [dict(row._mapping) for row in daily_rows],
+        }
+
+    async def commit(self) -> None:
+        """Confirma a transação da sessão"""
+        await self.session.commit()
+
+
+def _keyset(sort: str, after: Optional[tuple]) -> Tuple[list, Optional[ColumnElement]]:
+    """ORDER BY da ordenação e a condição de keyset após o cursor (se houver)"""
+    sort_field, descending = split_sort(sort)
+    columns = [SORT_COLUMNS[name] for name in TODO_SORT_KEYS[sort_field]]
+    order = [column.desc() if descending else column.asc() for column in columns]
+    if after is None:
+        return order, None
+
+    position = tuple_(*columns)
+    cursor = tuple_(*_sort_params(sort_field, after))
+    return order, position < cursor if descending else position > cursor
+
+
+def _sort_params(sort_field: str, values: tuple) -> list:
+    """Parâmetros do cursor com a mesma expressão das colunas de ordenação"""
+    params = []
+    for name, value in zip(TODO_SORT_KEYS[sort_field], values):
+        column = Todo.__table__.c[name]
+        param = bindparam(None, value, type_=column.type)
+        if name == "due_date":
+            param = func.coalesce(param, NO_DUE_DATE)
+        params.append(param)
+    return params
+
+
+def _sparse_options(fields: Sequence[str]) -> list:
+    """SELECT só das colunas pedidas; status/prioridade sem JOIN se não pedidos"""
+    columns = [SPARSE_COLUMNS[name] for name in fields if name in SPARSE_COLUMNS]
+    options = [load_only(Todo.id, *columns)]
+    if "status" not in fields:
+        options.append(noload(Todo.status))
+    if "priority" not in fields:
+        options.append(noload(Todo.priority))
+    return options
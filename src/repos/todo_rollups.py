@@ -0,0 +1,69 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ROLLUP_DAYS = 90
+ROLLUP_LOCK_ID = 740_044
+
+BREAKDOWN_QUERY = (
+    "SELECT todo_statuses.value AS status, todo_priorities.value AS priority,"
+    " count(*) AS total,"
+    " count(*) FILTER ("
+    "  WHERE todos.due_date < now() AND todo_statuses.value <> 'completed'"
+    " ) AS overdue"
+    " FROM todos"
+    " JOIN todo_statuses ON todo_statuses.id = todos.status_id"
+    " JOIN todo_priorities ON todo_priorities.id = todos.priority_id"
+    " WHERE todos.deleted_at IS NULL AND todos.archived = false"
+    " GROUP BY todo_statuses.value, todo_priorities.value"
+)
+
+DAILY_QUERY = (
+    "SELECT days.day, coalesce(created.total, 0) AS created,"
+    " coalesce(completed.total, 0) AS completed"
+    " FROM ("
+    "  SELECT generate_series("
+    f"   (now() AT TIME ZONE 'UTC')::date - {ROLLUP_DAYS - 1},"
+    "   (now() AT TIME ZONE 'UTC')::date, interval '1 day'"
+    "  )::date AS day"
+    " ) AS days"
+    " LEFT JOIN ("
+    "  SELECT (created_at AT TIME ZONE 'UTC')::date AS day, count(*) AS total"
+    "  FROM todos WHERE deleted_at IS NULL"
+    f"  AND created_at >= (now() AT TIME ZONE 'UTC')::date - {ROLLUP_DAYS - 1}"
+    "  GROUP BY 1"
+    " ) AS created USING (day)"
+    " LEFT JOIN ("
+    "  SELECT (completed_at AT TIME ZONE 'UTC')::date AS day, count(*) AS total"
+    "  FROM todos WHERE deleted_at IS NULL"
+    f"  AND completed_at >= (now() AT TIME ZONE 'UTC')::date - {ROLLUP_DAYS - 1}"
+    "  GROUP BY 1"
+    " ) AS completed USING (day)"
+)
+
+ROLLUP_DDL = [
+    f"CREATE MATERIALIZED VIEW IF NOT EXISTS todo_stats_breakdown AS {BREAKDOWN_QUERY}",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_todo_stats_breakdown"
+    " ON todo_stats_breakdown(status, priority)",
+    f"CREATE MATERIALIZED VIEW IF NOT EXISTS todo_daily_stats AS {DAILY_QUERY}",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_todo_daily_stats ON todo_daily_stats(day)",
+    "CREATE TABLE IF NOT EXISTS todo_rollup_state ("
+    " id SMALLINT PRIMARY KEY, refreshed_at TIMESTAMPTZ NOT NULL"
+    ")",
+    "INSERT INTO todo_rollup_state (id, refreshed_at) VALUES (1, now())"
+    " ON CONFLICT (id) DO NOTHING",
+]
+
+REFRESH_STATEMENTS = [
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY todo_stats_breakdown",
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY todo_daily_stats",
+    "UPDATE todo_rollup_state SET refreshed_at = now() WHERE id = 1",
+]
+
+
+async def create_rollup_views(session: AsyncSession) -> None:
+    """Cria as materialized views de estatísticas (um worker por vez)"""
+    await session.execute(
+        text("SELECT pg_advisory_xact_lock(:lock)"), {"lock": ROLLUP_LOCK_ID}
+    )
+    for statement in ROLLUP_DDL:
+        await session.execute(text(statement))
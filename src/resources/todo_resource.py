@@ -1,23 +1,40 @@
-from typing import Optional
+import json
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from src.api.schemas import (
     TodoCreateRequest,
     TodoUpdateRequest,
     TodoStatusUpdateRequest,
+    TodoBatchGetRequest,
     TodoResponse,
     TodoListResponse,
+    TodoBatchGetResponse,
+    TodoBoardColumn,
+    TodoBoardResponse,
+    TodoTombstoneResponse,
+    TodoChangesResponse,
+    TodoHistoryEntryResponse,
+    TodoHistoryResponse,
     TodoStatsResponse,
+    TodoStatusPriorityCount,
+    TodoDailyCount,
+    TodoRollupStatsResponse,
 )
-from src.app import TodoService
-from src.constants import TodoStatusEnum, TodoPriorityEnum
+from src.app import TodoService, TodoEventBroadcaster
+from src.constants import TodoStatusEnum, TodoPriorityEnum, TodoSortEnum
 
 
 class TodoResource:
     """Resource layer para orquestração de operações de TODO"""
 
-    def __init__(self, todo_service: TodoService):
+    def __init__(
+        self,
+        todo_service: TodoService,
+        event_broadcaster: Optional[TodoEventBroadcaster] = None,
+    ):
         self.todo_service = todo_service
+        self.event_broadcaster = event_broadcaster
 
     async def create(self, request: TodoCreateRequest) -> TodoResponse:
         """Cria um novo TODO"""
@@ -35,12 +52,29 @@ class TodoResource:
         )
         return TodoResponse.from_domain(todo=todo)
 
-    async def get_by_id(self, todo_id: UUID) -> Optional[TodoResponse]:
+    async def get_by_id(
+        self, todo_id: UUID, fields: Optional[str] = None
+    ) -> Optional[TodoResponse]:
         """Busca um TODO pelo ID"""
-        todo = await self.todo_service.get_todo_by_id(todo_id)
+        selected = _parse_fields(fields)
+        todo = await self.todo_service.get_todo_by_id(todo_id, fields=selected)
         if not todo:
             return None
-        return TodoResponse.from_domain(todo=todo)
+        return TodoResponse.from_domain(todo=todo, fields=selected)
+
+    async def batch_get(self, request: TodoBatchGetRequest) -> TodoBatchGetResponse:
+        """Busca vários TODOs por ID, preservando a ordem pedida"""
+        selected = _parse_fields(request.fields)
+        todos, missing = await self.todo_service.get_todos_by_ids(
+            request.ids, fields=selected
+        )
+
+        return TodoBatchGetResponse(
+            todos=[
+                TodoResponse.from_domain(todo=todo, fields=selected) for todo in todos
+            ],
+            missing=missing,
+        )
 
     async def list(
         self,
@@ -48,21 +82,98 @@ class TodoResource:
         priority: Optional[TodoPriorityEnum],
         limit: int,
         offset: int,
+        include_archived: bool = False,
+        fields: Optional[str] = None,
+        sort: TodoSortEnum = TodoSortEnum.CREATED_AT_DESC,
+        cursor: Optional[str] = None,
     ) -> TodoListResponse:
-        """Lista TODOs com filtros opcionais"""
+        """Lista TODOs com filtros opcionais, ordenação e paginação por cursor"""
         status_value = status.value if status else None
         priority_value = priority.value if priority else None
+        selected = _parse_fields(fields)
 
         todos = await self.todo_service.get_todos(
-            status=status_value, priority=priority_value, limit=limit, offset=offset
+            status=status_value,
+            priority=priority_value,
+            limit=limit,
+            offset=offset,
+            include_archived=include_archived,
+            fields=selected,
+            sort=sort.value,
+            cursor=cursor,
         )
 
-        return TodoListResponse(
-            todos=[TodoResponse.from_domain(todo=todo) for todo in todos],
+        response = TodoListResponse(
+            todos=[
+                TodoResponse.from_domain(todo=todo, fields=selected) for todo in todos
+            ],
             total=len(todos),
             limit=limit,
             offset=offset,
         )
+        next_cursor = self.todo_service.next_page_cursor(todos, limit, sort.value)
+        if next_cursor:
+            response.next_cursor = next_cursor
+        return response
+
+    async def board(
+        self,
+        statuses: Optional[List[TodoStatusEnum]],
+        limit: int,
+        sort: TodoSortEnum = TodoSortEnum.CREATED_AT_DESC,
+        cursors: Optional[List[str]] = None,
+        counts: bool = False,
+    ) -> TodoBoardResponse:
+        """Quadro por status; cada coluna pagina com o seu cursor status:token"""
+        columns = await self.todo_service.get_todo_board(
+            statuses=[status.value for status in statuses or ()],
+            limit=limit,
+            sort=sort.value,
+            cursors=_parse_board_cursors(cursors),
+            with_counts=counts,
+        )
+
+        response = TodoBoardResponse(columns=[], limit=limit)
+        for column in columns:
+            next_cursor = column.pop("next_cursor")
+            todos = column.pop("todos")
+            response.columns.append(
+                TodoBoardColumn(
+                    **column,
+                    todos=[TodoResponse.from_domain(todo=todo) for todo in todos],
+                    next_cursor=(
+                        f"{column['status']}:{next_cursor}" if next_cursor else None
+                    ),
+                )
+            )
+        return response
+
+    async def history(
+        self, todo_id: UUID, limit: int, cursor: Optional[int] = None
+    ) -> TodoHistoryResponse:
+        """Lista o histórico de mudanças de um TODO"""
+        entries, next_cursor = await self.todo_service.get_todo_history(
+            todo_id, limit=limit, cursor=cursor
+        )
+
+        return TodoHistoryResponse(
+            entries=[TodoHistoryEntryResponse(**entry.to_dict()) for entry in entries],
+            next_cursor=next_cursor,
+        )
+
+    async def changes(self, since: Optional[str], limit: int) -> TodoChangesResponse:
+        """Lista as mudanças desde o token de sincronização"""
+        changes = await self.todo_service.get_changes(since=since, limit=limit)
+
+        return TodoChangesResponse(
+            todos=[TodoResponse.from_domain(todo=todo) for todo in changes["todos"]],
+            deleted=[
+                TodoTombstoneResponse(**tombstone.to_dict())
+                for tombstone in changes["deleted"]
+            ],
+            next_token=changes["next_token"],
+            has_more=changes["has_more"],
+        )
 
     async def update(self, todo_id: UUID, request: TodoUpdateRequest) -> TodoResponse:
         """Atualiza um TODO existente"""
@@ -108,3 +219,65 @@ class TodoResource:
         """Retorna estatísticas dos TODOs"""
         stats = await self.todo_service.get_todo_stats()
         return TodoStatsResponse(**stats)
+
+    async def get_rollup_stats(self, days: int) -> TodoRollupStatsResponse:
+        """Retorna as estatísticas detalhadas dos rollups"""
+        rollup = await self.todo_service.get_todo_rollup(days)
+        return TodoRollupStatsResponse(
+            total=rollup["total"],
+            overdue=rollup["overdue"],
+            by_status_priority=[
+                TodoStatusPriorityCount(**row) for row in rollup["breakdown"]
+            ],
+            daily=[TodoDailyCount(**row) for row in rollup["daily"]],
+            refreshed_at=rollup["refreshed_at"],
+        )
+
+    async def stream_events(
+        self,
+        status: Optional[TodoStatusEnum],
+        priority: Optional[TodoPriorityEnum],
+    ) -> AsyncIterator[str]:
+        """Gera eventos Server-Sent Events das mudanças de TODOs"""
+        subscription = self.event_broadcaster.subscribe(
+            status.value if status else None, priority.value if priority else None
+        )
+        try:
+            yield ": connected\n\n"
+            while True:
+                event = await subscription.next_event(
+                    self.event_broadcaster.heartbeat_seconds
+                )
+                yield _format_sse(event) if event else ": keep-alive\n\n"
+        finally:
+            self.event_broadcaster.unsubscribe(subscription)
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Valida o parâmetro fields (separado por vírgula); id sempre é incluído"""
+    if not fields:
+        return None
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(TodoResponse.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return tuple(sorted(requested | {"id"}))
+
+
+def _parse_board_cursors(cursors: Optional[List[str]]) -> Dict[str, str]:
+    """Separa os cursores status:token do quadro; um por coluna"""
+    parsed: Dict[str, str] = {}
+    for value in cursors or ():
+        status, separator, token = value.partition(":")
+        if not separator or not token:
+            raise ValueError("Invalid board cursor")
+        if status in parsed:
+            raise ValueError(f"Duplicate cursor for column: {status}")
+        parsed[status] = token
+    return parsed
+
+
+def _format_sse(event: dict) -> str:
+    """Formata um evento de mudança no formato text/event-stream"""
+    return f"event: {event['op']}\ndata: {json.dumps(event)}\n\n"
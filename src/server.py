@@ -0,0 +1,24 @@
+import uvicorn
+
+from src.infra.settings import (
+    HOST,
+    PORT,
+    WEB_CONCURRENCY,
+    GRACEFUL_SHUTDOWN_SECONDS,
+)
+
+
+def main() -> None:
+    """Sobe o app em produção com WEB_CONCURRENCY workers"""
+    uvicorn.run(
+        "src.main:app",
+        host=HOST,
+        port=PORT,
+        workers=WEB_CONCURRENCY,
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_SECONDS,
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
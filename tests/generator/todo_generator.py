@@ -13,7 +13,7 @@ def generate_todo_create_data(
 ) -> dict:
     """Generate mock data for todo creation request."""
     return {
-        "title": title or f"Test Todo {uuid4().hex[:8]}",
+        "title": title if title is not None else f"Test Todo {uuid4().hex[:8]}",
         "description": description or f"Test description for {title or 'todo'}",
         "priority": (priority or TodoPriorityEnum.MEDIUM).value,
         "due_date": due_date.isoformat() if due_date else None,
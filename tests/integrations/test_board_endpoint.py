@@ -0,0 +1,164 @@
+import pytest
+from uuid import UUID
+from httpx import AsyncClient
+from src.constants import TodoStatusEnum
+
+from tests.generator import generate_todo_create_data, generate_todo_update_data
+from tests.utils import extract_todo_id_from_response
+
+
+async def _create_board_todos(client: AsyncClient, counts: dict) -> dict:
+    """Helper to create todos per status; ids come back newest first."""
+    todo_ids = {}
+    for status, count in counts.items():
+        ids = []
+        for i in range(count):
+            todo_data = generate_todo_create_data(title=f"{status.value} {i+1}")
+            response = await client.post("/api/v1/todos", json=todo_data)
+            assert response.status_code == 201
+            todo_id = extract_todo_id_from_response(response.json())
+            if status != TodoStatusEnum.PENDING:
+                update_data = generate_todo_update_data(status=status)
+                response = await client.put(
+                    f"/api/v1/todos/{todo_id}", json=update_data
+                )
+                assert response.status_code == 200
+            ids.append(todo_id)
+        todo_ids[status.value] = ids[::-1]
+    return todo_ids
+
+
+def _columns(response_data: dict) -> dict:
+    """Index the board columns by status."""
+    return {column["status"]: column for column in response_data["columns"]}
+
+
+def _ids(column: dict) -> list:
+    """Todo ids of a board column, in order."""
+    return [UUID(todo["id"]) for todo in column["todos"]]
+
+
+@pytest.mark.asyncio
+async def test_todo_board_first_page(test_client: AsyncClient):
+    """Test that each column holds its newest todos and a cursor when full."""
+    todo_ids = await _create_board_todos(
+        test_client, {TodoStatusEnum.PENDING: 3, TodoStatusEnum.COMPLETED: 2}
+    )
+
+    response = await test_client.get("/api/v1/todos/board", params={"limit": 2})
+
+    assert response.status_code == 200
+    response_data = response.json()
+    columns = _columns(response_data)
+    assert response_data["limit"] == 2
+    assert list(columns) == [status.value for status in TodoStatusEnum]
+    assert _ids(columns["pending"]) == todo_ids["pending"][:2]
+    assert _ids(columns["completed"]) == todo_ids["completed"]
+    assert columns["in_progress"]["todos"] == []
+    assert columns["pending"]["next_cursor"].startswith("pending:")
+    assert columns["in_progress"]["next_cursor"] is None
+    assert "total" not in columns["pending"]
+
+
+@pytest.mark.asyncio
+async def test_todo_board_cursor_advances_one_column(test_client: AsyncClient):
+    """Test that a column cursor pages that column and leaves the others."""
+    todo_ids = await _create_board_todos(
+        test_client, {TodoStatusEnum.PENDING: 5, TodoStatusEnum.IN_PROGRESS: 3}
+    )
+    first = _columns(
+        (await test_client.get("/api/v1/todos/board", params={"limit": 2})).json()
+    )
+
+    response = await test_client.get(
+        "/api/v1/todos/board",
+        params={"limit": 2, "cursor": first["pending"]["next_cursor"]},
+    )
+    second = _columns(response.json())
+    response = await test_client.get(
+        "/api/v1/todos/board",
+        params={"limit": 2, "cursor": second["pending"]["next_cursor"]},
+    )
+    third = _columns(response.json())
+
+    assert response.status_code == 200
+    assert _ids(second["pending"]) == todo_ids["pending"][2:4]
+    assert _ids(third["pending"]) == todo_ids["pending"][4:]
+    assert third["pending"]["next_cursor"] is None
+    assert _ids(second["in_progress"]) == todo_ids["in_progress"][:2]
+    assert _ids(third["in_progress"]) == todo_ids["in_progress"][:2]
+
+
+@pytest.mark.asyncio
+async def test_todo_board_cursors_for_several_columns(test_client: AsyncClient):
+    """Test that one request can advance several columns at once."""
+    todo_ids = await _create_board_todos(
+        test_client, {TodoStatusEnum.PENDING: 3, TodoStatusEnum.COMPLETED: 3}
+    )
+    first = _columns(
+        (await test_client.get("/api/v1/todos/board", params={"limit": 2})).json()
+    )
+
+    response = await test_client.get(
+        "/api/v1/todos/board",
+        params=[
+            ("limit", 2),
+            ("cursor", first["pending"]["next_cursor"]),
+            ("cursor", first["completed"]["next_cursor"]),
+        ],
+    )
+
+    assert response.status_code == 200
+    columns = _columns(response.json())
+    assert _ids(columns["pending"]) == todo_ids["pending"][2:]
+    assert _ids(columns["completed"]) == todo_ids["completed"][2:]
+
+
+@pytest.mark.asyncio
+async def test_todo_board_with_counts(test_client: AsyncClient):
+    """Test that counts=true adds the total of every column."""
+    await _create_board_todos(
+        test_client,
+        {
+            TodoStatusEnum.PENDING: 3,
+            TodoStatusEnum.IN_PROGRESS: 1,
+            TodoStatusEnum.COMPLETED: 2,
+        },
+    )
+
+    response = await test_client.get(
+        "/api/v1/todos/board", params={"limit": 1, "counts": "true"}
+    )
+
+    assert response.status_code == 200
+    columns = _columns(response.json())
+    assert {status: column["total"] for status, column in columns.items()} == {
+        "pending": 3,
+        "in_progress": 1,
+        "completed": 2,
+    }
+    assert all(len(column["todos"]) == 1 for column in columns.values())
+
+
+@pytest.mark.asyncio
+async def test_todo_board_selected_columns(test_client: AsyncClient):
+    """Test that status picks the board columns, in the requested order."""
+    await _create_board_todos(test_client, {TodoStatusEnum.PENDING: 1})
+
+    response = await test_client.get(
+        "/api/v1/todos/board", params=[("status", "completed"), ("status", "pending")]
+    )
+
+    assert response.status_code == 200
+    assert list(_columns(response.json())) == ["completed", "pending"]
+
+
+@pytest.mark.asyncio
+async def test_todo_board_cursor_for_missing_column(test_client: AsyncClient):
+    """Test that a cursor for a column outside the board is rejected."""
+    response = await test_client.get(
+        "/api/v1/todos/board",
+        params=[("status", "pending"), ("cursor", "completed:abc")],
+    )
+
+    assert response.status_code == 400
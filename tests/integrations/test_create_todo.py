@@ -1,7 +1,11 @@
 import pytest
-from pytest_steps import test_steps
+from datetime import datetime
 from httpx import AsyncClient
-from src.constants import TodoPriorityEnum
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.constants import TodoPriorityEnum, TodoStatusEnum
+from src.domain import TodoPriority, TodoStatus
+from src.repos import TodoRepository
 
 from tests.generator import generate_todo_create_data
 from tests.tools.response_helpers import assert_todo_response_structure
@@ -9,21 +13,14 @@ from tests.utils import assert_todo_content
 
 
 @pytest.mark.asyncio
-@test_steps(
-    "create_todo_with_minimal_data", "verify_response_structure", "verify_todo_created"
-)
 async def test_create_todo_with_minimal_data(test_client: AsyncClient):
     """Test creating a todo with only required fields."""
     todo_data = generate_todo_create_data(title="Minimal Todo")
 
     response = await test_client.post("/api/v1/todos", json=todo_data)
 
-    yield response
-
     assert response.status_code == 201
 
-    yield response
-
     response_data = response.json()
     assert_todo_response_structure(response_data)
     assert_todo_content(
@@ -32,7 +29,6 @@ async def test_create_todo_with_minimal_data(test_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-@test_steps("create_todo_with_all_fields", "verify_response_contains_all_data")
 async def test_create_todo_with_all_fields(test_client: AsyncClient):
     """Test creating a todo with all fields provided."""
     from tests.generator import generate_future_due_date
@@ -46,8 +42,6 @@ async def test_create_todo_with_all_fields(test_client: AsyncClient):
 
     response = await test_client.post("/api/v1/todos", json=todo_data)
 
-    yield response
-
     assert response.status_code == 201
 
     response_data = response.json()
@@ -63,7 +57,6 @@ async def test_create_todo_with_all_fields(test_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-@test_steps("create_todo_with_different_priorities", "verify_priority_assigned")
 async def test_create_todo_with_different_priorities(test_client: AsyncClient):
     """Test creating todos with different priority levels."""
     for priority in [
@@ -77,47 +70,103 @@ async def test_create_todo_with_different_priorities(test_client: AsyncClient):
 
         response = await test_client.post("/api/v1/todos", json=todo_data)
 
-        yield response
-
         assert response.status_code == 201
         response_data = response.json()
         assert response_data["priority"] == priority.value
 
 
 @pytest.mark.asyncio
-@test_steps("create_todo_with_invalid_data", "verify_error_response")
 async def test_create_todo_with_invalid_title(test_client: AsyncClient):
     """Test creating a todo with invalid title."""
     todo_data = generate_todo_create_data(title="")
 
     response = await test_client.post("/api/v1/todos", json=todo_data)
 
-    yield response
-
     assert response.status_code == 422
 
 
 @pytest.mark.asyncio
-@test_steps("create_todo_with_long_title", "verify_error_response")
 async def test_create_todo_with_title_too_long(test_client: AsyncClient):
     """Test creating a todo with title exceeding max length."""
     todo_data = generate_todo_create_data(title="a" * 201)
 
     response = await test_client.post("/api/v1/todos", json=todo_data)
 
-    yield response
-
     assert response.status_code == 422
 
 
 @pytest.mark.asyncio
-@test_steps("create_todo_without_title", "verify_error_response")
 async def test_create_todo_without_title(test_client: AsyncClient):
     """Test creating a todo without required title field."""
     todo_data = {"description": "Todo without title"}
 
     response = await test_client.post("/api/v1/todos", json=todo_data)
 
-    yield response
-
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_create_todo_timestamps_are_timezone_aware(test_client: AsyncClient):
+    """Test that created_at/updated_at come from the database clock, with a timezone."""
+    todo_data = generate_todo_create_data(title="Timestamped Todo")
+
+    response = await test_client.post("/api/v1/todos", json=todo_data)
+
+    assert response.status_code == 201
+    response_data = response.json()
+    created_at = datetime.fromisoformat(response_data["created_at"])
+    updated_at = datetime.fromisoformat(response_data["updated_at"])
+    assert created_at.tzinfo is not None
+    assert updated_at.tzinfo is not None
+    assert created_at == updated_at
+
+
+@pytest.mark.asyncio
+async def test_create_completed_todo_sets_completed_at(test_session: AsyncSession):
+    """Test that a todo created as completed gets completed_at in the same INSERT."""
+    repository = TodoRepository(test_session)
+
+    completed = await repository.create(
+        title="Done on creation", status=TodoStatusEnum.COMPLETED.value
+    )
+    pending = await repository.create(title="Still pending")
+
+    assert completed.status.value == TodoStatusEnum.COMPLETED.value
+    assert completed.completed_at is not None
+    assert completed.completed_at.tzinfo is not None
+    assert completed.completed_at == completed.created_at
+    assert pending.completed_at is None
+
+
+@pytest.mark.asyncio
+async def test_create_todo_with_unknown_status(
+    test_client: AsyncClient, test_session: AsyncSession
+):
+    """Test that a status missing from todo_statuses returns 400."""
+    await test_session.execute(
+        delete(TodoStatus).where(TodoStatus.value == TodoStatusEnum.PENDING.value)
+    )
+    todo_data = generate_todo_create_data(title="No status")
+
+    response = await test_client.post("/api/v1/todos", json=todo_data)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Status 'pending' not found"
+
+
+@pytest.mark.asyncio
+async def test_create_todo_with_unknown_priority(
+    test_client: AsyncClient, test_session: AsyncSession
+):
+    """Test that a priority missing from todo_priorities returns 400."""
+    await test_session.execute(
+        delete(TodoPriority).where(TodoPriority.value == TodoPriorityEnum.HIGH.value)
+    )
+    todo_data = generate_todo_create_data(
+        title="No priority", priority=TodoPriorityEnum.HIGH
+    )
+
+    response = await test_client.post("/api/v1/todos", json=todo_data)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Priority 'high' not found"
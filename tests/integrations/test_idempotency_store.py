@@ -0,0 +1,75 @@
+import pytest
+from contextlib import asynccontextmanager
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app import IdempotencyStore, StoredResponse
+from src.infra.cache import LRUCache
+from src.infra.metrics import MetricsRegistry
+from src.repos import IdempotencyRepository
+
+
+def make_store(
+    test_session: AsyncSession, lock_timeout_seconds: float, metrics=None
+) -> IdempotencyStore:
+    """A store over the test session, with its own cache like a separate worker."""
+
+    @asynccontextmanager
+    async def scope():
+        yield IdempotencyRepository(test_session)
+
+    return IdempotencyStore(
+        LRUCache(),
+        scope,
+        lock_timeout_seconds=lock_timeout_seconds,
+        metrics=metrics or MetricsRegistry(),
+    )
+
+
+def respond(reservation: StoredResponse, body: bytes) -> StoredResponse:
+    """Fill a reservation the way the middleware does after running the request."""
+    reservation.status_code = 201
+    reservation.headers = [("content-type", "application/json")]
+    reservation.body = body
+    return reservation
+
+
+@pytest.mark.asyncio
+async def test_expired_claim_does_not_overwrite_new_owner(test_session: AsyncSession):
+    """Test that a request whose claim expired and was re-claimed stores nothing."""
+    metrics = MetricsRegistry()
+    slow = make_store(test_session, lock_timeout_seconds=-1, metrics=metrics)
+    retry = make_store(test_session, lock_timeout_seconds=60)
+
+    stale = await slow.begin("key-1", "fingerprint")
+    owner = await retry.begin("key-1", "fingerprint")
+    await retry.finish("key-1", respond(owner, b"retry"))
+    await slow.finish("key-1", respond(stale, b"slow"))
+    await slow.abandon("key-1", stale)
+
+    record = await IdempotencyRepository(test_session).get("key-1")
+    replayed = await make_store(test_session, 60).begin("key-1", "fingerprint")
+
+    assert stale.locked_until != owner.locked_until
+    assert record.body == b"retry"
+    assert replayed.body == b"retry"
+    assert metrics.get("idempotency.lost") == 1
+    assert metrics.get("idempotency.stored") == 0
+
+
+@pytest.mark.asyncio
+async def test_complete_checks_fingerprint_and_claim(test_session: AsyncSession):
+    """Test that complete only updates the reservation it was given."""
+    repository = IdempotencyRepository(test_session)
+    locked_until = await repository.claim("key-2", "fingerprint", 60)
+
+    assert await repository.claim("key-2", "fingerprint", 60) is None
+    assert not await repository.complete(
+        "key-2", "other", locked_until, 201, [], b"", 60
+    )
+    assert await repository.complete(
+        "key-2", "fingerprint", locked_until, 201, [], b"done", 60
+    )
+    assert not await repository.complete(
+        "key-2", "fingerprint", locked_until, 201, [], b"again", 60
+    )
+    assert (await repository.get("key-2")).body == b"done"
@@ -1,6 +1,5 @@
 import pytest
 from uuid import UUID
-from pytest_steps import test_steps
 from httpx import AsyncClient
 from src.constants import TodoStatusEnum, TodoPriorityEnum
 
@@ -21,41 +20,22 @@ async def _create_test_todos(client: AsyncClient, count: int):
 
 
 @pytest.mark.asyncio
-@test_steps(
-    "create_test_todos",
-    "list_all_todos",
-    "verify_response_structure",
-    "verify_all_todos_returned",
-)
 async def test_list_all_todos(test_client: AsyncClient):
     """Test listing all todos."""
     created_ids = await _create_test_todos(test_client, 3)
 
-    yield created_ids
-
     response = await test_client.get("/api/v1/todos")
 
-    yield response
-
     assert response.status_code == 200
 
-    yield response
-
     response_data = response.json()
     assert_todo_list_response_structure(response_data)
 
-    yield response_data
-
     returned_ids = [UUID(todo["id"]) for todo in response_data["todos"]]
     assert len([tid for tid in created_ids if tid in returned_ids]) >= 3
 
 
 @pytest.mark.asyncio
-@test_steps(
-    "create_todos_with_different_statuses",
-    "filter_by_status",
-    "verify_filtered_results",
-)
 async def test_list_todos_filtered_by_status(test_client: AsyncClient):
     """Test listing todos filtered by status."""
     from tests.generator import generate_todo_update_data
@@ -67,27 +47,16 @@ async def test_list_todos_filtered_by_status(test_client: AsyncClient):
     update_data = generate_todo_update_data(status=TodoStatusEnum.IN_PROGRESS)
     await test_client.put(f"/api/v1/todos/{todo_id}", json=update_data)
 
-    yield todo_id
-
     response = await test_client.get("/api/v1/todos?status=in_progress")
 
-    yield response
-
     assert response.status_code == 200
 
-    yield response
-
     response_data = response.json()
     assert_todo_list_response_structure(response_data)
     assert all(todo["status"] == "in_progress" for todo in response_data["todos"])
 
 
 @pytest.mark.asyncio
-@test_steps(
-    "create_todos_with_different_priorities",
-    "filter_by_priority",
-    "verify_filtered_results",
-)
 async def test_list_todos_filtered_by_priority(test_client: AsyncClient):
     """Test listing todos filtered by priority."""
     todo_data = generate_todo_create_data(
@@ -95,37 +64,24 @@ async def test_list_todos_filtered_by_priority(test_client: AsyncClient):
     )
     await test_client.post("/api/v1/todos", json=todo_data)
 
-    yield todo_data
-
     response = await test_client.get("/api/v1/todos?priority=high")
 
-    yield response
-
     assert response.status_code == 200
 
-    yield response
-
     response_data = response.json()
     assert_todo_list_response_structure(response_data)
     assert all(todo["priority"] == "high" for todo in response_data["todos"])
 
 
 @pytest.mark.asyncio
-@test_steps("create_multiple_todos", "apply_pagination", "verify_pagination_works")
 async def test_list_todos_with_pagination(test_client: AsyncClient):
     """Test listing todos with pagination."""
     await _create_test_todos(test_client, 5)
 
-    yield None
-
     response = await test_client.get("/api/v1/todos?limit=2&offset=0")
 
-    yield response
-
     assert response.status_code == 200
 
-    yield response
-
     response_data = response.json()
     assert_todo_list_response_structure(response_data)
     assert response_data["limit"] == 2
@@ -134,7 +90,6 @@ async def test_list_todos_with_pagination(test_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-@test_steps("apply_combined_filters", "verify_filtered_and_paginated_results")
 async def test_list_todos_with_combined_filters(test_client: AsyncClient):
     """Test listing todos with combined filters."""
     from tests.generator import generate_todo_update_data
@@ -148,14 +103,10 @@ async def test_list_todos_with_combined_filters(test_client: AsyncClient):
     update_data = generate_todo_update_data(status=TodoStatusEnum.PENDING)
     await test_client.put(f"/api/v1/todos/{todo_id}", json=update_data)
 
-    yield todo_id
-
     response = await test_client.get(
         "/api/v1/todos?status=pending&priority=medium&limit=10"
     )
 
-    yield response
-
     assert response.status_code == 200
     response_data = response.json()
     assert_todo_list_response_structure(response_data)
@@ -0,0 +1,264 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants import TodoPriorityEnum, TodoStatusEnum
+from src.domain.todo import split_sort
+from src.repos import (
+    BaseTodoRepository,
+    InMemoryTodoRepository,
+    InMemoryTodoStore,
+    TodoRepository,
+)
+
+BACKENDS = ("memory", "sql", "sql_soft_delete")
+
+SORTS = (
+    "-created_at",
+    "created_at",
+    "priority",
+    "-priority",
+    "due_date",
+    "-due_date",
+    "updated_at",
+    "-updated_at",
+)
+
+NO_DUE_DATE = datetime.max.replace(tzinfo=timezone.utc)
+
+
+@pytest.fixture(params=BACKENDS)
+def repository(request) -> BaseTodoRepository:
+    """The same contract against the in-memory and the SQL backends.
+
+    Only the SQL params resolve test_session, so the in-memory run needs no database.
+    """
+    if request.param == "memory":
+        return InMemoryTodoRepository(InMemoryTodoStore())
+    test_session: AsyncSession = request.getfixturevalue("test_session")
+    return TodoRepository(
+        test_session,
+        soft_delete=request.param == "sql_soft_delete",
+        history_enabled=True,
+    )
+
+
+async def create_todos(repository: BaseTodoRepository) -> list:
+    """Create todos mixing statuses, priorities and (missing) due dates."""
+    base = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    items = [
+        {
+            "title": f"Todo {index}",
+            "status": status.value,
+            "priority": priority.value,
+            "due_date": None if index % 3 == 0 else base + timedelta(days=index % 4),
+        }
+        for index, (status, priority) in enumerate(
+            (status, priority)
+            for status in TodoStatusEnum
+            for priority in TodoPriorityEnum
+        )
+    ]
+    todos = [await repository.create(**item) for item in items]
+    await repository.commit()
+    return todos
+
+
+def expected_order(todos: list, sort: str) -> list:
+    """Ids in the order the sort keys define, with no due date last."""
+    sort_field, descending = split_sort(sort)
+
+    def key(todo):
+        return tuple(
+            NO_DUE_DATE if value is None and sort_field == "due_date" else value
+            for value in todo.sort_values(sort_field)
+        )
+
+    return [todo.id for todo in sorted(todos, key=key, reverse=descending)]
+
+
+async def read_pages(repository: BaseTodoRepository, sort: str, **filters) -> list:
+    """Walk get_all two rows at a time, following the keyset cursor."""
+    sort_field, _ = split_sort(sort)
+    ids, after = [], None
+    while True:
+        page = await repository.get_all(limit=2, sort=sort, after=after, **filters)
+        ids.extend(todo.id for todo in page)
+        if len(page) < 2:
+            return ids
+        after = page[-1].sort_values(sort_field)
+
+
+@pytest.mark.asyncio
+async def test_create_and_get(repository: BaseTodoRepository):
+    """Test that a created todo is read back by id and in batches."""
+    todo = await repository.create(
+        title="Contract", priority=TodoPriorityEnum.HIGH.value
+    )
+    other = await repository.create(title="Other")
+    await repository.commit()
+
+    found = await repository.get_by_id(todo.id)
+    many = await repository.get_many([todo.id, other.id])
+
+    assert found.title == "Contract"
+    assert found.priority.value == TodoPriorityEnum.HIGH.value
+    assert found.status.value == TodoStatusEnum.PENDING.value
+    assert {item.id for item in many} == {todo.id, other.id}
+
+
+@pytest.mark.asyncio
+async def test_filters_and_counts(repository: BaseTodoRepository):
+    """Test status/priority filters, count and count_by_status."""
+    todos = await create_todos(repository)
+    pending = [t for t in todos if t.status.value == TodoStatusEnum.PENDING.value]
+    high_pending = [
+        t for t in pending if t.priority.value == TodoPriorityEnum.HIGH.value
+    ]
+
+    listed = await repository.get_all(status=TodoStatusEnum.PENDING.value)
+    by_status = await repository.count_by_status()
+
+    assert {todo.id for todo in listed} == {todo.id for todo in pending}
+    assert await repository.count() == len(todos)
+    assert await repository.count(
+        status=TodoStatusEnum.PENDING.value,
+        priority=TodoPriorityEnum.HIGH.value,
+    ) == len(high_pending)
+    for status in TodoStatusEnum:
+        assert by_status.get(status.value, 0) == len(
+            [t for t in todos if t.status.value == status.value]
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort", SORTS)
+async def test_sort_keysets(repository: BaseTodoRepository, sort: str):
+    """Test that every ordering pages through all rows once, in order."""
+    todos = await create_todos(repository)
+
+    full = await repository.get_all(limit=100, sort=sort)
+
+    assert [todo.id for todo in full] == expected_order(todos, sort)
+    assert await read_pages(repository, sort) == expected_order(todos, sort)
+
+
+@pytest.mark.asyncio
+async def test_sort_keyset_with_filter(repository: BaseTodoRepository):
+    """Test keyset pages combined with a status filter."""
+    todos = await create_todos(repository)
+    done = [t for t in todos if t.status.value == TodoStatusEnum.COMPLETED.value]
+
+    ids = await read_pages(
+        repository, "-priority", status=TodoStatusEnum.COMPLETED.value
+    )
+
+    assert ids == expected_order(done, "-priority")
+
+
+@pytest.mark.asyncio
+async def test_board_pages_each_column(repository: BaseTodoRepository):
+    """Test that get_board returns limit rows per status, each after its cursor."""
+    todos = await create_todos(repository)
+    statuses = [status.value for status in TodoStatusEnum]
+    columns = {
+        status: expected_order(
+            [t for t in todos if t.status.value == status], "-priority"
+        )
+        for status in statuses
+    }
+
+    first = await repository.get_board(statuses, limit=2, sort="-priority")
+    after = {status: page[-1].sort_values("priority") for status, page in first.items()}
+    second = await repository.get_board(
+        statuses, limit=2, sort="-priority", after=after
+    )
+
+    for status in statuses:
+        assert [todo.id for todo in first[status]] == columns[status][:2]
+        assert [todo.id for todo in second[status]] == columns[status][2:4]
+
+
+@pytest.mark.asyncio
+async def test_board_with_unknown_status(repository: BaseTodoRepository):
+    """Test that an unknown status on the board is an error."""
+    with pytest.raises(ValueError):
+        await repository.get_board(["unknown"], limit=2)
+
+
+@pytest.mark.asyncio
+async def test_changes_and_tombstones(repository: BaseTodoRepository):
+    """Test the (updated_at, id) changes feed, deletes and purges."""
+    until = datetime.now(timezone.utc) + timedelta(minutes=1)
+    todos = [await repository.create(title=f"Change {i}") for i in range(3)]
+    await repository.commit()
+
+    first, _ = await repository.get_changes(None, until, limit=2)
+    cursor = (first[-1].updated_at, first[-1].id)
+    rest, _ = await repository.get_changes(cursor, until, limit=2)
+
+    assert [todo.id for todo in first + rest] == [todo.id for todo in todos]
+
+    deleted = await repository.delete(todos[0].id)
+    await repository.commit()
+    live, tombstones = await repository.get_changes(None, until, limit=10)
+
+    assert deleted.id == todos[0].id
+    assert await repository.get_by_id(todos[0].id) is None
+    assert await repository.delete(todos[0].id) is None
+    assert todos[0].id not in {todo.id for todo in await repository.get_all()}
+    assert [todo.id for todo in live] == [todo.id for todo in todos[1:]]
+    assert [tombstone.id for tombstone in tombstones] == [todos[0].id]
+
+    await repository.purge_deleted(limit=10)
+    await repository.commit()
+    live, tombstones = await repository.get_changes(None, until, limit=10)
+
+    assert [todo.id for todo in live] == [todo.id for todo in todos[1:]]
+    assert [tombstone.id for tombstone in tombstones] == [todos[0].id]
+    assert await repository.purge_deleted(limit=10) == 0
+
+
+@pytest.mark.asyncio
+async def test_history(repository: BaseTodoRepository):
+    """Test that recorded changes are read back newest first, by keyset."""
+    todo = await repository.create(title="Tracked")
+    await repository.record_history([todo], "create")
+    before = todo.to_snapshot()
+    todo.title = "Renamed"
+    await repository.save(todo)
+    await repository.record_history([todo], "update", before=[before])
+    await repository.commit()
+
+    await repository.relay_history(limit=10)
+    await repository.commit()
+    entries = await repository.get_history(todo.id, limit=10)
+    older = await repository.get_history(todo.id, limit=10, before_id=entries[0].id)
+
+    assert [entry.operation for entry in entries] == ["update", "create"]
+    assert entries[0].before["title"] == "Tracked"
+    assert entries[0].after["title"] == "Renamed"
+    assert [entry.id for entry in older] == [entries[1].id]
+    assert await repository.relay_history(limit=10) == 0
+
+
+@pytest.mark.asyncio
+async def test_prune_tombstones(repository: BaseTodoRepository):
+    """Test that only tombstones older than the cutoff are pruned, limit at a time."""
+    todos = [await repository.create(title=f"Pruned {i}") for i in range(3)]
+    await repository.commit()
+    for todo in todos:
+        await repository.delete(todo.id)
+    await repository.purge_deleted(limit=10)
+    await repository.commit()
+    now = datetime.now(timezone.utc)
+    until = now + timedelta(minutes=1)
+
+    kept = await repository.prune_tombstones(now - timedelta(days=1), limit=10)
+    first = await repository.prune_tombstones(until, limit=2)
+    rest = await repository.prune_tombstones(until, limit=2)
+    await repository.commit()
+    _, tombstones = await repository.get_changes(None, until, limit=10)
+
+    assert (kept, first, rest) == (0, 2, 1)
+    assert tombstones == []
@@ -0,0 +1,13 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_todo_events_unavailable_without_change_notifications(
+    test_client: AsyncClient,
+):
+    """Test that the SQL backend refuses the event stream without LISTEN/NOTIFY."""
+    response = await test_client.get("/api/v1/todos/events")
+
+    assert response.status_code == 503
+    assert "CHANGE_NOTIFICATIONS_ENABLED" in response.json()["detail"]
@@ -1,5 +1,4 @@
 import pytest
-from pytest_steps import test_steps
 from httpx import AsyncClient
 from src.constants import TodoStatusEnum, TodoPriorityEnum
 
@@ -34,17 +33,12 @@ async def _create_todos_with_statuses(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-@test_steps("get_stats_with_no_todos", "verify_empty_stats")
 async def test_get_todo_stats_empty(test_client: AsyncClient):
     """Test getting stats when there are no todos."""
     response = await test_client.get("/api/v1/todos/stats")
 
-    yield response
-
     assert response.status_code == 200
 
-    yield response
-
     response_data = response.json()
     assert_todo_stats_response_structure(response_data)
     assert response_data["total"] == 0
@@ -54,23 +48,14 @@ async def test_get_todo_stats_empty(test_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-@test_steps(
-    "create_todos_with_different_statuses", "get_stats", "verify_correct_counts"
-)
 async def test_get_todo_stats_with_todos(test_client: AsyncClient):
     """Test getting stats with todos in different statuses."""
     await _create_todos_with_statuses(test_client)
 
-    yield None
-
     response = await test_client.get("/api/v1/todos/stats")
 
-    yield response
-
     assert response.status_code == 200
 
-    yield response
-
     response_data = response.json()
     assert_todo_stats_response_structure(response_data)
     assert response_data["total"] >= 4
@@ -80,22 +65,15 @@ async def test_get_todo_stats_with_todos(test_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-@test_steps("create_single_todo", "get_stats", "verify_counts")
 async def test_get_todo_stats_single_todo(test_client: AsyncClient):
     """Test getting stats with a single todo."""
     todo_data = generate_todo_create_data(title="Single Todo Stats")
     await test_client.post("/api/v1/todos", json=todo_data)
 
-    yield None
-
     response = await test_client.get("/api/v1/todos/stats")
 
-    yield response
-
     assert response.status_code == 200
 
-    yield response
-
     response_data = response.json()
     assert_todo_stats_response_structure(response_data)
     assert response_data["total"] >= 1
@@ -103,7 +81,6 @@ async def test_get_todo_stats_single_todo(test_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-@test_steps("create_and_complete_todos", "get_stats", "verify_completion_counts")
 async def test_get_todo_stats_after_completions(test_client: AsyncClient):
     """Test getting stats after completing some todos."""
     await _create_todos_with_statuses(test_client)
@@ -116,16 +93,10 @@ async def test_get_todo_stats_after_completions(test_client: AsyncClient):
         update_data = generate_todo_update_data(status=TodoStatusEnum.COMPLETED)
         await test_client.put(f"/api/v1/todos/{pending_todo['id']}", json=update_data)
 
-    yield None
-
     response = await test_client.get("/api/v1/todos/stats")
 
-    yield response
-
     assert response.status_code == 200
 
-    yield response
-
     response_data = response.json()
     assert_todo_stats_response_structure(response_data)
     assert response_data["completed"] >= 1
@@ -0,0 +1,3 @@
+from .fake_redis_server import FakeRedisServer
+
+__all__ = ["FakeRedisServer"]
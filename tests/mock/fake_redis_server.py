@@ -0,0 +1,73 @@
+import asyncio
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from src.infra.cache.redis_cache import read_reply
+
+
+class FakeRedisServer:
+    """Servidor local que implementa GET/SET/DEL do protocolo Redis para testes"""
+
+    def __init__(self):
+        self.data: Dict[bytes, Tuple[float, bytes]] = {}
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.reply_delay = 0.0
+        self._handlers: Set[asyncio.Task] = set()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"redis://{host}:{port}/0"
+
+    async def start(self) -> "FakeRedisServer":
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def stop(self) -> None:
+        self.server.close()
+        for handler in self._handlers:
+            handler.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        try:
+            while True:
+                command = await read_reply(reader)
+                reply = self._execute(command)
+                if self.reply_delay:
+                    await asyncio.sleep(self.reply_delay)
+                writer.write(reply)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+        finally:
+            self._handlers.discard(handler)
+
+    def _execute(self, command) -> bytes:
+        name, args = command[0].upper(), command[1:]
+        if name == b"GET":
+            expires_at, value = self.data.get(args[0], (0, None))
+            if value is None or expires_at < time.monotonic():
+                return b"$-1\r\n"
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        if name == b"SET":
+            options = [option.upper() for option in args[2:]]
+            ttl = float("inf")
+            if b"PX" in options:
+                ttl = int(options[options.index(b"PX") + 1]) / 1000
+            if b"NX" in options and self._alive(args[0]):
+                return b"$-1\r\n"
+            self.data[args[0]] = (time.monotonic() + ttl, args[1])
+            return b"+OK\r\n"
+        if name == b"DEL":
+            removed = sum(self.data.pop(key, None) is not None for key in args)
+            return b":%d\r\n" % removed
+        return b"-ERR unknown command\r\n"
+
+    def _alive(self, key: bytes) -> bool:
+        """Indica se a chave existe e não expirou"""
+        expires_at, value = self.data.get(key, (0, None))
+        return value is not None and expires_at >= time.monotonic()
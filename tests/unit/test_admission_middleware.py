@@ -0,0 +1,113 @@
+import asyncio
+import pytest
+
+from src.api.middlewares import AdmissionMiddleware, route_priority
+from src.infra.admission import AdmissionController, AdmissionRejected
+from src.infra.metrics import MetricsRegistry
+
+TODO_ID = "3f2b8c1e-5d4a-4e7b-9c2d-1a2b3c4d5e6f"
+
+
+async def _call(middleware, method="GET", path="/api/v1/todos"):
+    """Executa o middleware e retorna as mensagens enviadas ao servidor"""
+    messages = []
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, None, send)
+    return messages
+
+
+class TestAdmissionController:
+    """Testes para o AdmissionController"""
+
+    @pytest.mark.asyncio
+    async def test_queue_is_served_by_priority(self):
+        """Testa que a vaga liberada vai para o request mais urgente da fila"""
+        controller = AdmissionController(1, metrics=MetricsRegistry())
+        await controller.acquire(1)
+        served = []
+
+        async def wait(priority):
+            await controller.acquire(priority)
+            served.append(priority)
+            controller.release()
+
+        waiters = [asyncio.ensure_future(wait(p)) for p in (1, 0, 1)]
+        await asyncio.sleep(0)
+        controller.release()
+        await asyncio.gather(*waiters)
+
+        assert served == [0, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_or_sheds(self):
+        """Testa que a fila cheia recusa o menos urgente e abre espaço ao mais urgente"""
+        metrics = MetricsRegistry()
+        controller = AdmissionController(1, max_queue_size=1, metrics=metrics)
+        await controller.acquire(0)
+        low = asyncio.ensure_future(controller.acquire(1))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected):
+            await controller.acquire(1)
+
+        high = asyncio.ensure_future(controller.acquire(0))
+        await asyncio.sleep(0)
+        controller.release()
+        await high
+
+        with pytest.raises(AdmissionRejected):
+            await low
+        assert metrics.get("admission.rejected") == 1
+        assert metrics.get("admission.shed") == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_rejects_and_leaves_queue(self):
+        """Testa que a espera acima do timeout recusa o request e sai da fila"""
+        metrics = MetricsRegistry()
+        controller = AdmissionController(1, queue_timeout=0.01, metrics=metrics)
+        await controller.acquire(0)
+
+        with pytest.raises(AdmissionRejected):
+            await controller.acquire(0)
+
+        assert metrics.snapshot()["admission.queue_depth"] == 0
+        assert metrics.get("admission.timeouts") == 1
+
+
+class TestAdmissionMiddleware:
+    """Testes para o AdmissionMiddleware"""
+
+    def test_route_priority(self):
+        """Testa escritas e busca por ID como urgentes e rotas isentas"""
+        assert route_priority("POST", "/api/v1/todos") == 0
+        assert route_priority("GET", f"/api/v1/todos/{TODO_ID}") == 0
+        assert route_priority("GET", "/api/v1/todos/stats") == 1
+        assert route_priority("GET", "/api/v1/todos") == 1
+        assert route_priority("GET", "/api/v1/todos/events") is None
+        assert route_priority("GET", "/metrics") is None
+
+    @pytest.mark.asyncio
+    async def test_overload_returns_503_with_retry_after(self):
+        """Testa a recusa imediata com 503 e Retry-After quando não há vaga"""
+        controller = AdmissionController(1, max_queue_size=0, metrics=MetricsRegistry())
+        calls = []
+
+        async def app(scope, receive, send):
+            calls.append(scope["path"])
+
+        middleware = AdmissionMiddleware(app, controller, retry_after_seconds=2)
+        await controller.acquire(0)
+
+        start, _ = await _call(middleware)
+        await _call(middleware, path="/metrics")
+        controller.release()
+        await _call(middleware)
+
+        assert start["status"] == 503
+        assert (b"retry-after", b"2") in start["headers"]
+        assert calls == ["/metrics", "/api/v1/todos"]
+        assert controller._active == 0
@@ -0,0 +1,80 @@
+import pytest
+
+from src.app import TodoCache, TodoService
+from src.infra.cache import LRUCache
+from src.infra.change_bus import ChangeBus, RESET_EVENT
+from src.infra.database.change_listener import to_asyncpg_dsn
+from src.infra.metrics import MetricsRegistry
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+class TestChangeNotifications:
+    """Testes para o ChangeBus e a invalidação de caches por evento"""
+
+    @pytest.mark.asyncio
+    async def test_writes_publish_change_events(self):
+        """Testa que create/update/delete publicam eventos com id e operação"""
+        bus, events = ChangeBus(), []
+
+        async def collect(event):
+            events.append(event)
+
+        bus.subscribe(collect)
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore(), bus))
+
+        todo = await service.create_todo(title="Task", priority="high")
+        await service.update_todo(todo.id, status="completed")
+        await service.delete_todo(todo.id)
+
+        assert [event["op"] for event in events] == ["create", "update", "delete"]
+        assert all(event["id"] == str(todo.id) for event in events)
+        assert events[1]["status"] == "completed"
+        assert events[1]["priority"] == "high"
+
+    @pytest.mark.asyncio
+    async def test_failing_subscriber_does_not_block_others(self):
+        """Testa que a falha de um assinante não impede os demais"""
+        bus, received = ChangeBus(), []
+
+        async def failing(event):
+            raise RuntimeError("boom")
+
+        async def collect(event):
+            received.append(event)
+
+        bus.subscribe(failing)
+        bus.subscribe(collect)
+        await bus.publish({"op": "create", "id": None})
+
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_remote_change_invalidates_local_cache(self):
+        """Testa que um evento de outro worker remove a entrada do cache local"""
+        store, metrics = InMemoryTodoStore(), MetricsRegistry()
+        cache = TodoCache(LRUCache(metrics=metrics), metrics=metrics)
+        service = TodoService(InMemoryTodoRepository(store), cache=cache)
+        todo = await service.create_todo(title="Original")
+        await service.get_todo_by_id(todo.id)
+
+        todo.title = "Changed elsewhere"
+        await cache.handle_change({"op": "update", "id": str(todo.id)})
+
+        assert (await service.get_todo_by_id(todo.id)).title == "Changed elsewhere"
+
+    @pytest.mark.asyncio
+    async def test_reset_event_clears_local_cache(self):
+        """Testa que o evento de reset (reconexão) esvazia o cache local"""
+        backend = LRUCache(metrics=MetricsRegistry())
+        cache = TodoCache(backend, metrics=MetricsRegistry())
+        await backend.set("todo:1", "{}")
+
+        await cache.handle_change(RESET_EVENT)
+
+        assert len(backend) == 0
+
+    def test_asyncpg_dsn_from_sqlalchemy_url(self):
+        """Testa a conversão da DATABASE_URL para DSN do asyncpg"""
+        dsn = to_asyncpg_dsn("postgresql+asyncpg://user:secret@db:5432/app")
+
+        assert dsn == "postgresql://user:secret@db:5432/app"
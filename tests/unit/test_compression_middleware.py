@@ -0,0 +1,100 @@
+import gzip
+import zlib
+import pytest
+
+from src.api.middlewares import CompressionMiddleware
+from src.infra.compression import negotiate_encoding
+from src.infra.metrics import MetricsRegistry
+
+
+def _app(chunks, content_type=b"application/json"):
+    """App ASGI que responde com os pedaços informados (streaming se mais de um)"""
+
+    async def app(scope, receive, send):
+        headers = [(b"content-type", content_type)]
+        if len(chunks) == 1:
+            headers.append((b"content-length", str(len(chunks[0])).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        for index, chunk in enumerate(chunks):
+            more_body = index < len(chunks) - 1
+            await send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+
+    return app
+
+
+async def _call(middleware, accept_encoding=b"gzip"):
+    """Executa o middleware e retorna as mensagens enviadas ao servidor"""
+    messages = []
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding)]}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, None, send)
+    return messages
+
+
+class TestCompressionMiddleware:
+    """Testes para o CompressionMiddleware"""
+
+    def test_negotiation_respects_quality_values(self):
+        """Testa a escolha pelo maior q, com empate pela ordem do servidor"""
+        supported = ["zstd", "br", "gzip"]
+
+        assert negotiate_encoding("gzip, br", supported) == "br"
+        assert negotiate_encoding("br;q=0.5, gzip;q=0.9", supported) == "gzip"
+        assert negotiate_encoding("*", supported) == "zstd"
+        assert negotiate_encoding("gzip;q=0, identity", supported) is None
+
+    @pytest.mark.asyncio
+    async def test_large_body_is_compressed(self):
+        """Testa gzip acima do mínimo, com Content-Length e Vary ajustados"""
+        body = b'{"todos": [' + b'{"title": "todo"},' * 200 + b"{}]}"
+        metrics = MetricsRegistry()
+        middleware = CompressionMiddleware(
+            _app([body]), encodings=["gzip"], minimum_size=1024, metrics=metrics
+        )
+
+        start, message = await _call(middleware)
+        headers = dict(start["headers"])
+
+        assert headers[b"content-encoding"] == b"gzip"
+        assert headers[b"vary"] == b"Accept-Encoding"
+        assert int(headers[b"content-length"]) == len(message["body"])
+        assert gzip.decompress(message["body"]) == body
+        assert 0 < metrics.snapshot()["compression.ratio"] < 1
+
+    @pytest.mark.asyncio
+    async def test_small_body_and_binary_types_pass_through(self):
+        """Testa que corpos pequenos e tipos não textuais seguem intactos"""
+        small = CompressionMiddleware(
+            _app([b"{}"]), encodings=["gzip"], metrics=MetricsRegistry()
+        )
+        binary = CompressionMiddleware(
+            _app([b"x" * 4096], b"image/png"),
+            encodings=["gzip"],
+            metrics=MetricsRegistry(),
+        )
+
+        for middleware in (small, binary):
+            start, _ = await _call(middleware)
+            assert b"content-encoding" not in dict(start["headers"])
+
+    @pytest.mark.asyncio
+    async def test_streaming_chunks_are_flushed(self):
+        """Testa que cada pedaço de um stream é decodificável ao chegar"""
+        chunks = [b"event: create\ndata: {}\n\n", b": keep-alive\n\n", b""]
+        middleware = CompressionMiddleware(
+            _app(chunks, b"text/event-stream"),
+            encodings=["gzip"],
+            metrics=MetricsRegistry(),
+        )
+
+        start, *bodies = await _call(middleware)
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        assert b"content-length" not in dict(start["headers"])
+        for chunk, message in zip(chunks, bodies):
+            assert decoder.decompress(message["body"]) == chunk
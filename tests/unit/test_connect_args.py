@@ -0,0 +1,26 @@
+from src.infra.database.connection import connect_args, unique_statement_name
+
+
+class TestConnectArgs:
+    """Testes para os argumentos de conexão do asyncpg"""
+
+    def test_direct_connection_keeps_asyncpg_defaults(self):
+        """Testa que a conexão direta só ajusta o cache de statements"""
+        assert connect_args(pgbouncer=False, statement_cache_size=250) == {
+            "prepared_statement_cache_size": 250
+        }
+
+    def test_pgbouncer_uses_unique_names_and_keeps_cache(self):
+        """Testa que o modo PgBouncer troca os nomes sem desligar o cache"""
+        args = connect_args(pgbouncer=True, statement_cache_size=100)
+
+        assert args["prepared_statement_cache_size"] == 100
+        assert args["statement_cache_size"] == 0
+        assert args["prepared_statement_name_func"] is unique_statement_name
+
+    def test_statement_names_do_not_repeat(self):
+        """Testa que cada prepared statement recebe um nome novo"""
+        names = {unique_statement_name() for _ in range(100)}
+
+        assert len(names) == 100
+        assert all(name.startswith("__asyncpg_") for name in names)
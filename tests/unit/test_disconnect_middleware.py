@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+
+from src.api.middlewares import DisconnectCancelMiddleware
+from src.infra.metrics import MetricsRegistry
+
+
+def _receive(disconnect_after: float):
+    """receive ASGI que entrega o corpo e depois um disconnect atrasado"""
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.sleep(disconnect_after)
+        return {"type": "http.disconnect"}
+
+    return receive
+
+
+async def _send(message):
+    """send ASGI que descarta as mensagens"""
+
+
+class TestDisconnectCancelMiddleware:
+    """Testes para o DisconnectCancelMiddleware"""
+
+    @pytest.mark.asyncio
+    async def test_handler_is_cancelled_when_client_disconnects(self):
+        """Testa que a desconexão cancela a consulta em andamento"""
+        metrics, events = MetricsRegistry(), []
+
+        async def app(scope, receive, send):
+            await receive()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                events.append("cancelled")
+                raise
+
+        middleware = DisconnectCancelMiddleware(app, metrics=metrics)
+        await asyncio.wait_for(
+            middleware({"type": "http"}, _receive(0.01), _send), timeout=1
+        )
+
+        assert events == ["cancelled"]
+        assert metrics.get("requests.cancelled_on_disconnect") == 1
+
+    @pytest.mark.asyncio
+    async def test_cleanup_after_response_is_not_cancelled(self):
+        """Testa que o disconnect depois da resposta completa não interrompe a limpeza"""
+        metrics, events = MetricsRegistry(), []
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+            await asyncio.sleep(0.05)
+            events.append("cleaned up")
+
+        middleware = DisconnectCancelMiddleware(app, metrics=metrics)
+        await middleware({"type": "http"}, _receive(0.01), _send)
+
+        assert events == ["cleaned up"]
+        assert metrics.get("requests.cancelled_on_disconnect") == 0
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import pytest
+
+from src.api.middlewares import IdempotencyMiddleware
+from src.app import IdempotencyKeyInProgress, IdempotencyStore, StoredResponse
+from src.infra.cache import LRUCache, RedisCache
+from src.infra.metrics import MetricsRegistry
+from tests.mock import FakeRedisServer
+
+
+def build_app(calls, status_code=201, release=None):
+    """App ASGI que conta as chamadas e ecoa o corpo recebido"""
+
+    async def app(scope, receive, send):
+        message = await receive()
+        calls.append(message["body"])
+        if release is not None:
+            await release.wait()
+        body = json.dumps({"call": len(calls), "echo": message["body"].decode()})
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": body.encode()})
+
+    return app
+
+
+async def call(app, body=b'{"title": "Todo"}', key="key-1", path="/api/v1/todos"):
+    """Executa um POST e devolve status, headers e corpo da resposta"""
+    headers = [(b"content-type", b"application/json")]
+    if key is not None:
+        headers.append((b"idempotency-key", key.encode()))
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": path,
+        "query_string": b"",
+        "headers": headers,
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    start, response_body = sent[0], b"".join(m.get("body", b"") for m in sent[1:])
+    return start["status"], dict(start["headers"]), response_body
+
+
+class TestIdempotencyMiddleware:
+    """Testes para o suporte a Idempotency-Key"""
+
+    @pytest.mark.asyncio
+    async def test_retry_replays_stored_response(self):
+        """Testa que o retry recebe a mesma resposta sem executar o app de novo"""
+        metrics = MetricsRegistry()
+        calls = []
+        app = IdempotencyMiddleware(
+            build_app(calls), IdempotencyStore(LRUCache(), metrics=metrics)
+        )
+
+        first = await call(app)
+        retry = await call(app)
+
+        assert len(calls) == 1
+        assert retry[0] == first[0] == 201
+        assert retry[2] == first[2]
+        assert retry[1][b"idempotent-replayed"] == b"true"
+        assert b"idempotent-replayed" not in first[1]
+        assert metrics.get("idempotency.replayed") == 1
+
+    @pytest.mark.asyncio
+    async def test_same_key_with_other_body_is_rejected(self):
+        """Testa que a mesma chave com outro corpo responde 422"""
+        calls = []
+        app = IdempotencyMiddleware(build_app(calls), IdempotencyStore(LRUCache()))
+
+        await call(app)
+        status, _, _ = await call(app, body=b'{"title": "Other"}')
+
+        assert status == 422
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_retry_gets_conflict(self):
+        """Testa que um retry enquanto o primeiro executa responde 409"""
+        calls = []
+        release = asyncio.Event()
+        app = IdempotencyMiddleware(
+            build_app(calls, release=release), IdempotencyStore(LRUCache())
+        )
+
+        first = asyncio.create_task(call(app))
+        await asyncio.sleep(0)
+        status, headers, _ = await call(app)
+        release.set()
+        await first
+
+        assert status == 409
+        assert headers[b"retry-after"] == b"1"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_workers_sharing_redis_claim_the_key_once(self):
+        """Testa que dois workers no mesmo Redis não reservam a mesma chave"""
+        server = await FakeRedisServer().start()
+        caches = [RedisCache(server.url), RedisCache(server.url)]
+        stores = [IdempotencyStore(cache) for cache in caches]
+
+        results = await asyncio.gather(
+            *(store.begin("key-1", "fingerprint") for store in stores),
+            return_exceptions=True,
+        )
+
+        assert (
+            sum(isinstance(r, StoredResponse) and not r.completed for r in results) == 1
+        )
+        assert sum(isinstance(r, IdempotencyKeyInProgress) for r in results) == 1
+
+        for cache in caches:
+            await cache.close()
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_server_error_is_not_stored(self):
+        """Testa que uma resposta 5xx libera a chave para o retry executar de novo"""
+        calls = []
+        app = IdempotencyMiddleware(
+            build_app(calls, status_code=503), IdempotencyStore(LRUCache())
+        )
+
+        await call(app)
+        status, headers, _ = await call(app)
+
+        assert status == 503
+        assert b"idempotent-replayed" not in headers
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_requests_without_key_pass_through(self):
+        """Testa que sem o header (ou fora de /api/) nada é guardado"""
+        calls = []
+        app = IdempotencyMiddleware(build_app(calls), IdempotencyStore(LRUCache()))
+
+        await call(app, key=None)
+        await call(app, key=None)
+        await call(app, path="/other")
+        await call(app, path="/other")
+
+        assert len(calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_key_too_long(self):
+        """Testa que uma chave acima de 255 caracteres responde 400"""
+        calls = []
+        app = IdempotencyMiddleware(build_app(calls), IdempotencyStore(LRUCache()))
+
+        status, _, _ = await call(app, key="k" * 256)
+
+        assert status == 400
+        assert calls == []
@@ -0,0 +1,89 @@
+import pytest
+from datetime import timedelta
+from uuid import uuid4
+
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+async def _create_todos(repository: InMemoryTodoRepository, count: int) -> list:
+    """Cria TODOs com created_at estritamente crescente"""
+    todos = []
+    for index in range(count):
+        todo = await repository.create(
+            title=f"Todo {index}", priority=["low", "medium", "high"][index % 3]
+        )
+        todo.created_at = todo.created_at + timedelta(seconds=index)
+        await repository.save(todo)
+        todos.append(todo)
+    return todos
+
+
+class TestInMemoryTodoRepository:
+    """Testes para o InMemoryTodoRepository"""
+
+    @pytest.mark.asyncio
+    async def test_create_and_get_by_id(self):
+        """Testa criação e busca por ID"""
+        repository = InMemoryTodoRepository(InMemoryTodoStore())
+
+        todo = await repository.create(title="Task", priority="high")
+
+        found = await repository.get_by_id(todo.id)
+        assert found is todo
+        assert found.status.value == "pending"
+        assert found.priority.value == "high"
+        assert await repository.get_by_id(uuid4()) is None
+
+    @pytest.mark.asyncio
+    async def test_create_with_unknown_priority(self):
+        """Testa erro ao criar TODO com prioridade inexistente"""
+        repository = InMemoryTodoRepository(InMemoryTodoStore())
+
+        with pytest.raises(ValueError):
+            await repository.create(title="Task", priority="urgent")
+
+    @pytest.mark.asyncio
+    async def test_get_all_orders_by_created_at_desc_with_pagination(self):
+        """Testa ordenação por created_at DESC com limit/offset"""
+        repository = InMemoryTodoRepository(InMemoryTodoStore())
+        todos = await _create_todos(repository, 5)
+
+        page = await repository.get_all(limit=2, offset=1)
+
+        assert [todo.title for todo in page] == ["Todo 3", "Todo 2"]
+        assert len(await repository.get_all()) == len(todos)
+
+    @pytest.mark.asyncio
+    async def test_get_all_with_filters(self):
+        """Testa filtros por status e prioridade usando os índices"""
+        repository = InMemoryTodoRepository(InMemoryTodoStore())
+        todos = await _create_todos(repository, 6)
+        todos[5].status = await repository.get_status_by_value("completed")
+        await repository.save(todos[5])
+
+        high = await repository.get_all(priority="high")
+        completed_high = await repository.get_all(status="completed", priority="high")
+        unknown = await repository.get_all(status="archived")
+
+        assert [todo.title for todo in high] == ["Todo 5", "Todo 2"]
+        assert [todo.title for todo in completed_high] == ["Todo 5"]
+        assert len(unknown) == 6
+        assert await repository.count(status="completed") == 1
+        assert await repository.count(status="pending", priority="high") == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_from_indexes(self):
+        """Testa remoção do TODO e das entradas de índice"""
+        store = InMemoryTodoStore()
+        repository = InMemoryTodoRepository(store)
+        todos = await _create_todos(repository, 3)
+
+        assert await repository.delete(todos[1].id) is todos[1]
+        assert await repository.delete(todos[1].id) is None
+
+        assert await repository.count() == 2
+        assert todos[1].id not in store.by_priority["medium"]
+        assert [todo.title for todo in await repository.get_all()] == [
+            "Todo 2",
+            "Todo 0",
+        ]
@@ -0,0 +1,101 @@
+import asyncio
+import pytest
+
+from src.app import SingleFlight
+from src.infra.metrics import MetricsRegistry
+
+
+def _counting_loader(calls: list, result="value", delay: float = 0.01):
+    """Cria um loader assíncrono que registra quantas vezes foi executado"""
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return result
+
+    return load
+
+
+class TestSingleFlight:
+    """Testes para o SingleFlight"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Testa que chamadas concorrentes com a mesma chave executam uma vez"""
+        metrics, calls = MetricsRegistry(), []
+        single_flight = SingleFlight(["get_todo_stats"], metrics=metrics)
+        load = _counting_loader(calls)
+
+        results = await asyncio.gather(
+            *(single_flight.do("get_todo_stats", None, load) for _ in range(5))
+        )
+
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+        assert single_flight.coalescing_ratio("get_todo_stats") == 0.8
+        assert (
+            metrics.snapshot()["single_flight.get_todo_stats.coalescing_ratio"] == 0.8
+        )
+
+    @pytest.mark.asyncio
+    async def test_different_keys_are_not_coalesced(self):
+        """Testa que chaves diferentes executam separadamente"""
+        calls = []
+        single_flight = SingleFlight(["get_todo_by_id"], metrics=MetricsRegistry())
+        load = _counting_loader(calls)
+
+        await asyncio.gather(
+            single_flight.do("get_todo_by_id", 1, load),
+            single_flight.do("get_todo_by_id", 2, load),
+        )
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_method_is_not_coalesced(self):
+        """Testa que métodos não configurados executam sempre"""
+        metrics, calls = MetricsRegistry(), []
+        single_flight = SingleFlight(["get_todo_stats"], metrics=metrics)
+        load = _counting_loader(calls)
+
+        await asyncio.gather(
+            *(single_flight.do("get_todos", (), load) for _ in range(3))
+        )
+
+        assert len(calls) == 3
+        assert metrics.get("single_flight.get_todos.calls") == 0
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_and_not_cached(self):
+        """Testa que o erro do líder chega aos seguidores e não fica em cache"""
+        single_flight = SingleFlight(["get_todo_stats"], metrics=MetricsRegistry())
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("db down")
+
+        results = await asyncio.gather(
+            *(single_flight.do("get_todo_stats", None, failing) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await single_flight.do("get_todo_stats", None, _counting_loader([])) == (
+            "value"
+        )
+
+    @pytest.mark.asyncio
+    async def test_followers_retry_when_leader_is_cancelled(self):
+        """Testa que seguidores refazem a carga se o líder for cancelado"""
+        calls = []
+        single_flight = SingleFlight(["get_todo_stats"], metrics=MetricsRegistry())
+        load = _counting_loader(calls, delay=0.05)
+
+        leader = asyncio.ensure_future(single_flight.do("get_todo_stats", None, load))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight.do("get_todo_stats", None, load))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "value"
+        assert len(calls) == 2
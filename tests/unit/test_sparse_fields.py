@@ -0,0 +1,36 @@
+import pytest
+
+from src.api.schemas import TodoResponse
+from src.domain import Todo
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+class TestSparseFields:
+    """Testes para as respostas e snapshots com fields="""
+
+    @pytest.mark.asyncio
+    async def test_response_only_sets_requested_fields(self):
+        """Testa que só os campos pedidos entram na resposta serializada"""
+        repository = InMemoryTodoRepository(InMemoryTodoStore())
+        todo = await repository.create(title="Sparse", description="x" * 500)
+
+        response = TodoResponse.from_domain(todo, fields=("id", "status", "title"))
+
+        assert response.model_dump(exclude_unset=True) == {
+            "id": todo.id,
+            "status": "pending",
+            "title": "Sparse",
+        }
+
+    @pytest.mark.asyncio
+    async def test_sparse_snapshot_round_trip(self):
+        """Testa que um snapshot parcial do cache volta sem os campos ausentes"""
+        repository = InMemoryTodoRepository(InMemoryTodoStore())
+        todo = await repository.create(title="Cached", description="long text")
+
+        restored = Todo.from_dict(todo.to_dict(("id", "title", "priority")))
+
+        assert restored.id == todo.id
+        assert restored.title == "Cached"
+        assert restored.priority.value == "medium"
+        assert restored.description is None
@@ -0,0 +1,100 @@
+import asyncio
+import pytest
+
+from src.app import TodoCache, TodoService
+from src.infra.cache import LRUCache
+from src.infra.metrics import MetricsRegistry
+from src.infra.task_queue import TaskQueue
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+class TestTaskQueue:
+    """Testes para a fila de tarefas em background"""
+
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff_until_success(self):
+        """Testa que uma tarefa que falha é repetida até dar certo"""
+        metrics = MetricsRegistry()
+        queue = TaskQueue(workers=1, backoff_seconds=0.001, metrics=metrics)
+        attempts = []
+
+        async def flaky():
+            attempts.append(len(attempts))
+            if len(attempts) < 3:
+                raise RuntimeError("transient")
+
+        queue.start()
+        assert queue.enqueue("flaky", flaky)
+        await queue.close()
+
+        assert len(attempts) == 3
+        assert metrics.get("tasks.retried") == 2
+        assert metrics.get("tasks.completed") == 1
+        assert metrics.get("tasks.failed") == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """Testa que a tarefa é descartada após max_attempts falhas"""
+        metrics = MetricsRegistry()
+        queue = TaskQueue(max_attempts=2, backoff_seconds=0.001, metrics=metrics)
+
+        async def broken():
+            raise RuntimeError("permanent")
+
+        queue.start()
+        queue.enqueue("broken", broken)
+        await queue.close()
+
+        assert metrics.get("tasks.retried") == 1
+        assert metrics.get("tasks.failed") == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_without_blocking(self):
+        """Testa que, com a fila cheia, enqueue retorna False na hora"""
+        metrics = MetricsRegistry()
+        queue = TaskQueue(max_size=1, metrics=metrics)
+
+        async def noop():
+            pass
+
+        assert queue.enqueue("first", noop)
+        assert not queue.enqueue("second", noop)
+        assert metrics.get("tasks.dropped") == 1
+        assert metrics.snapshot()["tasks.queue_depth"] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_drains_pending_work(self):
+        """Testa que o shutdown executa o que já estava na fila e recusa o novo"""
+        queue = TaskQueue(workers=2, metrics=MetricsRegistry())
+        done = []
+
+        async def work(index):
+            await asyncio.sleep(0.001)
+            done.append(index)
+
+        for index in range(5):
+            queue.enqueue(f"work-{index}", lambda index=index: work(index))
+        queue.start()
+        await queue.close()
+
+        assert sorted(done) == list(range(5))
+        assert not queue.enqueue("late", lambda: work(5))
+
+    @pytest.mark.asyncio
+    async def test_service_warms_cache_after_update(self):
+        """Testa que só o snapshot mais recente é regravado no cache em background"""
+        metrics = MetricsRegistry()
+        queue = TaskQueue(metrics=metrics)
+        cache = TodoCache(LRUCache(metrics=metrics), ttl=60, metrics=metrics)
+        service = TodoService(
+            InMemoryTodoRepository(InMemoryTodoStore()), cache=cache, task_queue=queue
+        )
+        queue.start()
+        todo = await service.create_todo(title="Original")
+
+        await service.update_todo(todo.id, title="Updated")
+        await queue.close()
+
+        assert (await service.get_todo_by_id(todo.id)).title == "Updated"
+        assert metrics.get("cache.primed") == 1
+        assert metrics.get("cache.todo.hits") == 1
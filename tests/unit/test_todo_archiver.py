@@ -0,0 +1,42 @@
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+from src.app import TodoArchiver
+from src.infra.metrics import MetricsRegistry
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+class ArchivingRepository(InMemoryTodoRepository):
+    """Repositório em memória que registra as chamadas de archive_completed"""
+
+    def __init__(self, calls: list):
+        super().__init__(InMemoryTodoStore())
+        self.calls = calls
+
+    async def archive_completed(self, older_than: datetime, limit: int) -> int:
+        self.calls.append(older_than)
+        return limit if len(self.calls) == 1 else 0
+
+
+class TestTodoArchiver:
+    """Testes para o TodoArchiver"""
+
+    @pytest.mark.asyncio
+    async def test_archives_items_older_than_configured_days(self):
+        """Testa o corte por idade e o processamento em lotes"""
+        calls, metrics = [], MetricsRegistry()
+
+        @asynccontextmanager
+        async def scope():
+            yield ArchivingRepository(calls)
+
+        archiver = TodoArchiver(
+            scope, archive_after_days=7, batch_size=10, metrics=metrics
+        )
+
+        assert await archiver.run_once() == 10
+        assert len(calls) == 2
+        expected = datetime.now(timezone.utc) - timedelta(days=7)
+        assert abs(calls[0] - expected) < timedelta(seconds=5)
+        assert metrics.get("archive.rows") == 10
@@ -0,0 +1,33 @@
+import pytest
+from uuid import uuid4
+
+from src.app import TodoService
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+class TestTodoBatchGet:
+    """Testes para a busca de vários TODOs por ID"""
+
+    @pytest.mark.asyncio
+    async def test_preserves_order_and_reports_missing(self):
+        """Testa a ordem pedida, IDs repetidos e a lista de ausentes"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+        first = await service.create_todo(title="First")
+        second = await service.create_todo(title="Second")
+        missing = uuid4()
+
+        todos, not_found = await service.get_todos_by_ids(
+            [second.id, missing, first.id, second.id]
+        )
+
+        assert [todo.id for todo in todos] == [second.id, first.id]
+        assert not_found == [missing]
+
+    @pytest.mark.asyncio
+    async def test_deleted_todos_are_missing(self):
+        """Testa que TODOs removidos aparecem como ausentes"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+        todo = await service.create_todo(title="Gone")
+        await service.delete_todo(todo.id)
+
+        assert await service.get_todos_by_ids([todo.id]) == ([], [todo.id])
@@ -0,0 +1,72 @@
+import pytest
+
+from src.app import TodoService
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+from src.resources.todo_resource import _parse_board_cursors
+
+
+class TestTodoBoard:
+    """Testes para o quadro de TODOs por status"""
+
+    @pytest.mark.asyncio
+    async def test_columns_page_independently(self):
+        """Testa que cada coluna tem o seu cursor e avança sozinha"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+        pending = [await service.create_todo(title=f"Pending {i}") for i in range(3)]
+        done = await service.create_todo(title="Done")
+        await service.update_todo(done.id, status="completed")
+
+        columns = await service.get_todo_board(limit=2, with_counts=True)
+
+        board = {column["status"]: column for column in columns}
+        assert [column["status"] for column in columns] == [
+            "pending",
+            "in_progress",
+            "completed",
+        ]
+        assert board["pending"]["todos"] == [pending[2], pending[1]]
+        assert board["pending"]["total"] == 3
+        assert board["in_progress"]["todos"] == []
+        assert board["in_progress"]["next_cursor"] is None
+        assert board["completed"]["todos"] == [done]
+
+        columns = await service.get_todo_board(
+            statuses=["pending"],
+            limit=2,
+            cursors={"pending": board["pending"]["next_cursor"]},
+        )
+
+        assert len(columns) == 1
+        assert columns[0]["todos"] == [pending[0]]
+        assert "total" not in columns[0]
+
+    @pytest.mark.asyncio
+    async def test_cursor_for_missing_column(self):
+        """Testa que um cursor de coluna fora do quadro é recusado"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+
+        with pytest.raises(ValueError):
+            await service.get_todo_board(
+                statuses=["pending"], cursors={"completed": "x"}
+            )
+
+    @pytest.mark.asyncio
+    async def test_unknown_status_column(self):
+        """Testa que um status desconhecido é recusado, como no repositório SQL"""
+        repository = InMemoryTodoRepository(InMemoryTodoStore())
+
+        with pytest.raises(ValueError):
+            await repository.get_board(["unknown"], limit=2)
+
+    def test_parse_board_cursors(self):
+        """Testa o formato status:token e a recusa de cursores inválidos"""
+        assert _parse_board_cursors(["pending:abc", "completed:def"]) == {
+            "pending": "abc",
+            "completed": "def",
+        }
+        assert _parse_board_cursors(None) == {}
+
+        with pytest.raises(ValueError):
+            _parse_board_cursors(["abc"])
+        with pytest.raises(ValueError):
+            _parse_board_cursors(["pending:a", "pending:b"])
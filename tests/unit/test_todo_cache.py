@@ -0,0 +1,184 @@
+import asyncio
+import pytest
+
+from src.app import TodoCache, TodoService
+from src.infra.cache import CacheError, LRUCache, RedisCache
+from src.infra.metrics import MetricsRegistry
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+from tests.mock import FakeRedisServer
+
+
+class CountingRepository(InMemoryTodoRepository):
+    """Repositório em memória que conta leituras"""
+
+    def __init__(self, store: InMemoryTodoStore):
+        super().__init__(store)
+        self.reads = 0
+
+    async def get_by_id(self, todo_id):
+        self.reads += 1
+        return await super().get_by_id(todo_id)
+
+    async def get_all(self, *args, **kwargs):
+        self.reads += 1
+        return await super().get_all(*args, **kwargs)
+
+
+def _make_service(metrics: MetricsRegistry):
+    """Cria um TodoService com cache LRU sobre o repositório em memória"""
+    repository = CountingRepository(InMemoryTodoStore())
+    cache = TodoCache(LRUCache(metrics=metrics), ttl=60, metrics=metrics)
+    return TodoService(repository, cache=cache), repository
+
+
+class TestLRUCache:
+    """Testes para o LRUCache"""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Testa remoção da entrada menos usada ao exceder o limite"""
+        metrics = MetricsRegistry()
+        cache = LRUCache(max_entries=2, metrics=metrics)
+
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        await cache.get("a")
+        await cache.set("c", "3")
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == "1"
+        assert metrics.get("cache.evictions") == 1
+
+    @pytest.mark.asyncio
+    async def test_expires_entries_after_ttl(self):
+        """Testa expiração por TTL"""
+        metrics = MetricsRegistry()
+        cache = LRUCache(metrics=metrics)
+
+        await cache.set("a", "1", ttl=0.01)
+        await asyncio.sleep(0.02)
+
+        assert await cache.get("a") is None
+        assert metrics.get("cache.expirations") == 1
+
+    @pytest.mark.asyncio
+    async def test_add_keeps_reservation_until_ttl(self):
+        """Testa que add não sobrescreve e que o limite não descarta a reserva"""
+        cache = LRUCache(max_entries=2)
+
+        assert await cache.add("claim", "first", ttl=60) is True
+        assert await cache.add("claim", "second", ttl=60) is False
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+
+        assert await cache.get("claim") == "first"
+        assert await cache.get("a") is None
+        assert await cache.get("b") == "2"
+
+
+class TestRedisCache:
+    """Testes para o RedisCache contra um servidor local"""
+
+    @pytest.mark.asyncio
+    async def test_get_set_delete(self):
+        """Testa GET/SET/DEL pelo protocolo Redis"""
+        server = await FakeRedisServer().start()
+        cache = RedisCache(server.url)
+
+        await cache.set("key", "value", ttl=60)
+        assert await cache.get("key") == "value"
+        await cache.delete("key")
+        assert await cache.get("key") is None
+
+        await cache.close()
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_add_is_set_if_absent(self):
+        """Testa que add usa SET NX: só a primeira gravação vence"""
+        server = await FakeRedisServer().start()
+        cache = RedisCache(server.url)
+
+        assert await cache.add("key", "first", ttl=60) is True
+        assert await cache.add("key", "second", ttl=60) is False
+        assert await cache.get("key") == "first"
+
+        await cache.close()
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_command_does_not_leak_its_reply(self):
+        """Testa que cancelar antes da resposta não a entrega ao próximo comando"""
+        server = await FakeRedisServer().start()
+        cache = RedisCache(server.url)
+        await cache.set("a", "value-of-a")
+        await cache.set("b", "value-of-b")
+
+        server.reply_delay = 0.05
+        pending = asyncio.create_task(cache.get("a"))
+        await asyncio.sleep(0.01)
+        pending.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+        server.reply_delay = 0.0
+
+        assert await cache.get("b") == "value-of-b"
+
+        await cache.close()
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_unavailable_server_raises_cache_error(self):
+        """Testa que falha de conexão vira CacheError"""
+        cache = RedisCache("redis://127.0.0.1:1/0")
+
+        with pytest.raises(CacheError):
+            await cache.get("key")
+
+
+class TestTodoCache:
+    """Testes para o cache-aside do TodoService"""
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_is_served_from_cache(self):
+        """Testa que a segunda leitura não acessa o repositório"""
+        metrics = MetricsRegistry()
+        service, repository = _make_service(metrics)
+        todo = await service.create_todo(title="Cached")
+
+        first = await service.get_todo_by_id(todo.id)
+        second = await service.get_todo_by_id(todo.id)
+
+        assert repository.reads == 1
+        assert second.title == first.title == "Cached"
+        assert second.status.value == "pending"
+        assert metrics.get("cache.todo.hits") == 1
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_todo_and_pages(self):
+        """Testa invalidação do TODO, das páginas e das estatísticas"""
+        service, repository = _make_service(MetricsRegistry())
+        todo = await service.create_todo(title="Original")
+        await service.get_todo_by_id(todo.id)
+        await service.get_todos()
+        await service.get_todo_stats()
+
+        await service.update_todo(todo.id, title="Updated", status="completed")
+
+        assert (await service.get_todo_by_id(todo.id)).title == "Updated"
+        assert [t.title for t in await service.get_todos()] == ["Updated"]
+        assert (await service.get_todo_stats())["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_create_and_delete_invalidate_pages(self):
+        """Testa que criação e remoção trocam a versão das páginas"""
+        service, repository = _make_service(MetricsRegistry())
+        first = await service.create_todo(title="First")
+        assert len(await service.get_todos()) == 1
+
+        await service.create_todo(title="Second")
+        assert len(await service.get_todos()) == 2
+
+        await service.delete_todo(first.id)
+        assert [t.title for t in await service.get_todos()] == ["Second"]
+        assert await service.get_todo_by_id(first.id) is None
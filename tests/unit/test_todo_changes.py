@@ -0,0 +1,97 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from src.app import TodoService
+from src.app.sync_token import encode_sync_token
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+def _make_service(sync_safety_lag_ms: int = 0) -> TodoService:
+    """Cria um TodoService sobre um repositório em memória"""
+    repository = InMemoryTodoRepository(InMemoryTodoStore())
+    return TodoService(repository, sync_safety_lag_ms=sync_safety_lag_ms)
+
+
+class TestTodoChanges:
+    """Testes para o delta sync de TODOs"""
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_returns_updates_and_deletes(self):
+        """Testa que o token devolve só o que mudou depois dele, incluindo remoções"""
+        service = _make_service()
+        first = await service.create_todo(title="First")
+        second = await service.create_todo(title="Second")
+
+        initial = await service.get_changes()
+        assert {todo.id for todo in initial["todos"]} == {first.id, second.id}
+        assert initial["deleted"] == []
+        assert initial["has_more"] is False
+
+        await service.update_todo(first.id, title="First updated")
+        await service.delete_todo(second.id)
+        delta = await service.get_changes(since=initial["next_token"])
+
+        assert [todo.title for todo in delta["todos"]] == ["First updated"]
+        assert [tombstone.id for tombstone in delta["deleted"]] == [second.id]
+
+        empty = await service.get_changes(since=delta["next_token"])
+        assert empty["todos"] == [] and empty["deleted"] == []
+        assert empty["next_token"] == delta["next_token"]
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_every_change_once(self):
+        """Testa que paginar com next_token percorre todas as mudanças sem repetir"""
+        service = _make_service()
+        created = [await service.create_todo(title=f"Todo {i}") for i in range(7)]
+
+        seen, token, has_more = [], None, True
+        while has_more:
+            page = await service.get_changes(since=token, limit=3)
+            seen.extend(todo.id for todo in page["todos"])
+            token, has_more = page["next_token"], page["has_more"]
+
+        assert sorted(seen) == sorted(todo.id for todo in created)
+
+    @pytest.mark.asyncio
+    async def test_safety_lag_hides_recent_changes(self):
+        """Testa que mudanças mais novas que o atraso de segurança ficam de fora"""
+        service = _make_service(sync_safety_lag_ms=60_000)
+        await service.create_todo(title="Too recent")
+
+        changes = await service.get_changes()
+
+        assert changes["todos"] == []
+        assert changes["next_token"] is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_raises_value_error(self):
+        """Testa que um token inválido gera ValueError"""
+        with pytest.raises(ValueError):
+            await _make_service().get_changes(since="not-a-token")
+
+    @pytest.mark.asyncio
+    async def test_token_older_than_tombstone_retention_is_rejected(self):
+        """Testa que um token anterior à retenção dos tombstones exige sync completo"""
+        service = _make_service()
+        stale = datetime.now(timezone.utc) - timedelta(days=31)
+        recent = datetime.now(timezone.utc) - timedelta(days=29)
+
+        with pytest.raises(ValueError, match="expired"):
+            await service.get_changes(since=encode_sync_token((stale, uuid4())))
+        changes = await service.get_changes(since=encode_sync_token((recent, uuid4())))
+
+        assert changes["todos"] == [] and changes["deleted"] == []
+
+    @pytest.mark.asyncio
+    async def test_naive_token_is_read_as_utc(self):
+        """Testa timestamps com fuso e tokens antigos (sem fuso) lidos como UTC"""
+        service = _make_service()
+        todo = await service.create_todo(title="Todo")
+        assert todo.created_at.tzinfo is not None
+        assert todo.updated_at.tzinfo is not None
+
+        naive = (todo.updated_at.replace(tzinfo=None), todo.id)
+        delta = await service.get_changes(since=encode_sync_token(naive))
+
+        assert delta["todos"] == []
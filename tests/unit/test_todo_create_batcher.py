@@ -0,0 +1,89 @@
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+
+from src.app import TodoCreateBatcher
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+class RecordingRepository(InMemoryTodoRepository):
+    """Repositório em memória que registra as chamadas de create_many"""
+
+    def __init__(self, store: InMemoryTodoStore, calls: list):
+        super().__init__(store)
+        self.calls = calls
+
+    async def create_many(self, items):
+        self.calls.append(len(items))
+        return await super().create_many(items)
+
+
+def _make_batcher(store: InMemoryTodoStore, calls: list, **kwargs):
+    """Cria um batcher que abre um RecordingRepository por flush"""
+
+    @asynccontextmanager
+    async def scope():
+        yield RecordingRepository(store, calls)
+
+    return TodoCreateBatcher(scope, **kwargs)
+
+
+class TestTodoCreateBatcher:
+    """Testes para o TodoCreateBatcher"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_creates_share_one_flush(self):
+        """Testa que criações concorrentes viram um único lote"""
+        store, calls = InMemoryTodoStore(), []
+        batcher = _make_batcher(store, calls, max_batch_size=50, max_delay_ms=5)
+
+        todos = await asyncio.gather(
+            *(batcher.submit({"title": f"Todo {i}"}) for i in range(10))
+        )
+
+        assert calls == [10]
+        assert [todo.title for todo in todos] == [f"Todo {i}" for i in range(10)]
+        assert len(store.todos) == 10
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_is_full(self):
+        """Testa flush imediato ao atingir max_batch_size"""
+        store, calls = InMemoryTodoStore(), []
+        batcher = _make_batcher(store, calls, max_batch_size=4, max_delay_ms=1000)
+
+        await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit({"title": f"T{i}"}) for i in range(8))),
+            timeout=1,
+        )
+
+        assert calls == [4, 4]
+
+    @pytest.mark.asyncio
+    async def test_invalid_item_does_not_fail_the_batch(self):
+        """Testa isolamento de erro: só o item inválido falha"""
+        store, calls = InMemoryTodoStore(), []
+        batcher = _make_batcher(store, calls, max_batch_size=50, max_delay_ms=5)
+
+        results = await asyncio.gather(
+            batcher.submit({"title": "Ok 1"}),
+            batcher.submit({"title": "Bad", "priority": "urgent"}),
+            batcher.submit({"title": "Ok 2"}),
+            return_exceptions=True,
+        )
+
+        assert results[0].title == "Ok 1"
+        assert isinstance(results[1], ValueError)
+        assert results[2].title == "Ok 2"
+        assert len(store.todos) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_items(self):
+        """Testa que close() grava o lote pendente"""
+        store, calls = InMemoryTodoStore(), []
+        batcher = _make_batcher(store, calls, max_batch_size=50, max_delay_ms=1000)
+
+        pending = asyncio.ensure_future(batcher.submit({"title": "Pending"}))
+        await asyncio.sleep(0)
+        await batcher.close()
+
+        assert (await pending).title == "Pending"
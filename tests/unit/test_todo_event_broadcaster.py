@@ -0,0 +1,96 @@
+import pytest
+
+from src.app import TodoEventBroadcaster, TodoService
+from src.constants import TodoPriorityEnum
+from src.infra.change_bus import ChangeBus, RESET_EVENT
+from src.infra.metrics import MetricsRegistry
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+from src.resources import TodoResource
+
+
+def _make_broadcaster(max_queue_size: int = 10):
+    """Cria um broadcaster ligado a um ChangeBus isolado"""
+    bus = ChangeBus()
+    broadcaster = TodoEventBroadcaster(
+        bus, max_queue_size=max_queue_size, metrics=MetricsRegistry()
+    )
+    return bus, broadcaster
+
+
+class TestTodoEventBroadcaster:
+    """Testes para o TodoEventBroadcaster"""
+
+    @pytest.mark.asyncio
+    async def test_fans_out_with_filters(self):
+        """Testa entrega a vários assinantes respeitando os filtros"""
+        bus, broadcaster = _make_broadcaster()
+        everything = broadcaster.subscribe()
+        high_only = broadcaster.subscribe(priority="high")
+
+        await bus.publish({"op": "create", "id": "1", "priority": "low"})
+        await bus.publish({"op": "create", "id": "2", "priority": "high"})
+
+        assert everything.queue.qsize() == 2
+        assert (await high_only.next_event(0.1))["id"] == "2"
+        assert await high_only.next_event(0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_filter_sees_todo_leaving_its_view(self):
+        """Testa que quem filtra status=pending recebe a mudança para completed"""
+        bus, broadcaster = _make_broadcaster()
+        pending = broadcaster.subscribe(status="pending")
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore(), bus))
+
+        todo = await service.create_todo(title="Moving")
+        await service.update_todo(todo.id, status="completed")
+        await bus.publish(
+            {"op": "update", "id": "2", "status": "completed", "priority": "low"}
+        )
+
+        created = await pending.next_event(0.1)
+        moved = await pending.next_event(0.1)
+        assert created["op"] == "create"
+        assert moved["op"] == "update"
+        assert moved["status"] == "completed"
+        assert moved["previous_status"] == "pending"
+        assert await pending.next_event(0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_gets_resync_instead_of_blocking(self):
+        """Testa que a fila cheia é trocada por um único evento resync"""
+        bus, broadcaster = _make_broadcaster(max_queue_size=2)
+        slow = broadcaster.subscribe()
+
+        for index in range(5):
+            await bus.publish({"op": "update", "id": str(index)})
+
+        assert (await slow.next_event(0.1))["op"] == "resync"
+        assert broadcaster.metrics.get("event_stream.overflows") >= 1
+
+    @pytest.mark.asyncio
+    async def test_listener_reset_becomes_resync(self):
+        """Testa que a reconexão do listener pede resync aos clientes"""
+        bus, broadcaster = _make_broadcaster()
+        subscription = broadcaster.subscribe(status="pending")
+
+        await bus.publish(RESET_EVENT)
+
+        assert (await subscription.next_event(0.1))["op"] == "resync"
+
+    @pytest.mark.asyncio
+    async def test_resource_streams_sse_and_unsubscribes(self):
+        """Testa o formato SSE e a remoção da assinatura ao fechar o stream"""
+        bus, broadcaster = _make_broadcaster()
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore(), bus))
+        resource = TodoResource(service, event_broadcaster=broadcaster)
+
+        stream = resource.stream_events(None, TodoPriorityEnum.HIGH)
+        assert await stream.__anext__() == ": connected\n\n"
+
+        todo = await service.create_todo(title="Streamed", priority="high")
+        message = await stream.__anext__()
+        await stream.aclose()
+
+        assert message.startswith("event: create\ndata: ")
+        assert str(todo.id) in message
+        assert len(broadcaster._subscriptions) == 0
@@ -0,0 +1,60 @@
+import pytest
+
+from src.app import TodoService
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+class TestTodoHistory:
+    """Testes para o histórico de mudanças dos TODOs"""
+
+    @pytest.mark.asyncio
+    async def test_records_before_and_after(self):
+        """Testa create, update (antes/depois) e delete, do mais recente"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+        todo = await service.create_todo(title="Original")
+        await service.update_todo(todo.id, title="Renamed", status="completed")
+        await service.delete_todo(todo.id)
+
+        entries, next_cursor = await service.get_todo_history(todo.id)
+
+        assert [entry.operation for entry in entries] == ["delete", "update", "create"]
+        deleted, updated, created = entries
+        assert created.before is None
+        assert created.after["title"] == "Original"
+        assert updated.before["title"] == "Original"
+        assert updated.before["status"] == "pending"
+        assert updated.after["title"] == "Renamed"
+        assert updated.after["status"] == "completed"
+        assert deleted.before["title"] == "Renamed"
+        assert deleted.after is None
+        assert updated.after["id"] == str(todo.id)
+        assert next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_keyset_paging(self):
+        """Testa que o cursor continua de onde a página anterior parou"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+        todo = await service.create_todo(title="Title 0")
+        other = await service.create_todo(title="Other")
+        for index in range(1, 5):
+            await service.update_todo(todo.id, title=f"Title {index}")
+        await service.update_todo(other.id, title="Other renamed")
+
+        first, cursor = await service.get_todo_history(todo.id, limit=3)
+        second, last_cursor = await service.get_todo_history(
+            todo.id, limit=3, cursor=cursor
+        )
+
+        titles = [entry.after["title"] for entry in first + second]
+        assert titles == [f"Title {index}" for index in range(4, -1, -1)]
+        assert cursor == first[-1].id
+        assert last_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_limit(self):
+        """Testa que limit precisa ser positivo"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+        todo = await service.create_todo(title="Todo")
+
+        with pytest.raises(ValueError):
+            await service.get_todo_history(todo.id, limit=0)
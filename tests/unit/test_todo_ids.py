@@ -0,0 +1,37 @@
+import time
+
+import pytest
+
+from src.app import TodoService
+from src.domain import uuid7
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+class TestTodoIds:
+    """Testes para os IDs UUIDv7 ordenados pelo tempo"""
+
+    def test_uuid7_layout(self):
+        """Testa versão, variante e o timestamp em milissegundos no início"""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+        assert abs((value.int >> 80) - time.time() * 1000) < 5000
+
+    def test_uuid7_is_strictly_increasing(self):
+        """Testa que IDs gerados em sequência nunca voltam, mesmo no mesmo ms"""
+        ids = [uuid7() for _ in range(10000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    @pytest.mark.asyncio
+    async def test_new_todos_get_uuid7(self):
+        """Testa que os TODOs novos recebem uuid7, em ordem de criação"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+        first = await service.create_todo(title="First")
+        second = await service.create_todo(title="Second")
+
+        assert first.id.version == second.id.version == 7
+        assert first.id < second.id
+        assert (await service.get_todo_by_id(first.id)).title == "First"
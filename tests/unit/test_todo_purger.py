@@ -0,0 +1,81 @@
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from src.app import TodoPurger
+from src.infra.metrics import MetricsRegistry
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+class SoftDeletedRepository(InMemoryTodoRepository):
+    """Repositório em memória com um estoque simulado de linhas soft-deleted"""
+
+    def __init__(self, pending: list, commits: list):
+        super().__init__(InMemoryTodoStore())
+        self.pending = pending
+        self.commits = commits
+        self.purged = 0
+
+    async def purge_deleted(self, limit: int) -> int:
+        self.purged = min(limit, self.pending[0])
+        self.pending[0] -= self.purged
+        return self.purged
+
+    async def commit(self) -> None:
+        self.commits.append(self.purged)
+
+
+def _make_purger(pending: int, commits: list, **kwargs) -> TodoPurger:
+    """Cria um purger que abre um SoftDeletedRepository por lote"""
+    state = [pending]
+
+    @asynccontextmanager
+    async def scope():
+        yield SoftDeletedRepository(state, commits)
+
+    return TodoPurger(scope, **kwargs)
+
+
+class TestTodoPurger:
+    """Testes para o TodoPurger"""
+
+    @pytest.mark.asyncio
+    async def test_purges_in_chunks_with_one_commit_each(self):
+        """Testa que o expurgo é dividido em lotes, cada um em sua transação"""
+        commits, metrics = [], MetricsRegistry()
+        purger = _make_purger(12, commits, batch_size=5, metrics=metrics)
+
+        assert await purger.run_once() == 12
+        assert commits == [5, 5, 2]
+        assert metrics.get("purge.rows") == 12
+
+    @pytest.mark.asyncio
+    async def test_stops_after_empty_chunk(self):
+        """Testa que um lote cheio é seguido de outro até vir um lote vazio"""
+        commits = []
+        purger = _make_purger(10, commits, batch_size=5, metrics=MetricsRegistry())
+
+        assert await purger.run_once() == 10
+        assert commits == [5, 5, 0]
+
+    @pytest.mark.asyncio
+    async def test_prunes_tombstones_older_than_retention(self):
+        """Testa que os tombstones fora da retenção saem em lotes e os recentes ficam"""
+        store, metrics = InMemoryTodoStore(), MetricsRegistry()
+        now = datetime.now(timezone.utc)
+        for days in (40, 35, 32, 31, 31, 2):
+            store.add_tombstone(uuid4(), now - timedelta(days=days))
+
+        @asynccontextmanager
+        async def scope():
+            yield InMemoryTodoRepository(store)
+
+        purger = TodoPurger(
+            scope, tombstone_retention_days=30, batch_size=2, metrics=metrics
+        )
+
+        assert await purger.run_once() == 5
+        assert [key[0] for key in store.by_deleted_at] == [now - timedelta(days=2)]
+        assert len(store.tombstones) == 1
+        assert metrics.get("purge.tombstones") == 5
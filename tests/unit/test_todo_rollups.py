@@ -0,0 +1,54 @@
+import pytest
+from datetime import datetime, timedelta
+
+from src.app import TodoService
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+class TestTodoRollups:
+    """Testes para as estatísticas detalhadas (rollups)"""
+
+    @pytest.mark.asyncio
+    async def test_breakdown_overdue_and_daily(self):
+        """Testa a contagem por status/prioridade, atrasados e completados no dia"""
+        store = InMemoryTodoStore()
+        service = TodoService(InMemoryTodoRepository(store))
+        done = await service.create_todo(title="Done", priority="high")
+        late = await service.create_todo(title="Late")
+        store.todos[late.id].due_date = datetime.utcnow() - timedelta(days=1)
+        await service.update_todo(done.id, status="completed")
+
+        rollup = await service.get_todo_rollup(days=7)
+
+        assert rollup["total"] == 2
+        assert rollup["overdue"] == 1
+        assert {
+            (row["status"], row["priority"]): row["total"]
+            for row in rollup["breakdown"]
+        } == {("completed", "high"): 1, ("pending", "medium"): 1}
+        assert len(rollup["daily"]) == 7
+        today = rollup["daily"][-1]
+        assert today["day"] == datetime.utcnow().date()
+        assert (today["created"], today["completed"]) == (2, 1)
+        assert rollup["refreshed_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_completed_at_cleared_when_reopened(self):
+        """Testa que reabrir um TODO remove o completed_at"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+        todo = await service.create_todo(title="Reopen")
+
+        completed = await service.update_todo(todo.id, status="completed")
+        assert completed.completed_at is not None
+
+        reopened = await service.update_todo(todo.id, status="pending")
+        assert reopened.completed_at is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("days", [0, 91])
+    async def test_days_out_of_range(self, days):
+        """Testa a validação da janela de dias"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+
+        with pytest.raises(ValueError):
+            await service.get_todo_rollup(days=days)
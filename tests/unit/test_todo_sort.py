@@ -0,0 +1,64 @@
+import pytest
+from datetime import datetime, timedelta
+
+from src.app import TodoService
+from src.app.page_cursor import decode_page_cursor, encode_page_cursor
+from src.repos import InMemoryTodoRepository, InMemoryTodoStore
+
+
+async def _all_pages(service: TodoService, sort: str, limit: int = 2) -> list:
+    """Percorre a listagem com next_cursor e devolve os títulos na ordem"""
+    titles, cursor = [], None
+    while True:
+        todos = await service.get_todos(limit=limit, sort=sort, cursor=cursor)
+        titles.extend(todo.title for todo in todos)
+        cursor = service.next_page_cursor(todos, limit, sort)
+        if cursor is None:
+            return titles
+
+
+class TestTodoSort:
+    """Testes para a ordenação com paginação por cursor"""
+
+    @pytest.mark.asyncio
+    async def test_urgent_first_pages_by_priority_then_newest(self):
+        """Testa -priority: alta primeiro e, no empate, os mais novos"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+        for title, priority in [("a", "low"), ("b", "high"), ("c", "medium")]:
+            await service.create_todo(title=title, priority=priority)
+        await service.create_todo(title="d", priority="high")
+
+        assert await _all_pages(service, "-priority") == ["d", "b", "c", "a"]
+
+    @pytest.mark.asyncio
+    async def test_due_date_puts_todos_without_due_date_last(self):
+        """Testa due_date crescente com os sem prazo no fim, atravessando páginas"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+        now = datetime.utcnow()
+        await service.create_todo(title="none")
+        await service.create_todo(title="later", due_date=now + timedelta(days=2))
+        await service.create_todo(title="soon", due_date=now + timedelta(days=1))
+
+        assert await _all_pages(service, "due_date", limit=1) == [
+            "soon",
+            "later",
+            "none",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_priority_update_moves_todo(self):
+        """Testa que mudar a prioridade atualiza o rank armazenado"""
+        service = TodoService(InMemoryTodoRepository(InMemoryTodoStore()))
+        todo = await service.create_todo(title="a", priority="low")
+        await service.create_todo(title="b", priority="medium")
+        await service.update_todo(todo.id, priority="high")
+
+        assert todo.priority_rank == 3
+        assert await _all_pages(service, "-priority") == ["a", "b"]
+
+    def test_cursor_is_bound_to_its_sort(self):
+        """Testa que um cursor não vale para outra ordenação"""
+        token = encode_page_cursor("due_date", (None, "not-used"))
+
+        with pytest.raises(ValueError):
+            decode_page_cursor(token, "priority")
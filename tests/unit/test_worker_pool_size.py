@@ -0,0 +1,18 @@
+import pytest
+
+from src.infra.settings import worker_pool_size
+
+
+class TestWorkerPoolSize:
+    """Testes para a divisão do orçamento de conexões entre workers"""
+
+    def test_budget_is_split_between_workers(self):
+        """Testa a fatia por worker, descontando as conexões reservadas"""
+        assert worker_pool_size(100, 4) == 25
+        assert worker_pool_size(100, 4, reserved=1) == 24
+        assert worker_pool_size(10, 3) == 3
+
+    def test_budget_smaller_than_workers_raises(self):
+        """Testa que um orçamento insuficiente gera ValueError"""
+        with pytest.raises(ValueError):
+            worker_pool_size(4, 8)